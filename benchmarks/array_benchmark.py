@@ -0,0 +1,91 @@
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import cast, Dict, List
+
+from cantte.buildtins import BUILTINS
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Array, Builtin, Environment, new_array, new_integer, Object
+from cantte.parser import Parser
+
+BUILD: str = '''
+let build = func(n, items) {
+    if (n == 0) {
+        return items;
+    }
+    return build(n - 1, push(items, n));
+};
+'''
+
+SUM: str = '''
+let sum = func(items, total) {
+    if (size(items) == 0) {
+        return total;
+    }
+    return sum({rest}(items), total + first(items));
+};
+'''
+
+CONS: str = '''
+let cons = func(head, tail) { func(pick) { if (pick) { head } else { tail } } };
+let build_list = func(n, list) {
+    if (n == 0) {
+        return list;
+    }
+    return build_list(n - 1, cons(n, list));
+};
+let sum_list = func(list, total) {
+    if (list == 0) {
+        return total;
+    }
+    return sum_list(list(false), total + list(true));
+};
+'''
+
+WORKLOADS: Dict[str, str] = {
+    'array, rest view': BUILD + SUM.replace('{rest}', 'rest') + 'sum(build({n}, []), 0);',
+    'array, rest copy': BUILD + SUM.replace('{rest}', 'rest_copy') + 'sum(build({n}, []), 0);',
+    'closure cons list': CONS + 'sum_list(build_list({n}, 0), 0);',
+}
+
+
+def _rest_copy(*args: Object) -> Object:
+    return new_array(cast(Array, args[0]).values()[1:])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Recursive list processing and array memory')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 4000, 8000], help='list lengths')
+    parser.add_argument('--elements', type=int, default=1_000_000, help='elements for the memory comparison')
+    args = parser.parse_args()
+
+    BUILTINS['rest_copy'] = Builtin(function=_rest_copy)
+
+    for name, template in WORKLOADS.items():
+        for n in args.sizes:
+            program = Parser(Lexer(template.replace('{n}', str(n)))).parse_program()
+
+            start = perf_counter()
+            evaluated = evaluate(program, Environment())
+            elapsed = perf_counter() - start
+
+            assert evaluated is not None
+            print(f'{name:>18} n={n:<6}: {elapsed:.3f}s (sum {evaluated.inspect()})')
+
+    for label, build in [('array(\'q\')', new_array), ('object list', Array)]:
+        tracemalloc.start()
+        integers: List[Object] = [new_integer(value) for value in range(1000, 1000 + args.elements)]
+        array = build(integers)
+        del integers
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f'{label:>18}: {len(array)} elements, retained {retained / (1024 * 1024):.1f} MB')
+        del array
+
+    del BUILTINS['rest_copy']
+
+
+if __name__ == '__main__':
+    main()
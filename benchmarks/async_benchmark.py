@@ -0,0 +1,73 @@
+import argparse
+import asyncio
+from time import perf_counter
+from typing import List, Optional
+
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+from cantte.trampoline import evaluate_async, evaluate_trampolined
+
+HEAVY: str = '''
+let fibonacci = func(n) {
+    if (n < 2) {
+        return n;
+    }
+    return fibonacci(n - 1) + fibonacci(n - 2);
+};
+fibonacci(20);
+'''
+
+LIGHT: str = 'let a = [1, 2, 3]; size(a) * 2;'
+
+
+async def serve(yield_every: Optional[int], requests: int, interval: float) -> List[float]:
+    heavy = Parser(Lexer(HEAVY)).parse_program()
+    light = Parser(Lexer(LIGHT)).parse_program()
+    latencies: List[float] = []
+
+    async def heavy_script() -> None:
+        await asyncio.sleep(0)
+
+        if yield_every is None:
+            evaluate_trampolined(heavy, Environment())
+        else:
+            await evaluate_async(heavy, Environment(), yield_every)
+
+    async def light_request(arrival: float) -> None:
+        await evaluate_async(light, Environment())
+        latencies.append(perf_counter() - arrival)
+
+    heavy_task = asyncio.create_task(heavy_script())
+    light_tasks = []
+    start = perf_counter()
+
+    for index in range(requests):
+        arrival = start + index * interval
+        await asyncio.sleep(max(0.0, arrival - perf_counter()))
+        light_tasks.append(asyncio.create_task(light_request(arrival)))
+
+    await asyncio.gather(heavy_task, *light_tasks)
+
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Latency of light requests next to a heavy script on one event loop')
+    parser.add_argument('--requests', type=int, default=200, help='light requests')
+    parser.add_argument('--interval', type=float, default=0.005, help='seconds between light requests')
+    args = parser.parse_args()
+
+    for label, yield_every in [('blocking', None), ('every 10000', 10000), ('every 1000', 1000), ('every 100', 100)]:
+        start = perf_counter()
+        latencies = sorted(asyncio.run(serve(yield_every, args.requests, args.interval)))
+        elapsed = perf_counter() - start
+
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(f'{label:>12}: p50 {p50:8.2f}ms, p99 {p99:8.2f}ms, max {latencies[-1] * 1000:8.2f}ms, '
+              f'total {elapsed:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import os
+from time import perf_counter
+from typing import List
+
+from cantte.batch import _evaluate, BatchRunner
+from cantte.repl import ENGINES
+
+SCRIPT: str = '''
+let fibonacci = func(n) {
+    if (n < 2) {
+        return n;
+    }
+    return fibonacci(n - 1) + fibonacci(n - 2);
+};
+fibonacci({n});
+'''
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Independent scripts in process versus across a process pool')
+    parser.add_argument('--scripts', type=int, default=2000, help='number of scripts')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='pool sizes')
+    args = parser.parse_args()
+
+    sources: List[str] = [SCRIPT.replace('{n}', str(8 + index % 6)) for index in range(args.scripts)]
+
+    print(f'{os.cpu_count()} CPUs, {args.scripts} scripts')
+
+    start = perf_counter()
+    expected = [_evaluate(ENGINES['evaluator'], source, False) for source in sources]
+    print(f'{"in process":>24}: {perf_counter() - start:.3f}s')
+
+    for workers in args.workers:
+        with BatchRunner(workers) as runner:
+            list(runner.run_many(['1'] * workers, chunk_size=1))
+
+            for label, chunk_size in [('chunked', None), ('one per task', 1)]:
+                start = perf_counter()
+                results = list(runner.run_many(sources, chunk_size=chunk_size))
+                elapsed = perf_counter() - start
+
+                assert [result.inspect for result in results] == [value.inspect() for value in expected if value]
+                print(f'{f"{workers} workers, {label}":>24}: {elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
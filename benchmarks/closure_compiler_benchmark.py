@@ -0,0 +1,69 @@
+import argparse
+from time import perf_counter
+from typing import Callable, Dict, Optional
+
+from cantte.ast import Program
+from cantte.closure_compiler import compile_program
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment, Object
+from cantte.parser import Parser
+
+WORKLOADS: Dict[str, str] = {
+    'fibonacci': '''
+        let fibonacci = func(n) {
+            if (n < 2) {
+                return n;
+            }
+            return fibonacci(n - 1) + fibonacci(n - 2);
+        };
+        fibonacci({n});
+    ''',
+    'string building': '''
+        let build = func(acc, n) {
+            if (n == 0) {
+                return acc;
+            }
+            return build(acc + "item " + "; ", n - 1);
+        };
+        let repeat = func(times) {
+            if (times == 0) {
+                return 0;
+            }
+            size(build("", {n}));
+            return repeat(times - 1);
+        };
+        repeat({n});
+    ''',
+}
+
+SIZES: Dict[str, int] = {
+    'fibonacci': 20,
+    'string building': 40,
+}
+
+
+def _time(run: Callable[[Environment], Optional[Object]]) -> float:
+    start = perf_counter()
+    run(Environment())
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Tree-walking evaluate() vs closure compilation')
+    parser.add_argument('--repeat', type=int, default=3, help='best of N runs')
+    args = parser.parse_args()
+
+    for name, source in WORKLOADS.items():
+        program: Program = Parser(Lexer(source.replace('{n}', str(SIZES[name])))).parse_program()
+        code = compile_program(program)
+
+        tree_walking = min(_time(lambda env: evaluate(program, env)) for _ in range(args.repeat))
+        compiled = min(_time(code) for _ in range(args.repeat))
+
+        print(f'{name:>16}: evaluate {tree_walking:.3f}s, '
+              f'compiled {compiled:.3f}s ({tree_walking / compiled:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
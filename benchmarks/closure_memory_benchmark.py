@@ -0,0 +1,85 @@
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Dict
+
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+
+WORKLOADS: Dict[str, str] = {
+    'capturing': '''
+        let make = func(n) {
+            let data = [];
+            for (i in range({size})) {
+                data = push(data, "item" + (i * n));
+            }
+            let scale = size(data);
+            func(x) { x * scale + n }
+        };
+        let handlers = [];
+        for (n in range({closures})) {
+            handlers = push(handlers, make(n));
+        }
+        handlers[{closures} - 1](2);
+    ''',
+    'non-capturing': '''
+        let make = func(n) {
+            let data = [];
+            for (i in range({size})) {
+                data = push(data, "item" + (i * n));
+            }
+            func(x) { x * 2 }
+        };
+        let handlers = [];
+        for (n in range({closures})) {
+            handlers = push(handlers, make(n));
+        }
+        handlers[{closures} - 1](2);
+    ''',
+    'nested': '''
+        let outer = func(a) {
+            let big = [];
+            for (i in range({size})) {
+                big = push(big, "item" + i);
+            }
+            func(b) {
+                let middle = [a, b, big];
+                func(c) { a + b + c }
+            }
+        };
+        let handlers = [];
+        for (n in range({closures})) {
+            handlers = push(handlers, outer(n)(1));
+        }
+        handlers[{closures} - 1](2);
+    ''',
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Memory retained by long-lived closures')
+    parser.add_argument('--closures', type=int, default=2000, help='closures kept alive')
+    parser.add_argument('--size', type=int, default=100, help='elements in each uncaptured local array')
+    args = parser.parse_args()
+
+    for name, template in WORKLOADS.items():
+        source = template.replace('{closures}', str(args.closures)).replace('{size}', str(args.size))
+        program = Parser(Lexer(source)).parse_program()
+        env = Environment()
+
+        tracemalloc.start()
+        start = perf_counter()
+        evaluated = evaluate(program, env)
+        elapsed = perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert evaluated is not None
+        print(f'{name:>14}: peak {peak / 2 ** 20:7.1f} MiB, retained {current / 2 ** 20:7.1f} MiB, '
+              f'{elapsed:.2f}s -> {evaluated.inspect()}')
+
+
+if __name__ == '__main__':
+    main()
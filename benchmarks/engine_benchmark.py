@@ -0,0 +1,66 @@
+import argparse
+from time import perf_counter
+from typing import Dict
+
+from cantte.ast import Program
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+from cantte.repl import ENGINES
+
+WORKLOADS: Dict[str, str] = {
+    'fibonacci(20)': '''
+        let fibonacci = func(n) {
+            if (n < 2) {
+                return n;
+            }
+            return fibonacci(n - 1) + fibonacci(n - 2);
+        };
+        fibonacci(20);
+    ''',
+    'closures': '''
+        let adder = func(x) { func(y) { x + y } };
+        let apply = func(n, acc) {
+            if (n == 0) {
+                return acc;
+            }
+            let add = adder(n);
+            return apply(n - 1, add(acc));
+        };
+        let repeat = func(times) {
+            if (times == 0) {
+                return 0;
+            }
+            apply(50, 0);
+            repeat(times - 1);
+        };
+        repeat(40);
+    ''',
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare the execution engines')
+    parser.add_argument('--repeat', type=int, default=3, help='best of N runs')
+    args = parser.parse_args()
+
+    for name, source in WORKLOADS.items():
+        program: Program = Parser(Lexer(source)).parse_program()
+        timings: Dict[str, float] = {}
+
+        for engine_name, engine in ENGINES.items():
+            best = float('inf')
+            for _ in range(args.repeat):
+                start = perf_counter()
+                engine(program, Environment())
+                best = min(best, perf_counter() - start)
+            timings[engine_name] = best
+
+        baseline = timings['evaluator']
+        results = ', '.join(f'{engine_name} {elapsed:.3f}s ({baseline / elapsed:.2f}x)'
+                            for engine_name, elapsed in timings.items())
+        print(f'{name:>14}: {results}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import argparse
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from cantte.ast import Program
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+
+
+def _nested_closures(depth: int) -> Tuple[str, str]:
+    parameters: List[str] = [f'p{level}' for level in range(depth)]
+    source: str = ' + '.join(parameters)
+
+    for parameter in reversed(parameters):
+        source = f'func({parameter}) {{ {source} }}'
+
+    calls: str = ''.join(f'({level})' for level in range(depth))
+
+    return f'let nested = {source};', f'nested{calls}'
+
+
+WORKLOADS: Dict[str, Tuple[str, str]] = {
+    'nested closures (depth 30)': _nested_closures(30),
+    'recursive countdown': ('''
+        let countdown = func(n, acc) {
+            if (n == 0) {
+                return acc;
+            }
+            return countdown(n - 1, acc + n);
+        };
+    ''', 'countdown(100, 0)'),
+    'fibonacci(12)': ('''
+        let fibonacci = func(n) {
+            if (n < 2) {
+                return n;
+            }
+            return fibonacci(n - 1) + fibonacci(n - 2);
+        };
+    ''', 'fibonacci(12)'),
+}
+
+
+def _parse(source: str) -> Program:
+    return Parser(Lexer(source)).parse_program()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Variable lookup cost in evaluate()')
+    parser.add_argument('--calls', type=int, default=300, help='calls per workload')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    for name, (setup, call) in WORKLOADS.items():
+        env: Environment = Environment()
+        evaluate(_parse(setup), env)
+        program: Program = _parse(call)
+        best = float('inf')
+
+        for _ in range(args.repeat):
+            start = perf_counter()
+            for _ in range(args.calls):
+                evaluate(program, env)
+            best = min(best, perf_counter() - start)
+
+        print(f'{name:>28}: {best:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
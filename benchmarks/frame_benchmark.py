@@ -0,0 +1,80 @@
+import argparse
+import timeit
+from time import perf_counter
+from typing import cast, Dict, List
+
+from cantte.evaluator import _extent_function_environment, _release_frame, evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment, Frame, Function, Integer, Object
+from cantte.parser import Parser
+from cantte.repl import ENGINES
+
+WORKLOADS: Dict[str, str] = {
+    'fibonacci(24)': '''
+        let fibonacci = func(n) {
+            if (n < 2) {
+                return n;
+            }
+            return fibonacci(n - 1) + fibonacci(n - 2);
+        };
+        fibonacci(24);
+    ''',
+    'locals': '''
+        let area = func(width, height, depth) {
+            let base = width * height;
+            let side = height * depth;
+            let front = width * depth;
+            2 * (base + side + front);
+        };
+        let total = 0;
+        for (i in range(100000)) {
+            total = total + area(i, 2, 3);
+        }
+        total;
+    ''',
+    'closures': '''
+        let adder = func(n) { func(x) { x + n } };
+        let total = 0;
+        for (i in range(100000)) {
+            total = adder(i)(total);
+        }
+        total;
+    ''',
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Call-heavy programs dominated by frame creation')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per workload, best is reported')
+    parser.add_argument('--engines', nargs='+', default=['evaluator', 'trampoline'], choices=sorted(ENGINES))
+    args = parser.parse_args()
+
+    for name, source in WORKLOADS.items():
+        for engine in args.engines:
+            best = float('inf')
+
+            for _ in range(args.repeat):
+                program = Parser(Lexer(source)).parse_program()
+                start = perf_counter()
+                ENGINES[engine](program, Environment())
+                best = min(best, perf_counter() - start)
+
+            print(f'{name:>14} [{engine:>10}]: {best:.3f}s')
+
+    env = Environment()
+    evaluate(Parser(Lexer('let f = func(n) { n }; let g = func(a, b, c) { let x = a; let y = b; x + y + c };')
+                    ).parse_program(), env)
+
+    one: List[Object] = [Integer(1)]
+    three: List[Object] = [Integer(1)] * 3
+
+    for label, function, arguments in [('1 parameter', env['f'], one), ('3 parameters, 2 locals', env['g'], three)]:
+        def call() -> None:
+            _release_frame(cast(Frame, _extent_function_environment(cast(Function, function), arguments)))
+
+        best = min(timeit.repeat(call, number=200_000, repeat=args.repeat))
+        print(f'{label:>22}: {best / 200_000 * 1e9:.0f}ns per frame')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+import argparse
+from random import Random
+from time import perf_counter
+from typing import Any, cast, Dict, List
+
+from cantte.evaluator import _evaluate_index_expression, evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment, Hash, HashKey, new_integer, Object, String
+from cantte.parser import Parser
+
+PROBE: str = '''
+let probe = func(i, n, total) {
+    if (i == n) {
+        return total;
+    }
+    return probe(i + 1, n, total + m[i]);
+};
+probe(0, {n}, 0);
+'''
+
+
+def _build(size: int) -> Hash:
+    pairs: Dict[HashKey, Object] = {}
+
+    for value in range(size):
+        pairs[value] = new_integer(1)
+        pairs[f'key{value}'] = new_integer(1)
+
+    return Hash(pairs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Hash map lookup throughput')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100_000, 1_000_000], help='entries per key type')
+    parser.add_argument('--lookups', type=int, default=200_000, help='lookups per measurement')
+    args = parser.parse_args()
+
+    random = Random(0)
+
+    for size in args.sizes:
+        hash_map = _build(size)
+        indexes = [random.randrange(size) for _ in range(args.lookups)]
+        probes: Dict[str, List[Object]] = {
+            'integer keys': [new_integer(index) for index in indexes],
+            'string keys': [String(f'key{index}') for index in indexes],
+        }
+
+        for label, keys in probes.items():
+            start = perf_counter()
+            for key in keys:
+                _evaluate_index_expression(hash_map, key)
+            elapsed = perf_counter() - start
+
+            print(f'{label:>14} size={len(hash_map):<8}: {args.lookups / elapsed / 1e6:.2f}M lookups/s')
+
+        env = Environment()
+        env['m'] = hash_map
+        lookups = min(args.lookups, size)
+        program = Parser(Lexer(PROBE.replace('{n}', str(lookups)))).parse_program()
+
+        start = perf_counter()
+        evaluated = cast(Any, evaluate(program, env))
+        elapsed = perf_counter() - start
+
+        assert evaluated.value == lookups
+        print(f'{"m[i] script":>14} size={len(hash_map):<8}: {lookups / elapsed / 1e3:.1f}k lookups/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+import argparse
+from time import perf_counter
+from typing import Dict, Tuple
+
+from cantte.allocations import AllocationCounter
+from cantte.ast import Program
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import configure_integer_cache, Environment, SMALL_INTEGER_RANGE
+from cantte.parser import Parser
+
+WORKLOADS: Dict[str, Tuple[str, str]] = {
+    'recursive countdown': ('''
+        let countdown = func(n, acc) {
+            if (n == 0) {
+                return acc;
+            }
+            return countdown(n - 1, acc + 1);
+        };
+    ''', 'countdown(100, 0)'),
+    'fibonacci(12)': ('''
+        let fibonacci = func(n) {
+            if (n < 2) {
+                return n;
+            }
+            return fibonacci(n - 1) + fibonacci(n - 2);
+        };
+    ''', 'fibonacci(12)'),
+}
+
+
+def _parse(source: str) -> Program:
+    return Parser(Lexer(source)).parse_program()
+
+
+def _run(setup: str, call: str, calls: int, repeat: int) -> Tuple[float, int]:
+    env: Environment = Environment()
+    evaluate(_parse(setup), env)
+    program: Program = _parse(call)
+    best = float('inf')
+
+    with AllocationCounter() as counter:
+        for _ in range(calls):
+            evaluate(program, env)
+
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(calls):
+            evaluate(program, env)
+        best = min(best, perf_counter() - start)
+
+    return best, counter.counts['Integer']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Integer allocations in evaluate() with and without the small-integer cache')
+    parser.add_argument('--calls', type=int, default=100, help='calls per workload')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    for name, (setup, call) in WORKLOADS.items():
+        for label, integer_range in [('no cache', (0, -1)), ('cache', SMALL_INTEGER_RANGE)]:
+            configure_integer_cache(*integer_range)
+            elapsed, allocations = _run(setup, call, args.calls, args.repeat)
+
+            print(f'{name:>20} [{label:>8}]: {elapsed:.3f}s, {allocations} Integer allocations')
+
+    configure_integer_cache(*SMALL_INTEGER_RANGE)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import argparse
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Tuple
+
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.limits import Limits
+from cantte.object import Environment
+from cantte.parser import Parser
+
+WORKLOADS: Dict[str, str] = {
+    'fibonacci(22)': '''
+        let fibonacci = func(n) {
+            if (n < 2) {
+                return n;
+            }
+            return fibonacci(n - 1) + fibonacci(n - 2);
+        };
+        fibonacci(22);
+    ''',
+    'while loop': '''
+        let i = 0;
+        while (i < 200000) {
+            i = i + 1;
+        }
+        i;
+    ''',
+    'string building': '''
+        let s = "";
+        for (i in range(100000)) {
+            s = s + "x";
+        }
+        size(s);
+    ''',
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Overhead of resource limits on the evaluator')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per configuration, best is reported')
+    args = parser.parse_args()
+
+    configurations: List[Tuple[str, Limits]] = [
+        ('unbounded', Limits()),
+        ('steps + depth', Limits(max_steps=10 ** 9, max_depth=10 ** 6)),
+        ('all limits', Limits(max_steps=10 ** 9, max_depth=10 ** 6, max_size=10 ** 9, timeout=3600)),
+    ]
+
+    for name, source in WORKLOADS.items():
+        program = Parser(Lexer(source)).parse_program()
+
+        baseline = min(_time(lambda: evaluate(program, Environment())) for _ in range(args.repeat))
+        print(f'{name:>16} [{"no limits":>13}]: {baseline:.3f}s')
+
+        for label, budget in configurations:
+            elapsed = min(_time(lambda: budget.run(program, Environment())) for _ in range(args.repeat))
+            print(f'{name:>16} [{label:>13}]: {elapsed:.3f}s, {(elapsed / baseline - 1) * 100:+.1f}%')
+
+
+def _time(run: Callable[[], Any]) -> float:
+    start = perf_counter()
+    run()
+    return perf_counter() - start
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+import argparse
+from time import perf_counter
+from typing import Any, cast, Dict, List
+
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+from cantte.repl import ENGINES
+
+WORKLOADS: Dict[str, str] = {
+    'while loop': '''
+        let i = 0;
+        while (i < {n}) {
+            i = i + 1;
+        }
+        i;
+    ''',
+    'for over range': '''
+        let count = 0;
+        for (i in range({n})) {
+            count = count + 1;
+        }
+        count;
+    ''',
+    'tail recursion': '''
+        let count = func(i, n) {
+            if (i < n) {
+                return count(i + 1, n);
+            }
+            i;
+        };
+        count(0, {n});
+    ''',
+    'plain recursion': '''
+        let count = func(n) {
+            if (n == 0) {
+                return 0;
+            }
+            1 + count(n - 1);
+        };
+        count({n});
+    ''',
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Counter loops against their recursive equivalents')
+    parser.add_argument('--iterations', type=int, default=10_000_000, help='loop iterations')
+    parser.add_argument('--engines', nargs='+', default=['evaluator'], choices=sorted(ENGINES))
+    args = parser.parse_args()
+
+    engines: List[str] = args.engines
+
+    for name, template in WORKLOADS.items():
+        for engine in engines:
+            program = Parser(Lexer(template.replace('{n}', str(args.iterations)))).parse_program()
+
+            start = perf_counter()
+            try:
+                evaluated = cast(Any, ENGINES[engine](program, Environment()))
+            except RecursionError:
+                print(f'{name:>16} [{engine:>10}]: RecursionError')
+                continue
+            elapsed = perf_counter() - start
+
+            assert evaluated.value == args.iterations
+            print(f'{name:>16} [{engine:>10}]: {elapsed:.2f}s, {args.iterations / elapsed / 1e6:.2f}M iterations/s')
+
+
+if __name__ == '__main__':
+    main()
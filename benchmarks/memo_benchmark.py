@@ -0,0 +1,44 @@
+import argparse
+from time import perf_counter
+from typing import Dict, Tuple
+
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.memo import memo_statistics
+from cantte.object import Environment
+from cantte.parser import Parser
+
+FIBONACCI: str = 'func(n) { if (n < 2) { return n; } return fibonacci(n - 1) + fibonacci(n - 2); }'
+PATHS: str = 'func(x, y) { if (x == 0) { 1 } else { if (y == 0) { 1 } else { paths(x - 1, y) + paths(x, y - 1) } } }'
+
+WORKLOADS: Dict[str, Tuple[str, str, str]] = {
+    'fibonacci(18)': ('fibonacci', FIBONACCI, 'fibonacci(18)'),
+    'paths(7, 7)': ('paths', PATHS, 'paths(7, 7)'),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Recursive pure functions with and without memo')
+    parser.add_argument('--repeat', type=int, default=3, help='best of N runs')
+    args = parser.parse_args()
+
+    for name, (function, source, call) in WORKLOADS.items():
+        for label, definition in [('plain', source), ('memo', f'memo({source})')]:
+            best = float('inf')
+
+            for _ in range(args.repeat):
+                env = Environment()
+                program = Parser(Lexer(f'let {function} = {definition}; {call};')).parse_program()
+
+                start = perf_counter()
+                evaluate(program, env)
+                best = min(best, perf_counter() - start)
+
+            statistics = memo_statistics(env[function])
+            counters = f' ({statistics.hits} hits, {statistics.misses} misses)' if statistics is not None else ''
+
+            print(f'{name:>14} [{label:>5}]: {best:.4f}s{counters}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import resource
+import subprocess
+import sys
+import tracemalloc
+from typing import List
+
+from benchmarks.sources import generate_program
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+
+
+def _measure_tracemalloc(source: str) -> List[str]:
+    tracemalloc.start()
+
+    program = Parser(Lexer(source)).parse_program()
+    ast_current, ast_peak = tracemalloc.get_traced_memory()
+
+    env = Environment()
+    evaluate(program, env)
+    heap_current, heap_peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return [
+        f'{"AST retained":>22}: {ast_current / 2 ** 20:8.1f} MiB',
+        f'{"parse peak":>22}: {ast_peak / 2 ** 20:8.1f} MiB',
+        f'{"AST + heap retained":>22}: {heap_current / 2 ** 20:8.1f} MiB',
+        f'{"evaluate peak":>22}: {heap_peak / 2 ** 20:8.1f} MiB',
+    ]
+
+
+def _measure_rss(source: str) -> List[str]:
+    program = Parser(Lexer(source)).parse_program()
+    env = Environment()
+    evaluate(program, env)
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return [f'{"peak RSS":>22}: {peak_rss / 2 ** 10:8.1f} MiB']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Memory used to parse and evaluate a large program')
+    parser.add_argument('--size', type=int, default=2 * 2 ** 20, help='source size in bytes')
+    parser.add_argument('--measure', choices=['rss', 'tracemalloc'], help='run a single measurement in this process')
+    args = parser.parse_args()
+
+    if args.measure is None:
+        print(f'source: {args.size / 2 ** 20:.1f} MiB')
+
+        for measure in ['rss', 'tracemalloc']:
+            subprocess.run([sys.executable, '-m', 'benchmarks.memory_benchmark',
+                            '--size', str(args.size), '--measure', measure], check=True)
+        return
+
+    source: str = generate_program(args.size)
+    measurements = _measure_rss(source) if args.measure == 'rss' else _measure_tracemalloc(source)
+
+    for line in measurements:
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
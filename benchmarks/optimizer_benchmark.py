@@ -0,0 +1,67 @@
+import argparse
+from time import perf_counter
+
+from cantte.ast import Program
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.optimizer import optimize
+from cantte.parser import Parser
+
+SETUP: str = '''
+    let seconds = func(days) {
+        let day = 60 * 60 * 24;
+        if (1 < 2) {
+            days * day + 0 * (1000 - 999)
+        } else {
+            "never" + " " + "here"
+        }
+    };
+    let label = func(n) {
+        if (!false) {
+            "prefix" + "-" + "suffix" + "-" + "value"
+        } else {
+            n
+        }
+    };
+    let work = func(n, acc) {
+        if (n == 0) {
+            return acc;
+        }
+        label(n);
+        return work(n - 1, acc + seconds(n) / (2 * 2 * 2));
+    };
+'''
+
+
+def _run(optimized: bool, calls: int, repeat: int) -> float:
+    env: Environment = Environment()
+    setup: Program = Parser(Lexer(SETUP)).parse_program()
+
+    if optimized:
+        setup = optimize(setup)
+
+    evaluate(setup, env)
+    program: Program = Parser(Lexer(f'work({calls}, 0)')).parse_program()
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = perf_counter()
+        evaluate(program, env)
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='evaluate() with and without the optimizer pass')
+    parser.add_argument('--calls', type=int, default=20_000, help='iterations of the workload')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    for label, optimized in [('plain', False), ('optimized', True)]:
+        print(f'{label:>10}: {_run(optimized, args.calls, args.repeat):.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import argparse
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.sources import generate_program
+from cantte.cache import ParseCache
+from cantte.lexer import Lexer
+from cantte.parser import Parser
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Cold vs warm parse through the on-disk AST cache')
+    parser.add_argument('--size', type=int, default=2 * 2 ** 20, help='source size in bytes')
+    parser.add_argument('--repeat', type=int, default=3, help='best of N runs')
+    args = parser.parse_args()
+
+    source: str = generate_program(args.size)
+    print(f'source: {len(source) / 2 ** 20:.1f} MiB')
+
+    best = float('inf')
+    for _ in range(args.repeat):
+        start = perf_counter()
+        Parser(Lexer(source)).parse_program()
+        best = min(best, perf_counter() - start)
+    print(f'{"lex + parse":>12}: {best:.3f}s')
+
+    with TemporaryDirectory() as directory:
+        cold = float('inf')
+        warm = float('inf')
+
+        for _ in range(args.repeat):
+            cache = ParseCache(directory)
+            cache.clear()
+
+            start = perf_counter()
+            cache.parse(source)
+            cold = min(cold, perf_counter() - start)
+
+            start = perf_counter()
+            cache.parse(source)
+            warm = min(warm, perf_counter() - start)
+
+            assert cache.hits == 1
+
+        print(f'{"cold cache":>12}: {cold:.3f}s')
+        print(f'{"warm cache":>12}: {warm:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import argparse
+from time import perf_counter
+from typing import Callable
+
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+from cantte.profiler import Profiler
+
+SOURCE: str = '''
+let fibonacci = func(n) {
+    if (n < 2) {
+        return n;
+    }
+    return fibonacci(n - 1) + fibonacci(n - 2);
+};
+fibonacci(20);
+'''
+
+
+def _best(repeat: int, run: Callable[[], object]) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Evaluator cost with the profiler disabled and enabled')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    program = Parser(Lexer(SOURCE)).parse_program()
+
+    disabled = _best(args.repeat, lambda: evaluate(program, Environment()))
+    enabled = _best(args.repeat, lambda: Profiler().run(program, Environment()))
+
+    print(f'profiler disabled: {disabled:.4f}s')
+    print(f' profiler enabled: {enabled:.4f}s ({enabled / disabled:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
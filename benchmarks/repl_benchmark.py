@@ -0,0 +1,82 @@
+import argparse
+from time import perf_counter
+from typing import Callable, List
+
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+from cantte.repl import ENGINES, Session
+
+
+def scripted_session(lines: int) -> List[str]:
+    script: List[str] = []
+
+    for index in range(lines):
+        kind = index % 5
+
+        if kind == 0:
+            script.append(f'let value_{index} = {index} * 2 + 1;')
+        elif kind == 1:
+            script.append(f'let double_{index} = func(x) {{ x * 2 }};')
+        elif kind == 2:
+            script.append(f'double_{index - 1}(value_{index - 2})')
+        elif kind == 3:
+            script.append(f'if (value_{index - 3} > 100) {{ "big" }} else {{ "small" }}')
+        else:
+            script.append('let broken = ;')
+
+    return script
+
+
+def _replayed_run(scanned: List[str], source: str) -> None:
+    scanned.append(source)
+    parser = Parser(Lexer(' '.join(scanned)))
+    program = parser.parse_program()
+
+    if len(parser.errors) > 0:
+        scanned.pop()
+        return
+
+    evaluate(program, Environment())
+
+
+def _report(name: str, script: List[str], run: Callable[[str], object], bucket: int) -> None:
+    latencies: List[float] = []
+
+    for source in script:
+        start = perf_counter()
+        run(source)
+        latencies.append(perf_counter() - start)
+
+    print(name)
+    for first in range(0, len(latencies), bucket):
+        window = sorted(latencies[first:first + bucket])
+        mean = sum(window) / len(window)
+        p99 = window[min(len(window) - 1, int(len(window) * 0.99))]
+
+        print(f'  lines {first + 1:>6}-{first + len(window):<6} mean {mean * 1e6:9.1f}us  p99 {p99 * 1e6:9.1f}us')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Per-line latency of a scripted REPL session')
+    parser.add_argument('--lines', type=int, default=10_000, help='lines fed to the session')
+    parser.add_argument('--bucket', type=int, default=1_000, help='lines per reported bucket')
+    parser.add_argument('--replay-lines', type=int, default=1_000,
+                        help='lines fed to the previous replay-everything REPL loop')
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='evaluator')
+    args = parser.parse_args()
+
+    script: List[str] = scripted_session(args.lines)
+
+    session = Session(args.engine)
+    _report(f'incremental session ({args.engine})', script, session.run, args.bucket)
+
+    if args.replay_lines > 0:
+        scanned: List[str] = []
+        _report('history replay (previous REPL)', script[:args.replay_lines],
+                lambda source: _replayed_run(scanned, source), args.bucket // 5 or 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+import argparse
+from time import perf_counter
+
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+from cantte.repl import ENGINES
+from cantte.script import CompiledScript, to_object
+
+SOURCE: str = '''
+let discount = func(total) {
+    if (total > threshold) {
+        return total - total / 10;
+    }
+    total;
+};
+let total = 0;
+for (item in items) {
+    total = total + item * quantity;
+}
+discount(total + shipping);
+'''
+
+GLOBALS = {'threshold': 500, 'shipping': 15}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='One script evaluated against many input bindings')
+    parser.add_argument('--runs', type=int, default=100_000, help='runs per configuration')
+    parser.add_argument('--engines', nargs='+', default=['evaluator', 'closures', 'vm'], choices=sorted(ENGINES))
+    args = parser.parse_args()
+
+    inputs = [{'items': [run % 7, run % 11, run % 13], 'quantity': run % 5 + 1} for run in range(args.runs)]
+
+    for engine in args.engines:
+        start = perf_counter()
+        expected = []
+        for bindings in inputs:
+            env = Environment()
+            for name, value in {**GLOBALS, **bindings}.items():
+                env[name] = to_object(value)
+            expected.append(ENGINES[engine](Parser(Lexer(SOURCE)).parse_program(), env))
+        parsed = perf_counter() - start
+
+        start = perf_counter()
+        script = CompiledScript(SOURCE, globals=GLOBALS, engine=engine)
+        results = [script.run(bindings) for bindings in inputs]
+        compiled = perf_counter() - start
+
+        assert [result.inspect() for result in results if result] == [value.inspect() for value in expected if value]
+        print(f'{engine:>10}: parse per run {parsed:.2f}s, compiled script {compiled:.2f}s '
+              f'({args.runs / compiled / 1000:.1f}k runs/s, {parsed / compiled:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
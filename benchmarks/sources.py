@@ -0,0 +1,26 @@
+from typing import List
+
+_CHUNK: str = '''
+let total_{index} = func(x, y) {{
+    if (x > y) {{
+        return x * {index} - y / 3;
+    }} else {{
+        return "value_{index}" + " " + "suffix";
+    }}
+}};
+let result_{index} = total_{index}({index}, 42) != 17;
+'''
+
+
+def generate_program(size: int) -> str:
+    chunks: List[str] = []
+    length: int = 0
+    index: int = 0
+
+    while length < size:
+        chunk = _CHUNK.format(index=index)
+        chunks.append(chunk)
+        length += len(chunk)
+        index += 1
+
+    return ''.join(chunks)
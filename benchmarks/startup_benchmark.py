@@ -0,0 +1,49 @@
+import argparse
+import os
+import subprocess
+import sys
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict, List, Optional
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _wall_clock(command: List[str], runs: int, stdin: Optional[str] = None) -> List[float]:
+    timings: List[float] = []
+
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess.run(command, input=stdin, text=True, cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(perf_counter() - start)
+
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Wall clock from process start to the first evaluated statement')
+    parser.add_argument('--runs', type=int, default=20, help='process launches per command')
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as directory:
+        script = os.path.join(directory, 'first.cnt')
+        with open(script, 'w', encoding='utf-8') as script_file:
+            script_file.write('1 + 1;\n')
+
+        commands: Dict[str, List[str]] = {
+            'python -c pass': [sys.executable, '-c', 'pass'],
+            'main.py (piped REPL)': [sys.executable, 'main.py'],
+            'python -m cantte run': [sys.executable, '-m', 'cantte', 'run', script],
+        }
+
+        for name, command in commands.items():
+            stdin = '1 + 1;\nexit()\n' if name.startswith('main.py') else None
+            timings = _wall_clock(command, args.runs, stdin)
+
+            print(f'{name:>22}: min {min(timings) * 1e3:6.1f}ms  median {median(timings) * 1e3:6.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Any, cast
+
+import cantte.object as cantte_object
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+
+BUILD: str = '''
+let build = func(n, report) {
+    if (n == 0) {
+        return report;
+    }
+    return build(n - 1, report + fragment);
+};
+let report = build({n}, "");
+size(report);
+'''
+
+
+def _run(fragments: int, fragment_size: int, flat: bool) -> None:
+    limit = cantte_object.FLAT_CONCAT_LIMIT
+    if flat:
+        cantte_object.FLAT_CONCAT_LIMIT = 2 ** 62
+
+    env = Environment()
+    env['fragment'] = cantte_object.String('x' * fragment_size)
+    program = Parser(Lexer(BUILD.replace('{n}', str(fragments)))).parse_program()
+
+    try:
+        tracemalloc.start()
+        start = perf_counter()
+        evaluated = cast(Any, evaluate(program, env))
+        built = perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = perf_counter()
+        value = env['report'].inspect()
+        observed = perf_counter() - start
+    finally:
+        cantte_object.FLAT_CONCAT_LIMIT = limit
+
+    assert evaluated.value == len(value) == fragments * fragment_size
+    print(f'{"flat" if flat else "rope":>5} {fragments:>7} x {fragment_size} chars: build+size {built:.3f}s, '
+          f'first inspect {observed:.3f}s, peak {peak / (1024 * 1024):.1f} MB')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Building a large string from many fragments')
+    parser.add_argument('--fragments', type=int, default=100_000, help='fragments concatenated with ropes')
+    parser.add_argument('--fragment-size', type=int, default=100, help='characters per fragment')
+    parser.add_argument('--flat-fragments', type=int, nargs='+', default=[5000, 10_000, 20_000],
+                        help='fragment counts for the eager str concatenation baseline')
+    args = parser.parse_args()
+
+    for fragments in args.flat_fragments:
+        _run(fragments, args.fragment_size, flat=True)
+        _run(fragments, args.fragment_size, flat=False)
+
+    _run(args.fragments, args.fragment_size, flat=False)
+
+
+if __name__ == '__main__':
+    main()
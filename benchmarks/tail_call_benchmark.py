@@ -0,0 +1,75 @@
+import argparse
+from time import perf_counter
+from typing import Dict, List
+
+from cantte.ast import Program
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+from cantte.repl import ENGINES
+
+WORKLOADS: Dict[str, str] = {
+    'fibonacci(15)': '''
+        let fibonacci = func(n) {
+            if (n < 2) {
+                return n;
+            }
+            return fibonacci(n - 1) + fibonacci(n - 2);
+        };
+        fibonacci(15);
+    ''',
+    'tail countdown(200)': '''
+        let countdown = func(n, acc) {
+            if (n == 0) {
+                return acc;
+            }
+            return countdown(n - 1, acc + n);
+        };
+        let repeat = func(times) {
+            if (times == 0) {
+                return 0;
+            }
+            countdown(200, 0);
+            repeat(times - 1);
+        };
+        repeat(50);
+    ''',
+    'tail countdown(100000)': '''
+        let countdown = func(n, acc) {
+            if (n == 0) {
+                return acc;
+            }
+            return countdown(n - 1, acc + n);
+        };
+        countdown(100000, 0);
+    ''',
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Cost of tail calls and trampolined evaluation')
+    parser.add_argument('--repeat', type=int, default=3, help='best of N runs')
+    parser.add_argument('--engines', nargs='+', default=['evaluator', 'trampoline'], choices=sorted(ENGINES))
+    args = parser.parse_args()
+
+    engines: List[str] = args.engines
+
+    for name, source in WORKLOADS.items():
+        for engine in engines:
+            best = float('inf')
+
+            try:
+                for _ in range(args.repeat):
+                    program: Program = Parser(Lexer(source)).parse_program()
+                    start = perf_counter()
+                    ENGINES[engine](program, Environment())
+                    best = min(best, perf_counter() - start)
+            except RecursionError:
+                print(f'{name:>24} [{engine:>10}]: RecursionError')
+                continue
+
+            print(f'{name:>24} [{engine:>10}]: {best:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, List, Tuple
+
+from benchmarks.sources import generate_program
+from cantte.lexer import Lexer, TokenBuffer
+from cantte.parser import Parser
+from cantte.token import Token, TokenType
+
+
+def _token_list(source: str) -> List[Token]:
+    lexer = Lexer(source)
+    tokens: List[Token] = []
+
+    while (token := lexer.next_token()).token_type != TokenType.EOF:
+        tokens.append(token)
+    tokens.append(token)
+
+    return tokens
+
+
+def _token_buffer(source: str) -> TokenBuffer:
+    return Lexer(source).tokenize()
+
+
+def _measure(function: Callable[[str], Any], source: str) -> Tuple[Any, float, int]:
+    start = perf_counter()
+    function(source)
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    result = function(source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Bulk tokenization time and memory')
+    parser.add_argument('--size', type=int, default=2 * 1024 * 1024, help='generated source size in bytes')
+    args = parser.parse_args()
+
+    source: str = generate_program(args.size)
+    print(f'Source size: {len(source) / (1024 * 1024):.2f} MB')
+
+    for name, function in [('Token list', _token_list), ('TokenBuffer', _token_buffer)]:
+        tokens, elapsed, peak = _measure(function, source)
+        print(f'{name:>12}: {len(tokens)} tokens in {elapsed:.3f}s, '
+              f'peak {peak / (1024 * 1024):.1f} MB')
+
+    buffer = _token_buffer(source)
+    start = perf_counter()
+    program = Parser(buffer).parse_program()
+    elapsed = perf_counter() - start
+    print(f'{"parse":>12}: {len(program.statements)} statements in {elapsed:.3f}s')
+
+    start = perf_counter()
+    for index in range(0, len(buffer), 100):
+        buffer.position(index)
+    elapsed = perf_counter() - start
+    print(f'{"positions":>12}: {(len(buffer) + 99) // 100} tokens located in {elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+import sys
+from argparse import ArgumentParser
+from typing import List, Optional
+
+from cantte.ast import Program
+from cantte.lexer import Lexer, SourceMap
+from cantte.object import Environment, Error
+from cantte.parser import Parser
+from cantte.repl import ENGINES, start_repl
+
+
+def run_file(path: str,
+             engine: str = 'evaluator',
+             optimized: bool = False,
+             cached: bool = False,
+             profile: bool = False,
+             profile_output: Optional[str] = None) -> int:
+    with open(path, encoding='utf-8') as source_file:
+        source = source_file.read()
+
+    program: Program
+    errors: List[str]
+
+    if cached:
+        from cantte.cache import ParseCache
+
+        program, errors = ParseCache().parse(source)
+    else:
+        parser = Parser(Lexer(source))
+        program = parser.parse_program()
+        errors = parser.errors
+
+    if len(errors) > 0:
+        for error in errors:
+            print(error, file=sys.stderr)
+        return 1
+
+    if optimized:
+        from cantte.optimizer import optimize
+
+        program = optimize(program)
+
+    if profile or profile_output is not None:
+        from cantte.profiler import Profiler
+
+        profiler = Profiler(source=source)
+        evaluated = profiler.run(program, Environment())
+
+        print(profiler.report(), file=sys.stderr)
+        if profile_output is not None:
+            profiler.write_collapsed_stacks(profile_output)
+    else:
+        evaluated = ENGINES[engine](program, Environment())
+
+    if type(evaluated) is Error:
+        if evaluated.offset >= 0:
+            print(f'{evaluated.inspect()} ({SourceMap(source).position(evaluated.offset)})', file=sys.stderr)
+        else:
+            print(evaluated.inspect(), file=sys.stderr)
+        return 1
+    elif evaluated is not None:
+        print(evaluated.inspect())
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(prog='cantte', description='The Cantte programming language')
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help='run a Cantte script')
+    run_parser.add_argument('file', help='path to the .cnt script')
+    run_parser.add_argument('--cache', action='store_true', help='reuse parsed programs from the on-disk cache')
+    run_parser.add_argument('--profile', action='store_true',
+                            help='print per-node-type and per-function timings to stderr (evaluator engine only)')
+    run_parser.add_argument('--profile-output', metavar='PATH',
+                            help='write collapsed stacks for flamegraph tools to PATH (implies --profile)')
+
+    repl_parser = subparsers.add_parser('repl', help='start the interactive REPL')
+
+    for command_parser in (run_parser, repl_parser):
+        command_parser.add_argument('--engine', choices=sorted(ENGINES), default='evaluator',
+                                    help='execution engine used to run the programs')
+        command_parser.add_argument('--optimize', action='store_true',
+                                    help='fold constants and drop dead branches before running')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        if (args.profile or args.profile_output is not None) and args.engine != 'evaluator':
+            run_parser.error(f'--profile is only supported by the evaluator engine, not {args.engine}')
+
+        return run_file(args.file, args.engine, args.optimize, args.cache, args.profile, args.profile_output)
+
+    print('Welcome to the Cantte programming language')
+    start_repl(getattr(args, 'engine', 'evaluator'), getattr(args, 'optimize', False))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
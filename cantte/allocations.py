@@ -0,0 +1,46 @@
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from cantte.object import Boolean, Error, Function, Integer, Object, Return, String
+
+TRACKED_TYPES: Tuple[Type[Object], ...] = (Integer, Boolean, String, Return, Error, Function)
+
+
+class AllocationCounter:
+
+    def __init__(self, *types: Type[Object]) -> None:
+        self._types = types or TRACKED_TYPES
+        self._originals: Dict[Type[Object], Optional[Callable[..., None]]] = {}
+        self.counts: Dict[str, int] = {object_type.__name__: 0 for object_type in self._types}
+
+    def __enter__(self) -> 'AllocationCounter':
+        for object_type in self._types:
+            original = object_type.__dict__.get('__init__')
+            self._originals[object_type] = original
+            setattr(object_type, '__init__', self._counting_init(object_type, original))
+
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        for object_type, original in self._originals.items():
+            if original is None:
+                delattr(object_type, '__init__')
+            else:
+                setattr(object_type, '__init__', original)
+
+        self._originals.clear()
+
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def _counting_init(self,
+                       object_type: Type[Object],
+                       original: Optional[Callable[..., None]]) -> Callable[..., None]:
+        counts = self.counts
+        name = object_type.__name__
+        initialize = original if original is not None else super(object_type, object_type).__init__
+
+        def counting_init(instance: Object, *args: Any, **kwargs: Any) -> None:
+            counts[name] += 1
+            initialize(instance, *args, **kwargs)
+
+        return counting_init
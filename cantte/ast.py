@@ -1,11 +1,19 @@
+import threading
 from abc import ABC, abstractmethod
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from cantte.token import Token
 
+UNRESOLVED: int = -2
+GLOBAL: int = -1
+CELL: int = -3
+FREE: int = -4
+
 
 class ASTNode(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def token_literal(self) -> str:
         pass
@@ -14,35 +22,56 @@ class ASTNode(ABC):
     def __str__(self) -> str:
         pass
 
+    def children(self) -> List['ASTNode']:
+        return []
+
 
 class Statement(ASTNode, ABC):
 
+    __slots__ = ('token',)
+
     def __init__(self, token: Token) -> None:
         self.token = token
 
     def token_literal(self) -> str:
         return self.token.literal
 
+    @property
+    def offset(self) -> int:
+        return self.token.offset
+
 
 class Expression(ASTNode, ABC):
 
+    __slots__ = ('token',)
+
     def __init__(self, token: Token) -> None:
         self.token = token
 
     def token_literal(self) -> str:
         return self.token.literal
 
+    @property
+    def offset(self) -> int:
+        return self.token.offset
+
 
 class Program(ASTNode):
 
+    __slots__ = ('statements', 'resolved')
+
     def __init__(self, statements: List[Statement]) -> None:
         self.statements = statements
+        self.resolved = False
 
     def token_literal(self) -> str:
         if len(self.statements) > 0:
             return self.statements[0].token_literal()
         return ''
 
+    def children(self) -> List[ASTNode]:
+        return list(self.statements)
+
     def __str__(self):
         out: List[str] = []
         for statement in self.statements:
@@ -53,50 +82,104 @@ class Program(ASTNode):
 
 class Identifier(Expression):
 
+    __slots__ = ('value', 'depth', 'slot')
+
     def __init__(self, token: Token, value: str) -> None:
         super().__init__(token)
         self.value = value
+        self.depth = UNRESOLVED
+        self.slot = -1
 
     def __str__(self) -> str:
         return self.value
 
 
+class FreeFrames(threading.local):
+
+    def __init__(self) -> None:
+        self.frames: List[Any] = []
+
+
+class Scope:
+
+    __slots__ = ('names', 'slots', 'parameters', 'locals', 'captures', 'cells', 'closure', 'closure_slots',
+                 'fallbacks', 'free')
+
+    def __init__(self,
+                 names: Tuple[str, ...],
+                 slots: Dict[str, int],
+                 parameters: int = 0,
+                 captures: bool = True,
+                 cells: Tuple[int, ...] = (),
+                 closure: Tuple[Tuple[bool, int], ...] = (),
+                 closure_slots: Optional[Dict[str, int]] = None,
+                 fallbacks: Optional[Dict[int, int]] = None) -> None:
+        self.names = names
+        self.slots = slots
+        self.parameters = parameters
+        self.locals = len(names) - parameters
+        self.captures = captures
+        self.cells = cells
+        self.closure = closure
+        self.closure_slots = closure_slots if closure_slots is not None else {}
+        self.fallbacks = fallbacks if fallbacks is not None else {}
+        self.free = FreeFrames()
+
+
 class LetStatement(Statement):
 
+    __slots__ = ('name', 'value')
+
     def __init__(self, token: Token, name: Optional[Identifier] = None, value: Optional[Expression] = None) -> None:
         super().__init__(token)
         self.name = name
         self.value = value
 
+    def children(self) -> List[ASTNode]:
+        return [node for node in (self.name, self.value) if node is not None]
+
     def __str__(self) -> str:
         return f'{self.token_literal()} {str(self.name)} = {str(self.value)};'
 
 
 class ReturnStatement(Statement):
 
+    __slots__ = ('return_value',)
+
     def __init__(self, token: Token, return_value: Optional[Expression] = None):
         super().__init__(token)
         self.return_value = return_value
 
+    def children(self) -> List[ASTNode]:
+        return [self.return_value] if self.return_value is not None else []
+
     def __str__(self) -> str:
         return f'{self.token_literal()} {str(self.return_value)};'
 
 
 class ExpressionStatement(Statement):
 
+    __slots__ = ('expression',)
+
     def __init__(self, token: Token, expression: Optional[Expression] = None):
         super().__init__(token)
         self.expression = expression
 
+    def children(self) -> List[ASTNode]:
+        return [self.expression] if self.expression is not None else []
+
     def __str__(self) -> str:
         return str(self.expression)
 
 
 class Integer(Expression):
 
+    __slots__ = ('value', 'constant')
+
     def __init__(self, token: Token, value: Optional[int] = None) -> None:
         super().__init__(token)
         self.value = value
+        self.constant: Any = None
 
     def __str__(self) -> str:
         return str(self.value)
@@ -104,16 +187,23 @@ class Integer(Expression):
 
 class Prefix(Expression):
 
+    __slots__ = ('operator', 'right')
+
     def __init__(self, token: Token, operator: str, right: Optional[Expression] = None) -> None:
         super().__init__(token)
         self.operator = operator
         self.right = right
 
+    def children(self) -> List[ASTNode]:
+        return [self.right] if self.right is not None else []
+
     def __str__(self) -> str:
         return f'({self.operator}{str(self.right)})'
     
     
 class Infix(Expression):
+
+    __slots__ = ('left', 'operator', 'right')
     
     def __init__(self, token: Token, left: Expression, operator: str, right: Optional[Expression] = None) -> None:
         super().__init__(token)
@@ -121,12 +211,17 @@ class Infix(Expression):
         self.operator = operator
         self.right = right
 
+    def children(self) -> List[ASTNode]:
+        return [node for node in (self.left, self.right) if node is not None]
+
     def __str__(self) -> str:
         return f'({str(self.left)} {self.operator} {str(self.right)})'
 
 
 class Boolean(Expression):
 
+    __slots__ = ('value',)
+
     def __init__(self, token: Token, value: Optional[bool] = None) -> None:
         super().__init__(token)
         self.value = value
@@ -137,17 +232,77 @@ class Boolean(Expression):
 
 class Block(Statement):
 
+    __slots__ = ('statements',)
+
     def __init__(self, token: Token, statements: List[Statement]) -> None:
         super().__init__(token)
         self.statements = statements
 
+    def children(self) -> List[ASTNode]:
+        return list(self.statements)
+
     def __str__(self) -> str:
         out: List[str] = [str(statement) for statement in self.statements]
         return ''.join(out)
 
 
+class AssignStatement(Statement):
+
+    __slots__ = ('name', 'value')
+
+    def __init__(self, token: Token, name: Optional[Identifier] = None, value: Optional[Expression] = None) -> None:
+        super().__init__(token)
+        self.name = name
+        self.value = value
+
+    def children(self) -> List[ASTNode]:
+        return [node for node in (self.name, self.value) if node is not None]
+
+    def __str__(self) -> str:
+        return f'{str(self.name)} = {str(self.value)};'
+
+
+class WhileStatement(Statement):
+
+    __slots__ = ('condition', 'body')
+
+    def __init__(self, token: Token, condition: Optional[Expression] = None, body: Optional[Block] = None) -> None:
+        super().__init__(token)
+        self.condition = condition
+        self.body = body
+
+    def children(self) -> List[ASTNode]:
+        return [node for node in (self.condition, self.body) if node is not None]
+
+    def __str__(self) -> str:
+        return f'{self.token_literal()} {str(self.condition)} {str(self.body)}'
+
+
+class ForStatement(Statement):
+
+    __slots__ = ('name', 'iterable', 'body')
+
+    def __init__(self,
+                 token: Token,
+                 name: Optional[Identifier] = None,
+                 iterable: Optional[Expression] = None,
+                 body: Optional[Block] = None) -> None:
+        super().__init__(token)
+        self.name = name
+        self.iterable = iterable
+        self.body = body
+
+    def children(self) -> List[ASTNode]:
+        return [node for node in (self.name, self.iterable, self.body) if node is not None]
+
+    def __str__(self) -> str:
+        return f'{self.token_literal()} {str(self.name)} in {str(self.iterable)} {str(self.body)}'
+
+
 class If(Expression):
 
+    __slots__ = ('condition', 'consequence', 'alternative')
+
     def __init__(self,
                  token: Token,
                  condition: Optional[Expression] = None,
@@ -158,6 +313,9 @@ class If(Expression):
         self.consequence = consequence
         self.alternative = alternative
 
+    def children(self) -> List[ASTNode]:
+        return [node for node in (self.condition, self.consequence, self.alternative) if node is not None]
+
     def __str__(self) -> str:
         out: str = f'if {str(self.condition)} {str(self.consequence)}'
 
@@ -169,10 +327,20 @@ class If(Expression):
 
 class Function(Expression):
 
+    __slots__ = ('parameters', 'body', 'scope')
+
     def __init__(self, token: Token, parameters: List[Identifier] = [], body: Optional[Block] = None) -> None:
         super().__init__(token)
         self.parameters = parameters
         self.body = body
+        self.scope: Optional[Scope] = None
+
+    def children(self) -> List[ASTNode]:
+        nodes: List[ASTNode] = list(self.parameters)
+        if self.body is not None:
+            nodes.append(self.body)
+
+        return nodes
 
     def __str__(self) -> str:
         param_list: List[str] = [str(parameter) for parameter in self.parameters]
@@ -183,10 +351,16 @@ class Function(Expression):
 
 class Call(Expression):
 
+    __slots__ = ('function', 'arguments', 'tail')
+
     def __init__(self, token: Token, function: Expression, arguments: Optional[List[Expression]] = None) -> None:
         super().__init__(token)
         self.function = function
         self.arguments = arguments
+        self.tail = False
+
+    def children(self) -> List[ASTNode]:
+        return [self.function, *(self.arguments or [])]
 
     def __str__(self) -> str:
         assert self.arguments is not None
@@ -198,10 +372,62 @@ class Call(Expression):
 
 class StringLiteral(Expression):
 
+    __slots__ = ('value', 'constant')
+
     def __init__(self, token: Token, value: str) -> None:
         super().__init__(token)
         self.value = value
+        self.constant: Any = None
 
     def __str__(self) -> str:
         return self.value
 
+
+class ArrayLiteral(Expression):
+
+    __slots__ = ('elements',)
+
+    def __init__(self, token: Token, elements: Optional[List[Expression]] = None) -> None:
+        super().__init__(token)
+        self.elements = elements
+
+    def children(self) -> List[ASTNode]:
+        return list(self.elements or [])
+
+    def __str__(self) -> str:
+        assert self.elements is not None
+
+        return f'[{", ".join(str(element) for element in self.elements)}]'
+
+
+class Index(Expression):
+
+    __slots__ = ('left', 'index')
+
+    def __init__(self, token: Token, left: Expression, index: Optional[Expression] = None) -> None:
+        super().__init__(token)
+        self.left = left
+        self.index = index
+
+    def children(self) -> List[ASTNode]:
+        return [node for node in (self.left, self.index) if node is not None]
+
+    def __str__(self) -> str:
+        return f'({str(self.left)}[{str(self.index)}])'
+
+
+class HashLiteral(Expression):
+
+    __slots__ = ('pairs',)
+
+    def __init__(self, token: Token, pairs: Optional[List[Tuple[Expression, Expression]]] = None) -> None:
+        super().__init__(token)
+        self.pairs = pairs
+
+    def children(self) -> List[ASTNode]:
+        return [node for pair in self.pairs or [] for node in pair]
+
+    def __str__(self) -> str:
+        assert self.pairs is not None
+
+        return f'{{{", ".join(f"{str(key)}: {str(value)}" for key, value in self.pairs)}}}'
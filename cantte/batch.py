@@ -0,0 +1,166 @@
+import os
+import signal
+from concurrent.futures import as_completed, Future, ProcessPoolExecutor
+from typing import Any, cast, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from cantte.lexer import Lexer
+from cantte.object import Boolean, Environment, Error, Integer, Object, String
+from cantte.parser import Parser
+from cantte.repl import Engine, ENGINES
+
+TIMEOUT: str = 'TIMEOUT'
+NONE: str = 'NONE'
+
+_WARM_UP_SOURCE = 'let f = func(n) { if (n < 2) { return n; } f(n - 1) + f(n - 2) }; f(5); [1]; {"a": 1}["a"];'
+_TIMEOUT_MESSAGE = 'Timed out after {}s'
+
+
+class Result(NamedTuple):
+    position: int
+    type: str
+    value: Any
+    inspect: str
+
+
+class _Timeout(Exception):
+    pass
+
+
+def encode(position: int, obj: Optional[Object]) -> Result:
+    if obj is None:
+        return Result(position, NONE, None, '')
+
+    obj_type = type(obj)
+
+    if obj_type is Integer or obj_type is String or obj_type is Boolean:
+        return Result(position, obj.type().name, cast(Any, obj).value, obj.inspect())
+    elif obj_type is Error:
+        return Result(position, obj.type().name, cast(Error, obj).message, obj.inspect())
+
+    return Result(position, obj.type().name, None, obj.inspect())
+
+
+class BatchRunner:
+
+    def __init__(self,
+                 workers: Optional[int] = None,
+                 engine: str = 'evaluator',
+                 optimized: bool = False) -> None:
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.engine = engine
+        self.optimized = optimized
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up)
+
+    def __enter__(self) -> 'BatchRunner':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown()
+
+    def run_many(self,
+                 sources: Iterable[str],
+                 timeout: Optional[float] = None,
+                 ordered: bool = True,
+                 chunk_size: Optional[int] = None) -> Iterator[Result]:
+        scripts = list(enumerate(sources))
+
+        if not scripts:
+            return iter([])
+
+        size = chunk_size if chunk_size is not None else max(1, min(64, len(scripts) // (self.workers * 4)))
+        futures: List[Future] = [
+            self._executor.submit(_run_chunk, scripts[start:start + size], self.engine, self.optimized, timeout)
+            for start in range(0, len(scripts), size)
+        ]
+
+        if ordered:
+            return (result for future in futures for result in future.result())
+
+        return (result for future in as_completed(futures) for result in future.result())
+
+
+_runner: Optional[BatchRunner] = None
+
+
+def run_many(sources: Iterable[str],
+             workers: Optional[int] = None,
+             timeout: Optional[float] = None,
+             ordered: bool = True,
+             engine: str = 'evaluator',
+             optimized: bool = False) -> Iterator[Result]:
+    global _runner
+
+    if _runner is None or (workers is not None and _runner.workers != workers) \
+            or _runner.engine != engine or _runner.optimized != optimized:
+        if _runner is not None:
+            _runner.shutdown()
+
+        _runner = BatchRunner(workers, engine, optimized)
+
+    return _runner.run_many(sources, timeout, ordered)
+
+
+def shutdown() -> None:
+    global _runner
+
+    if _runner is not None:
+        _runner.shutdown()
+        _runner = None
+
+
+def _warm_up() -> None:
+    for engine in ENGINES.values():
+        _evaluate(engine, _WARM_UP_SOURCE, False)
+
+
+def _run_chunk(scripts: List[Tuple[int, str]],
+               engine_name: str,
+               optimized: bool,
+               timeout: Optional[float]) -> List[Result]:
+    engine = ENGINES[engine_name]
+    results: List[Result] = []
+
+    for position, source in scripts:
+        results.append(_run_script(position, source, engine, optimized, timeout))
+
+    return results
+
+
+def _run_script(position: int, source: str, engine: Engine, optimized: bool, timeout: Optional[float]) -> Result:
+    timed = False
+
+    if timeout is not None and hasattr(signal, 'setitimer'):
+        timed = True
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return encode(position, _evaluate(engine, source, optimized))
+    except _Timeout:
+        return Result(position, TIMEOUT, timeout, _TIMEOUT_MESSAGE.format(timeout))
+    except Exception as error:
+        return encode(position, Error(f'{type(error).__name__}: {error}'))
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _evaluate(engine: Engine, source: str, optimized: bool) -> Optional[Object]:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+
+    if len(parser.errors) > 0:
+        return Error('\n'.join(parser.errors))
+
+    if optimized:
+        from cantte.optimizer import optimize
+
+        program = optimize(program)
+
+    return engine(program, Environment())
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise _Timeout()
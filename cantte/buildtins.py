@@ -1,22 +1,153 @@
-from typing import cast, Dict
-from cantte.object import Builtin, Error, Integer, Object, String
+from typing import Any, cast, Dict
+
+import cantte.limits as limits
+from cantte.memo import memo
+from cantte.object import (Array, Boolean, Builtin, Error, Hash, HashKey, Integer,
+                           new_array, new_integer, Object, Range, String)
 
 
 _WRONG_NUMBER_OF_ARGS = 'Wrong number of arguments. {} received, {} expected'
 _UNSUPPORTED_ARGUMENT_TYPE = 'Argument of type \'{}\' is not supported'
+_UNUSABLE_HASH_KEY = 'Unusable as hash key: {}'
 
 
 def size(*args: Object) -> Object:
     if len(args) != 1:
         return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 1))
     elif type(args[0]) == String:
-        argument = cast(String, args[0])
-
-        return Integer(len(argument.value))
+        return new_integer(len(cast(String, args[0])))
+    elif type(args[0]) == Array:
+        return new_integer(len(cast(Array, args[0])))
+    elif type(args[0]) == Hash:
+        return new_integer(len(cast(Hash, args[0])))
+    elif type(args[0]) == Range:
+        return new_integer(len(cast(Range, args[0])))
     else:
         return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
 
 
+def first(*args: Object) -> Object:
+    from cantte.evaluator import NULL
+
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 1))
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    element = cast(Array, args[0]).get(0)
+
+    return element if element is not None else NULL
+
+
+def last(*args: Object) -> Object:
+    from cantte.evaluator import NULL
+
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 1))
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    argument = cast(Array, args[0])
+    element = argument.get(len(argument) - 1)
+
+    return element if element is not None else NULL
+
+
+def rest(*args: Object) -> Object:
+    from cantte.evaluator import NULL
+
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 1))
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    argument = cast(Array, args[0])
+
+    if len(argument) == 0:
+        return NULL
+
+    return argument.slice(1, len(argument))
+
+
+def push(*args: Object) -> Object:
+    if len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 2))
+    elif type(args[0]) != Array:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    budget = limits.active.get()
+
+    if budget is not None:
+        budget.check_size(len(cast(Array, args[0])) + 1)
+
+    return cast(Array, args[0]).append(args[1])
+
+
+def keys(*args: Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 1))
+    elif type(args[0]) != Hash:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    return new_array([_key_object(key) for key in cast(Hash, args[0]).pairs])
+
+
+def values(*args: Object) -> Object:
+    if len(args) != 1:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 1))
+    elif type(args[0]) != Hash:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    return new_array(list(cast(Hash, args[0]).pairs.values()))
+
+
+def has(*args: Object) -> Object:
+    from cantte.evaluator import FALSE, TRUE
+
+    if len(args) != 2:
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 2))
+    elif type(args[0]) != Hash:
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+    elif type(args[1]) not in (Integer, String, Boolean):
+        return Error(_UNUSABLE_HASH_KEY.format(args[1].type().name))
+
+    return TRUE if cast(Any, args[1]).hash_key() in cast(Hash, args[0]).pairs else FALSE
+
+
+def range_(*args: Object) -> Object:
+    if len(args) not in (1, 2):
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), '1 or 2'))
+
+    for arg in args:
+        if type(arg) != Integer:
+            return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(arg.type().name))
+
+    if len(args) == 1:
+        return Range(0, cast(Integer, args[0]).value)
+
+    return Range(cast(Integer, args[0]).value, cast(Integer, args[1]).value)
+
+
+def _key_object(key: HashKey) -> Object:
+    from cantte.evaluator import FALSE, TRUE
+
+    if type(key) is int:
+        return new_integer(cast(int, key))
+    elif type(key) is str:
+        return String(cast(str, key))
+
+    return TRUE if cast(tuple, key)[1] else FALSE
+
+
 BUILTINS: Dict[str, Builtin] = {
     'size': Builtin(function=size),
+    'memo': Builtin(function=memo),
+    'first': Builtin(function=first),
+    'last': Builtin(function=last),
+    'rest': Builtin(function=rest),
+    'push': Builtin(function=push),
+    'keys': Builtin(function=keys),
+    'values': Builtin(function=values),
+    'has': Builtin(function=has),
+    'range': Builtin(function=range_),
 }
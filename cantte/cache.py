@@ -0,0 +1,320 @@
+import gc
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from typing import Any, cast, Dict, List, Optional, Tuple, Type, Union
+
+import cantte
+import cantte.ast as ast
+from cantte.lexer import Lexer
+from cantte.parser import Parser
+from cantte.token import Token, TokenType
+
+FORMAT_VERSION: int = 5
+DEFAULT_MAX_BYTES: int = 64 * 2 ** 20
+
+_EXTENSION = '.ast'
+
+_IDENTIFIER = 0
+_INTEGER = 1
+_INFIX = 2
+_EXPRESSION_STATEMENT = 3
+_CALL = 4
+_STRING_LITERAL = 5
+_LET_STATEMENT = 6
+_RETURN_STATEMENT = 7
+_BLOCK = 8
+_IF = 9
+_FUNCTION = 10
+_BOOLEAN = 11
+_PREFIX = 12
+_ARRAY_LITERAL = 13
+_INDEX = 14
+_HASH_LITERAL = 15
+_ASSIGN_STATEMENT = 16
+_WHILE_STATEMENT = 17
+_FOR_STATEMENT = 18
+
+_TOKEN_TYPES: Dict[int, TokenType] = {token_type.value: token_type for token_type in TokenType}
+
+
+def version_tag() -> str:
+    return f'{cantte.__version__}-{FORMAT_VERSION}-py{sys.version_info[0]}{sys.version_info[1]}'
+
+
+def serialize(program: ast.Program) -> bytes:
+    tokens: List[Tuple[int, str, int]] = []
+    token_indexes: Dict[Tuple[int, str, int], int] = {}
+
+    def token_index(token: Token) -> int:
+        key = (token.token_type.value, token.literal, token.offset)
+
+        try:
+            return token_indexes[key]
+        except KeyError:
+            token_indexes[key] = len(tokens)
+            tokens.append(key)
+
+            return token_indexes[key]
+
+    def encode(node: Optional[ast.ASTNode]) -> Any:
+        if node is None:
+            return None
+
+        node_type: Type = type(node)
+        token = token_index(cast(Union[ast.Statement, ast.Expression], node).token)
+
+        if node_type == ast.Identifier:
+            return _IDENTIFIER, token, cast(ast.Identifier, node).value
+        elif node_type == ast.Integer:
+            return _INTEGER, token, cast(ast.Integer, node).value
+        elif node_type == ast.Infix:
+            infix = cast(ast.Infix, node)
+            return _INFIX, token, encode(infix.left), infix.operator, encode(infix.right)
+        elif node_type == ast.ExpressionStatement:
+            return _EXPRESSION_STATEMENT, token, encode(cast(ast.ExpressionStatement, node).expression)
+        elif node_type == ast.Call:
+            call = cast(ast.Call, node)
+            return _CALL, token, encode(call.function), [encode(argument) for argument in call.arguments or []]
+        elif node_type == ast.StringLiteral:
+            return _STRING_LITERAL, token, cast(ast.StringLiteral, node).value
+        elif node_type == ast.LetStatement:
+            let_statement = cast(ast.LetStatement, node)
+            return _LET_STATEMENT, token, encode(let_statement.name), encode(let_statement.value)
+        elif node_type == ast.ReturnStatement:
+            return _RETURN_STATEMENT, token, encode(cast(ast.ReturnStatement, node).return_value)
+        elif node_type == ast.Block:
+            return _BLOCK, token, [encode(statement) for statement in cast(ast.Block, node).statements]
+        elif node_type == ast.If:
+            if_expression = cast(ast.If, node)
+            return (_IF, token, encode(if_expression.condition), encode(if_expression.consequence),
+                    encode(if_expression.alternative))
+        elif node_type == ast.Function:
+            function = cast(ast.Function, node)
+            return _FUNCTION, token, [encode(parameter) for parameter in function.parameters], encode(function.body)
+        elif node_type == ast.Boolean:
+            return _BOOLEAN, token, cast(ast.Boolean, node).value
+        elif node_type == ast.Prefix:
+            prefix = cast(ast.Prefix, node)
+            return _PREFIX, token, prefix.operator, encode(prefix.right)
+        elif node_type == ast.ArrayLiteral:
+            array = cast(ast.ArrayLiteral, node)
+            return _ARRAY_LITERAL, token, [encode(element) for element in array.elements or []]
+        elif node_type == ast.Index:
+            index = cast(ast.Index, node)
+            return _INDEX, token, encode(index.left), encode(index.index)
+        elif node_type == ast.HashLiteral:
+            pairs = cast(ast.HashLiteral, node).pairs or []
+            return _HASH_LITERAL, token, [(encode(key), encode(value)) for key, value in pairs]
+        elif node_type == ast.AssignStatement:
+            assign_statement = cast(ast.AssignStatement, node)
+            return _ASSIGN_STATEMENT, token, encode(assign_statement.name), encode(assign_statement.value)
+        elif node_type == ast.WhileStatement:
+            while_statement = cast(ast.WhileStatement, node)
+            return _WHILE_STATEMENT, token, encode(while_statement.condition), encode(while_statement.body)
+        elif node_type == ast.ForStatement:
+            for_statement = cast(ast.ForStatement, node)
+            return (_FOR_STATEMENT, token, encode(for_statement.name), encode(for_statement.iterable),
+                    encode(for_statement.body))
+
+        raise ValueError(f'Cannot serialize {node_type.__name__}')
+
+    statements = [encode(statement) for statement in program.statements]
+
+    return marshal.dumps((FORMAT_VERSION, tokens, statements))
+
+
+def deserialize(data: bytes) -> ast.Program:
+    format_version, token_data, statements = marshal.loads(data)
+
+    if format_version != FORMAT_VERSION:
+        raise ValueError(f'Unsupported format version {format_version}')
+
+    tokens: List[Token] = [Token(_TOKEN_TYPES[token_type], literal, offset)
+                           for token_type, literal, offset in token_data]
+
+    def decode(value: Any) -> Any:
+        if value is None:
+            return None
+
+        code = value[0]
+
+        if code == _IDENTIFIER:
+            return ast.Identifier(tokens[value[1]], value[2])
+        elif code == _INTEGER:
+            return ast.Integer(tokens[value[1]], value[2])
+        elif code == _INFIX:
+            return ast.Infix(tokens[value[1]], decode(value[2]), value[3], decode(value[4]))
+        elif code == _EXPRESSION_STATEMENT:
+            return ast.ExpressionStatement(tokens[value[1]], decode(value[2]))
+        elif code == _CALL:
+            return ast.Call(tokens[value[1]], decode(value[2]), [decode(argument) for argument in value[3]])
+        elif code == _STRING_LITERAL:
+            return ast.StringLiteral(tokens[value[1]], value[2])
+        elif code == _LET_STATEMENT:
+            return ast.LetStatement(tokens[value[1]], decode(value[2]), decode(value[3]))
+        elif code == _RETURN_STATEMENT:
+            return ast.ReturnStatement(tokens[value[1]], decode(value[2]))
+        elif code == _BLOCK:
+            return ast.Block(tokens[value[1]], [decode(statement) for statement in value[2]])
+        elif code == _IF:
+            return ast.If(tokens[value[1]], decode(value[2]), decode(value[3]), decode(value[4]))
+        elif code == _FUNCTION:
+            return ast.Function(tokens[value[1]], [decode(parameter) for parameter in value[2]], decode(value[3]))
+        elif code == _BOOLEAN:
+            return ast.Boolean(tokens[value[1]], value[2])
+        elif code == _PREFIX:
+            return ast.Prefix(tokens[value[1]], value[2], decode(value[3]))
+        elif code == _ARRAY_LITERAL:
+            return ast.ArrayLiteral(tokens[value[1]], [decode(element) for element in value[2]])
+        elif code == _INDEX:
+            return ast.Index(tokens[value[1]], decode(value[2]), decode(value[3]))
+        elif code == _HASH_LITERAL:
+            return ast.HashLiteral(tokens[value[1]],
+                                   [(decode(key), decode(pair_value)) for key, pair_value in value[2]])
+        elif code == _ASSIGN_STATEMENT:
+            return ast.AssignStatement(tokens[value[1]], decode(value[2]), decode(value[3]))
+        elif code == _WHILE_STATEMENT:
+            return ast.WhileStatement(tokens[value[1]], decode(value[2]), decode(value[3]))
+        elif code == _FOR_STATEMENT:
+            return ast.ForStatement(tokens[value[1]], decode(value[2]), decode(value[3]), decode(value[4]))
+
+        raise ValueError(f'Unknown node code {code}')
+
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return ast.Program([decode(statement) for statement in statements])
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def default_directory() -> str:
+    directory = os.environ.get('CANTTE_CACHE_DIR')
+
+    if directory is not None:
+        return directory
+
+    return os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser(os.path.join('~', '.cache'))), 'cantte')
+
+
+class ParseCache:
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory if directory is not None else default_directory()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._tag = version_tag()
+
+    def parse(self, source: str) -> Tuple[ast.Program, List[str]]:
+        path = self._path(source)
+        program = self._load(path)
+
+        if program is not None:
+            self.hits += 1
+            return program, []
+
+        self.misses += 1
+        parser = Parser(Lexer(source))
+        program = parser.parse_program()
+
+        if len(parser.errors) == 0:
+            self._store(path, program)
+
+        return program, parser.errors
+
+    def clear(self) -> None:
+        for name, _, _ in self._entries():
+            _remove(os.path.join(self.directory, name))
+
+    def _path(self, source: str) -> str:
+        digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+        return os.path.join(self.directory, f'{self._tag}-{digest}{_EXTENSION}')
+
+    def _load(self, path: str) -> Optional[ast.Program]:
+        try:
+            with open(path, 'rb') as cache_file:
+                data = cache_file.read()
+        except OSError:
+            return None
+
+        try:
+            program = deserialize(data)
+        except (EOFError, ValueError, TypeError, IndexError, KeyError, RecursionError):
+            _remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return program
+
+    def _store(self, path: str, program: ast.Program) -> None:
+        temporary_path: Optional[str] = None
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(descriptor, 'wb') as cache_file:
+                cache_file.write(serialize(program))
+            os.replace(temporary_path, path)
+        except (OSError, ValueError, RecursionError):
+            if temporary_path is not None:
+                _remove(temporary_path)
+            return
+
+        self._evict()
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        entries: List[Tuple[str, float, int]] = []
+
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+
+        for name in names:
+            if not name.endswith(_EXTENSION):
+                continue
+
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+
+            entries.append((name, stat.st_mtime, stat.st_size))
+
+        return entries
+
+    def _evict(self) -> None:
+        current: List[Tuple[str, float, int]] = []
+
+        for name, modified, size in self._entries():
+            if name.startswith(f'{self._tag}-'):
+                current.append((name, modified, size))
+            else:
+                _remove(os.path.join(self.directory, name))
+
+        total = sum(size for _, _, size in current)
+
+        for name, _, size in sorted(current, key=lambda entry: entry[1]):
+            if total <= self.max_bytes:
+                break
+
+            _remove(os.path.join(self.directory, name))
+            total -= size
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
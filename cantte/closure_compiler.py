@@ -0,0 +1,492 @@
+from operator import add, eq, floordiv, gt, lt, mul, ne, sub
+from typing import Any, Callable, cast, Dict, Iterator, List, Optional, Type
+
+import cantte.ast as ast
+from cantte.buildtins import BUILTINS
+from cantte.evaluator import (FALSE, NULL, TRUE, _apply_function,
+                              _evaluate_index_expression, _evaluate_infix_expression,
+                              _evaluate_prefix_expression, _iterate, _locate_error, _new_error,
+                              _new_hash, _NOT_A_FUNCTION, _UNKNOWN_IDENTIFIER, _WRONG_NUMBER_OF_ARGUMENTS)
+from cantte.object import (Builtin, Environment, Error, Function, Integer,
+                           new_array, new_integer, Object, Return, String)
+
+Code = Callable[[Environment], Optional[Object]]
+
+_ARITHMETIC_OPERATIONS: Dict[str, Callable[[Any, Any], int]] = {
+    '+': add,
+    '-': sub,
+    '*': mul,
+    '/': floordiv,
+}
+
+_COMPARISON_OPERATIONS: Dict[str, Callable[[Any, Any], bool]] = {
+    '<': lt,
+    '>': gt,
+    '==': eq,
+    '!=': ne,
+}
+
+
+class CompiledFunction(Function):
+
+    __slots__ = ('code',)
+
+    def __init__(self, parameters: List[ast.Identifier], body: ast.Block, env: Environment, code: Code) -> None:
+        super().__init__(parameters, body, env)
+        self.code = code
+
+
+def compile_program(program: ast.Program) -> Code:
+    return _ClosureCompiler().compile(program)
+
+
+def _call(function: Object, args: List[Object]) -> Object:
+    if isinstance(function, CompiledFunction):
+        if len(args) != len(function.parameters):
+            return _new_error(_WRONG_NUMBER_OF_ARGUMENTS, [len(function.parameters), len(args)])
+
+        env = Environment(outer=function.env)
+
+        for idx, param in enumerate(function.parameters):
+            env[param.value] = args[idx]
+
+        evaluated = function.code(env)
+
+        if evaluated is None:
+            return NULL
+        elif isinstance(evaluated, Return):
+            return evaluated.value
+        return evaluated
+    elif isinstance(function, Builtin):
+        return function.function(*args)
+    elif isinstance(function, Function):
+        return _apply_function(function, args)
+    else:
+        return _new_error(_NOT_A_FUNCTION, [function.type().name])
+
+
+class _ClosureCompiler:
+
+    def __init__(self) -> None:
+        self._compilers: Dict[Type, Callable[[ast.ASTNode], Code]] = {
+            ast.Program: self._compile_program,
+            ast.ExpressionStatement: self._compile_expression_statement,
+            ast.Integer: self._compile_integer,
+            ast.Boolean: self._compile_boolean,
+            ast.Prefix: self._compile_prefix,
+            ast.Infix: self._compile_infix,
+            ast.Block: self._compile_block,
+            ast.If: self._compile_if,
+            ast.ReturnStatement: self._compile_return_statement,
+            ast.LetStatement: self._compile_let_statement,
+            ast.AssignStatement: self._compile_assign_statement,
+            ast.WhileStatement: self._compile_while_statement,
+            ast.ForStatement: self._compile_for_statement,
+            ast.Identifier: self._compile_identifier,
+            ast.Function: self._compile_function,
+            ast.Call: self._compile_call,
+            ast.StringLiteral: self._compile_string_literal,
+            ast.ArrayLiteral: self._compile_array_literal,
+            ast.Index: self._compile_index,
+            ast.HashLiteral: self._compile_hash_literal,
+        }
+
+    def compile(self, node: ast.ASTNode) -> Code:
+        try:
+            compiler = self._compilers[type(node)]
+        except KeyError:
+            raise ValueError(f'Cannot compile {type(node).__name__}')
+
+        return compiler(node)
+
+    def _compile_program(self, node: ast.ASTNode) -> Code:
+        nodes = cast(ast.Program, node).statements
+        statements = [self.compile(statement) for statement in nodes]
+
+        def program(env: Environment) -> Optional[Object]:
+            result: Optional[Object] = None
+
+            for idx, statement in enumerate(statements):
+                result = statement(env)
+
+                if isinstance(result, Return):
+                    return result.value
+                elif isinstance(result, Error):
+                    return _locate_error(result, nodes[idx])
+
+            return result
+
+        return program
+
+    def _compile_expression_statement(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.ExpressionStatement, node)
+
+        assert node.expression is not None
+
+        return self.compile(node.expression)
+
+    def _compile_integer(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.Integer, node)
+
+        assert node.value is not None
+
+        value = new_integer(node.value)
+
+        return lambda env: value
+
+    def _compile_boolean(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.Boolean, node)
+
+        assert node.value is not None
+
+        value = TRUE if node.value else FALSE
+
+        return lambda env: value
+
+    def _compile_string_literal(self, node: ast.ASTNode) -> Code:
+        value = String(cast(ast.StringLiteral, node).value)
+
+        return lambda env: value
+
+    def _compile_prefix(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.Prefix, node)
+
+        assert node.right is not None
+
+        right = self.compile(node.right)
+        operator = node.operator
+
+        if operator == '!':
+            def bang(env: Environment) -> Optional[Object]:
+                value = right(env)
+
+                return TRUE if value is FALSE or value is NULL else FALSE
+
+            return bang
+        elif operator == '-':
+            def minus(env: Environment) -> Optional[Object]:
+                value = right(env)
+
+                if isinstance(value, Integer):
+                    return new_integer(-value.value)
+
+                assert value is not None
+
+                return _evaluate_prefix_expression(operator, value)
+
+            return minus
+
+        def prefix(env: Environment) -> Optional[Object]:
+            value = right(env)
+
+            assert value is not None
+
+            return _evaluate_prefix_expression(operator, value)
+
+        return prefix
+
+    def _compile_infix(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.Infix, node)
+
+        assert node.left is not None and node.right is not None
+
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        operator = node.operator
+        arithmetic = _ARITHMETIC_OPERATIONS.get(operator)
+        comparison = _COMPARISON_OPERATIONS.get(operator)
+
+        if arithmetic is not None:
+            def arithmetic_infix(env: Environment) -> Optional[Object]:
+                left_value = left(env)
+                right_value = right(env)
+
+                if isinstance(left_value, Integer) and isinstance(right_value, Integer):
+                    return new_integer(arithmetic(left_value.value, right_value.value))
+
+                assert left_value is not None and right_value is not None
+
+                return _evaluate_infix_expression(operator, left_value, right_value)
+
+            return arithmetic_infix
+        elif comparison is not None:
+            def comparison_infix(env: Environment) -> Optional[Object]:
+                left_value = left(env)
+                right_value = right(env)
+
+                if isinstance(left_value, Integer) and isinstance(right_value, Integer):
+                    if comparison(left_value.value, right_value.value):
+                        return TRUE
+                    return FALSE
+
+                assert left_value is not None and right_value is not None
+
+                return _evaluate_infix_expression(operator, left_value, right_value)
+
+            return comparison_infix
+
+        def infix(env: Environment) -> Optional[Object]:
+            left_value = left(env)
+            right_value = right(env)
+
+            assert left_value is not None and right_value is not None
+
+            return _evaluate_infix_expression(operator, left_value, right_value)
+
+        return infix
+
+    def _compile_block(self, node: ast.ASTNode) -> Code:
+        nodes = cast(ast.Block, node).statements
+        statements = [self.compile(statement) for statement in nodes]
+
+        def block(env: Environment) -> Optional[Object]:
+            result: Optional[Object] = None
+
+            for idx, statement in enumerate(statements):
+                result = statement(env)
+
+                if isinstance(result, Return):
+                    return result
+                elif isinstance(result, Error):
+                    return _locate_error(result, nodes[idx])
+
+            return result
+
+        return block
+
+    def _compile_if(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.If, node)
+
+        assert node.condition is not None and node.consequence is not None
+
+        condition = self.compile(node.condition)
+        consequence = self.compile(node.consequence)
+        alternative = self.compile(node.alternative) if node.alternative is not None else None
+
+        def if_expression(env: Environment) -> Optional[Object]:
+            value = condition(env)
+
+            if value is not FALSE and value is not NULL:
+                return consequence(env)
+            elif alternative is not None:
+                return alternative(env)
+            else:
+                return NULL
+
+        return if_expression
+
+    def _compile_return_statement(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.ReturnStatement, node)
+
+        assert node.return_value is not None
+
+        return_value = self.compile(node.return_value)
+
+        def return_statement(env: Environment) -> Optional[Object]:
+            value = return_value(env)
+
+            assert value is not None
+
+            if type(value) is Error:
+                return value
+
+            return Return(value)
+
+        return return_statement
+
+    def _compile_let_statement(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.LetStatement, node)
+
+        assert node.name is not None and node.value is not None
+
+        name = node.name.value
+        value = self.compile(node.value)
+
+        def let_statement(env: Environment) -> Optional[Object]:
+            env[name] = value(env)
+
+            return None
+
+        return let_statement
+
+    def _compile_assign_statement(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.AssignStatement, node)
+
+        assert node.name is not None and node.value is not None
+
+        name = node.name.value
+        value = self.compile(node.value)
+
+        def assign_statement(env: Environment) -> Optional[Object]:
+            evaluated = value(env)
+
+            if type(evaluated) is Error:
+                return evaluated
+            elif env.assign(name, evaluated):
+                return None
+
+            return _new_error(_UNKNOWN_IDENTIFIER, [name])
+
+        return assign_statement
+
+    def _compile_while_statement(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.WhileStatement, node)
+
+        assert node.condition is not None and node.body is not None
+
+        condition = self.compile(node.condition)
+        body = self.compile(node.body)
+
+        def while_statement(env: Environment) -> Optional[Object]:
+            while True:
+                value = condition(env)
+
+                if value is FALSE or value is NULL:
+                    return None
+                elif type(value) is Error:
+                    return value
+
+                result = body(env)
+
+                if isinstance(result, (Return, Error)):
+                    return result
+
+        return while_statement
+
+    def _compile_for_statement(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.ForStatement, node)
+
+        assert node.name is not None and node.iterable is not None and node.body is not None
+
+        name = node.name.value
+        iterable = self.compile(node.iterable)
+        body = self.compile(node.body)
+
+        def for_statement(env: Environment) -> Optional[Object]:
+            evaluated = iterable(env)
+
+            assert evaluated is not None
+
+            values = _iterate(evaluated)
+
+            if type(values) is Error:
+                return values
+
+            for value in cast(Iterator[Object], values):
+                env[name] = value
+
+                result = body(env)
+
+                if isinstance(result, (Return, Error)):
+                    return result
+
+            return None
+
+        return for_statement
+
+    def _compile_identifier(self, node: ast.ASTNode) -> Code:
+        name = cast(ast.Identifier, node).value
+
+        def identifier(env: Environment) -> Optional[Object]:
+            try:
+                return env[name]
+            except KeyError:
+                return BUILTINS.get(name, _new_error(_UNKNOWN_IDENTIFIER, [name]))
+
+        return identifier
+
+    def _compile_function(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.Function, node)
+
+        assert node.body is not None
+
+        parameters = node.parameters
+        body = node.body
+        code = self.compile(body)
+
+        return lambda env: CompiledFunction(parameters, body, env, code)
+
+    def _compile_call(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.Call, node)
+
+        assert node.arguments is not None
+
+        function = self.compile(node.function)
+        arguments = [self.compile(argument) for argument in node.arguments]
+
+        def call(env: Environment) -> Optional[Object]:
+            function_value = function(env)
+            args: List[Object] = []
+
+            for argument in arguments:
+                evaluated = argument(env)
+
+                assert evaluated is not None
+
+                args.append(evaluated)
+
+            assert function_value is not None
+
+            return _call(function_value, args)
+
+        return call
+
+    def _compile_array_literal(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.ArrayLiteral, node)
+
+        assert node.elements is not None
+
+        elements = [self.compile(element) for element in node.elements]
+
+        def array_literal(env: Environment) -> Optional[Object]:
+            values: List[Object] = []
+
+            for element in elements:
+                evaluated = element(env)
+
+                assert evaluated is not None
+
+                values.append(evaluated)
+
+            return new_array(values)
+
+        return array_literal
+
+    def _compile_index(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.Index, node)
+
+        assert node.index is not None
+
+        left = self.compile(node.left)
+        index = self.compile(node.index)
+
+        def index_expression(env: Environment) -> Optional[Object]:
+            left_value = left(env)
+            index_value = index(env)
+
+            assert left_value is not None and index_value is not None
+
+            return _evaluate_index_expression(left_value, index_value)
+
+        return index_expression
+
+    def _compile_hash_literal(self, node: ast.ASTNode) -> Code:
+        node = cast(ast.HashLiteral, node)
+
+        assert node.pairs is not None
+
+        entries = [self.compile(expression) for pair in node.pairs for expression in pair]
+
+        def hash_literal(env: Environment) -> Optional[Object]:
+            values: List[Object] = []
+
+            for entry in entries:
+                evaluated = entry(env)
+
+                assert evaluated is not None
+
+                values.append(evaluated)
+
+            return _new_hash(values)
+
+        return hash_literal
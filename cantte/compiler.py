@@ -0,0 +1,381 @@
+from enum import IntEnum, unique
+from typing import cast, Dict, List, Optional, Union
+
+import cantte.ast as ast
+from cantte.object import new_integer, Object, String
+
+
+@unique
+class OpCode(IntEnum):
+    CONSTANT = 0
+    TRUE = 1
+    FALSE = 2
+    NULL = 3
+    NONE = 4
+    POP = 5
+    POP_STATEMENT = 6
+    ADD = 7
+    SUB = 8
+    MUL = 9
+    DIV = 10
+    EQUAL = 11
+    NOT_EQUAL = 12
+    LESS_THAN = 13
+    GREATER_THAN = 14
+    BANG = 15
+    MINUS = 16
+    JUMP = 17
+    JUMP_NOT_TRUTHY = 18
+    GET_NAME = 19
+    SET_NAME = 20
+    CLOSURE = 21
+    CALL = 22
+    RETURN_VALUE = 23
+    ARRAY = 24
+    INDEX = 25
+    HASH = 26
+    ASSIGN_NAME = 27
+    LOOP_TEST = 28
+    ITERATE = 29
+    FOR_ITER = 30
+    END_FOR = 31
+
+
+OPERAND_COUNTS: Dict[OpCode, int] = {
+    OpCode.CONSTANT: 1,
+    OpCode.POP_STATEMENT: 1,
+    OpCode.JUMP: 1,
+    OpCode.JUMP_NOT_TRUTHY: 1,
+    OpCode.GET_NAME: 1,
+    OpCode.SET_NAME: 1,
+    OpCode.CLOSURE: 1,
+    OpCode.CALL: 1,
+    OpCode.ARRAY: 1,
+    OpCode.HASH: 1,
+    OpCode.ASSIGN_NAME: 1,
+    OpCode.LOOP_TEST: 1,
+    OpCode.ITERATE: 1,
+    OpCode.FOR_ITER: 1,
+}
+
+INFIX_OPCODES: Dict[str, OpCode] = {
+    '+': OpCode.ADD,
+    '-': OpCode.SUB,
+    '*': OpCode.MUL,
+    '/': OpCode.DIV,
+    '==': OpCode.EQUAL,
+    '!=': OpCode.NOT_EQUAL,
+    '<': OpCode.LESS_THAN,
+    '>': OpCode.GREATER_THAN,
+}
+
+PREFIX_OPCODES: Dict[str, OpCode] = {
+    '!': OpCode.BANG,
+    '-': OpCode.MINUS,
+}
+
+
+class FunctionCode:
+
+    def __init__(self,
+                 instructions: List[int],
+                 constants: List['Constant'],
+                 names: List[str],
+                 parameters: List[ast.Identifier],
+                 body: Optional[ast.Block] = None,
+                 offsets: Optional[List[int]] = None) -> None:
+        self.instructions = instructions
+        self.constants = constants
+        self.names = names
+        self.parameters = parameters
+        self.parameter_names = [parameter.value for parameter in parameters]
+        self.body = body
+        self.offsets = offsets if offsets is not None else [-1] * len(instructions)
+
+
+Constant = Union[Object, FunctionCode]
+
+
+class Bytecode:
+
+    def __init__(self, main: FunctionCode, constants: List[Constant], names: List[str]) -> None:
+        self.main = main
+        self.constants = constants
+        self.names = names
+
+    def __str__(self) -> str:
+        out: List[str] = [disassemble(self.main.instructions)]
+
+        for idx, constant in enumerate(self.constants):
+            if isinstance(constant, FunctionCode):
+                out.append(f'constant {idx}:\n{disassemble(constant.instructions)}')
+
+        return '\n'.join(out)
+
+
+def disassemble(instructions: List[int]) -> str:
+    out: List[str] = []
+    ip: int = 0
+
+    while ip < len(instructions):
+        opcode = OpCode(instructions[ip])
+        operand_count = OPERAND_COUNTS.get(opcode, 0)
+        operands = instructions[ip + 1:ip + 1 + operand_count]
+
+        out.append(' '.join([f'{ip:04d}', opcode.name] + [str(operand) for operand in operands]))
+        ip += 1 + operand_count
+
+    return '\n'.join(out)
+
+
+class Compiler:
+
+    def __init__(self) -> None:
+        self._constants: List[Constant] = []
+        self._names: List[str] = []
+        self._name_indexes: Dict[str, int] = {}
+        self._instructions: List[int] = []
+        self._offsets: List[int] = []
+        self._offset: int = -1
+
+    def compile_program(self, program: ast.Program) -> Bytecode:
+        self._compile_statements(program.statements)
+        self._emit(OpCode.RETURN_VALUE)
+
+        main = FunctionCode(self._instructions, self._constants, self._names, [], offsets=self._offsets)
+
+        return Bytecode(main, self._constants, self._names)
+
+    def _add_constant(self, constant: Constant) -> int:
+        self._constants.append(constant)
+
+        return len(self._constants) - 1
+
+    def _add_name(self, name: str) -> int:
+        try:
+            return self._name_indexes[name]
+        except KeyError:
+            self._names.append(name)
+            self._name_indexes[name] = len(self._names) - 1
+
+            return self._name_indexes[name]
+
+    def _emit(self, opcode: OpCode, *operands: int) -> int:
+        position = len(self._instructions)
+
+        self._instructions.append(opcode.value)
+        self._instructions.extend(operands)
+        self._offsets.extend([self._offset] * (1 + len(operands)))
+
+        return position
+
+    def _patch_operand(self, position: int, operand: int) -> None:
+        self._instructions[position + 1] = operand
+
+    def _compile_statements(self, statements: List[ast.Statement]) -> None:
+        if len(statements) == 0:
+            self._emit(OpCode.NONE)
+            return
+
+        exits: List[int] = []
+        enclosing_offset = self._offset
+
+        for statement in statements[:-1]:
+            self._offset = statement.offset
+
+            if type(statement) == ast.LetStatement:
+                self._compile_let_statement(cast(ast.LetStatement, statement))
+            else:
+                self._compile_statement(statement)
+                exits.append(self._emit(OpCode.POP_STATEMENT, 0))
+
+        self._offset = statements[-1].offset
+        self._compile_statement(statements[-1])
+        self._offset = enclosing_offset
+
+        for position in exits:
+            self._patch_operand(position, len(self._instructions))
+
+    def _compile_statement(self, statement: ast.Statement) -> None:
+        statement_type = type(statement)
+
+        if statement_type == ast.ExpressionStatement:
+            statement = cast(ast.ExpressionStatement, statement)
+
+            assert statement.expression is not None
+
+            self._compile_expression(statement.expression)
+        elif statement_type == ast.LetStatement:
+            self._compile_let_statement(cast(ast.LetStatement, statement))
+            self._emit(OpCode.NONE)
+        elif statement_type == ast.ReturnStatement:
+            statement = cast(ast.ReturnStatement, statement)
+
+            assert statement.return_value is not None
+
+            self._compile_expression(statement.return_value)
+            self._emit(OpCode.RETURN_VALUE)
+        elif statement_type == ast.Block:
+            self._compile_statements(cast(ast.Block, statement).statements)
+        elif statement_type == ast.AssignStatement:
+            statement = cast(ast.AssignStatement, statement)
+
+            assert statement.name is not None and statement.value is not None
+
+            self._compile_expression(statement.value)
+            self._emit(OpCode.ASSIGN_NAME, self._add_name(statement.name.value))
+        elif statement_type == ast.WhileStatement:
+            self._compile_while_statement(cast(ast.WhileStatement, statement))
+        elif statement_type == ast.ForStatement:
+            self._compile_for_statement(cast(ast.ForStatement, statement))
+        else:
+            self._emit(OpCode.NONE)
+
+    def _compile_let_statement(self, statement: ast.LetStatement) -> None:
+        assert statement.name is not None and statement.value is not None
+
+        self._compile_expression(statement.value)
+        self._emit(OpCode.SET_NAME, self._add_name(statement.name.value))
+
+    def _compile_while_statement(self, statement: ast.WhileStatement) -> None:
+        assert statement.condition is not None and statement.body is not None
+
+        start = len(self._instructions)
+
+        self._compile_expression(statement.condition)
+        loop_test = self._emit(OpCode.LOOP_TEST, 0)
+
+        self._compile_statements(statement.body.statements)
+        body_exit = self._emit(OpCode.POP_STATEMENT, 0)
+        self._emit(OpCode.JUMP, start)
+
+        self._patch_operand(loop_test, len(self._instructions))
+        self._patch_operand(body_exit, len(self._instructions))
+
+    def _compile_for_statement(self, statement: ast.ForStatement) -> None:
+        assert statement.name is not None and statement.iterable is not None and statement.body is not None
+
+        self._compile_expression(statement.iterable)
+        iterate = self._emit(OpCode.ITERATE, 0)
+
+        start = self._emit(OpCode.FOR_ITER, 0)
+        self._emit(OpCode.SET_NAME, self._add_name(statement.name.value))
+
+        self._compile_statements(statement.body.statements)
+        body_exit = self._emit(OpCode.POP_STATEMENT, 0)
+        self._emit(OpCode.JUMP, start)
+
+        self._patch_operand(body_exit, len(self._instructions))
+        self._emit(OpCode.END_FOR)
+
+        self._patch_operand(iterate, len(self._instructions))
+        self._patch_operand(start, len(self._instructions))
+
+    def _compile_expression(self, expression: ast.Expression) -> None:
+        expression_type = type(expression)
+
+        if expression_type == ast.Integer:
+            expression = cast(ast.Integer, expression)
+
+            assert expression.value is not None
+
+            self._emit(OpCode.CONSTANT, self._add_constant(new_integer(expression.value)))
+        elif expression_type == ast.StringLiteral:
+            expression = cast(ast.StringLiteral, expression)
+
+            self._emit(OpCode.CONSTANT, self._add_constant(String(expression.value)))
+        elif expression_type == ast.Boolean:
+            self._emit(OpCode.TRUE if cast(ast.Boolean, expression).value else OpCode.FALSE)
+        elif expression_type == ast.Prefix:
+            expression = cast(ast.Prefix, expression)
+
+            assert expression.right is not None
+
+            self._compile_expression(expression.right)
+            self._emit(PREFIX_OPCODES[expression.operator])
+        elif expression_type == ast.Infix:
+            expression = cast(ast.Infix, expression)
+
+            assert expression.left is not None and expression.right is not None
+
+            self._compile_expression(expression.left)
+            self._compile_expression(expression.right)
+            self._emit(INFIX_OPCODES[expression.operator])
+        elif expression_type == ast.Identifier:
+            self._emit(OpCode.GET_NAME, self._add_name(cast(ast.Identifier, expression).value))
+        elif expression_type == ast.If:
+            self._compile_if(cast(ast.If, expression))
+        elif expression_type == ast.Function:
+            self._compile_function(cast(ast.Function, expression))
+        elif expression_type == ast.Call:
+            expression = cast(ast.Call, expression)
+
+            assert expression.arguments is not None
+
+            self._compile_expression(expression.function)
+            for argument in expression.arguments:
+                self._compile_expression(argument)
+            self._emit(OpCode.CALL, len(expression.arguments))
+        elif expression_type == ast.ArrayLiteral:
+            expression = cast(ast.ArrayLiteral, expression)
+
+            assert expression.elements is not None
+
+            for element in expression.elements:
+                self._compile_expression(element)
+            self._emit(OpCode.ARRAY, len(expression.elements))
+        elif expression_type == ast.Index:
+            expression = cast(ast.Index, expression)
+
+            assert expression.index is not None
+
+            self._compile_expression(expression.left)
+            self._compile_expression(expression.index)
+            self._emit(OpCode.INDEX)
+        elif expression_type == ast.HashLiteral:
+            expression = cast(ast.HashLiteral, expression)
+
+            assert expression.pairs is not None
+
+            for key, value in expression.pairs:
+                self._compile_expression(key)
+                self._compile_expression(value)
+            self._emit(OpCode.HASH, len(expression.pairs))
+        else:
+            self._emit(OpCode.NONE)
+
+    def _compile_if(self, expression: ast.If) -> None:
+        assert expression.condition is not None and expression.consequence is not None
+
+        self._compile_expression(expression.condition)
+        jump_not_truthy = self._emit(OpCode.JUMP_NOT_TRUTHY, 0)
+
+        self._compile_statements(expression.consequence.statements)
+        jump = self._emit(OpCode.JUMP, 0)
+
+        self._patch_operand(jump_not_truthy, len(self._instructions))
+
+        if expression.alternative is not None:
+            self._compile_statements(expression.alternative.statements)
+        else:
+            self._emit(OpCode.NULL)
+
+        self._patch_operand(jump, len(self._instructions))
+
+    def _compile_function(self, function: ast.Function) -> None:
+        assert function.body is not None
+
+        enclosing_instructions = self._instructions
+        enclosing_offsets = self._offsets
+        self._instructions = []
+        self._offsets = []
+
+        self._compile_statements(function.body.statements)
+        self._emit(OpCode.RETURN_VALUE)
+
+        code = FunctionCode(self._instructions, self._constants, self._names, function.parameters, function.body,
+                            self._offsets)
+        self._instructions = enclosing_instructions
+        self._offsets = enclosing_offsets
+
+        self._emit(OpCode.CLOSURE, self._add_constant(code))
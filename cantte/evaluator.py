@@ -1,25 +1,45 @@
-from typing import Any, cast, List, Optional, Type
+from typing import Any, cast, Dict, Iterator, List, Optional, Tuple, Type, Union
 import cantte.ast as ast
+import cantte.limits as limits
 from cantte.object import (Integer, Object, Boolean,
                            Null, ObjectType, Return, Error,
-                           Environment, Function, String, Builtin)
+                           Environment, Function, String, Builtin,
+                           Cell, Frame, TailCall, UNBOUND, new_integer,
+                           Array, new_array, Hash, HashKey, Range)
 from cantte.buildtins import BUILTINS
+from cantte.resolver import resolve
 
 TRUE = Boolean(True)
 FALSE = Boolean(False)
 NULL = Null()
 
+FREE_FRAMES: int = 64
+
 _NOT_A_FUNCTION = 'Not function: {}'
+_WRONG_NUMBER_OF_ARGUMENTS = 'Wrong number of arguments: want={}, got={}'
 _TYPE_MISMATCH = 'Type mismatch: {} {} {}'
 _UNKNOWN_PREFIX_OPERATOR = 'Unknown operator: {}{}'
 _UNKNOWN_INFIX_OPERATOR = 'Unknown operator: {} {} {}'
 _UNKNOWN_IDENTIFIER = 'Unknown identifier: {}'
+_UNSUPPORTED_INDEX = 'Index operator not supported: {}[{}]'
+_UNUSABLE_HASH_KEY = 'Unusable as hash key: {}'
+_NOT_ITERABLE = 'Not iterable: {}'
+
+_HASHABLE_TYPES = (Integer, String, Boolean)
+_RELEASED: List[Any] = []
+_SMALL_INTEGER_MIN = -2 ** 63
+_SMALL_INTEGER_MAX = 2 ** 63 - 1
+_WORD_BITS = 64
 
 
-def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
+def evaluate(node: ast.ASTNode, env: Union[Frame, Environment]) -> Optional[Object]:
     node_type: Type = type(node)
 
-    if node_type == ast.Program:
+    if node_type == ast.Identifier:
+        node = cast(ast.Identifier, node)
+
+        return _evaluate_identifier(node, env)
+    elif node_type == ast.Program:
         node = cast(ast.Program, node)
 
         return _evaluate_program(node, env)
@@ -32,9 +52,12 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
     elif node_type == ast.Integer:
         node = cast(ast.Integer, node)
 
-        assert node.value is not None
+        if node.constant is None:
+            assert node.value is not None
+
+            node.constant = new_integer(node.value)
 
-        return Integer(node.value)
+        return node.constant
     elif node_type == ast.Boolean:
         node = cast(ast.Boolean, node)
 
@@ -81,6 +104,9 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         assert value is not None
 
+        if type(value) is Error:
+            return value
+
         return Return(value)
     elif node_type == ast.LetStatement:
         node = cast(ast.LetStatement, node)
@@ -91,19 +117,43 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         assert node.name is not None
 
-        env[node.name.value] = value
+        if node.name.depth >= 0:
+            cast(Frame, env).values[node.name.slot] = value
+        elif node.name.depth == ast.CELL:
+            cast(Frame, env).values[node.name.slot].value = value
+        else:
+            cast(Environment, env)[node.name.value] = value
 
-    elif node_type == ast.Identifier:
-        node = cast(ast.Identifier, node)
+    elif node_type == ast.AssignStatement:
+        node = cast(ast.AssignStatement, node)
 
-        return _evaluate_identifier(node, env)
+        assert node.name is not None and node.value is not None
+
+        value = evaluate(node.value, env)
+
+        assert value is not None
+
+        if type(value) is Error:
+            return value
+
+        return _assign(node.name, value, env)
+    elif node_type == ast.WhileStatement:
+        node = cast(ast.WhileStatement, node)
+
+        return _evaluate_while_statement(node, env)
+    elif node_type == ast.ForStatement:
+        node = cast(ast.ForStatement, node)
 
+        return _evaluate_for_statement(node, env)
     elif node_type == ast.Function:
         node = cast(ast.Function, node)
 
         assert node.body is not None
 
-        return Function(node.parameters, node.body, env)
+        if node.scope is None:
+            return Function(node.parameters, node.body, env)
+
+        return Function(node.parameters, node.body, env.globals, node.scope, _capture(node.scope, env))
 
     elif node_type == ast.Call:
         node = cast(ast.Call, node)
@@ -115,25 +165,97 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         assert function is not None
 
+        if node.tail:
+            return TailCall(function, args)
+
         return _apply_function(function, args)
     elif node_type == ast.StringLiteral:
         node = cast(ast.StringLiteral, node)
 
-        return String(node.value)
+        if node.constant is None:
+            node.constant = String(node.value)
+
+        return node.constant
+    elif node_type == ast.ArrayLiteral:
+        node = cast(ast.ArrayLiteral, node)
+
+        assert node.elements is not None
+
+        elements = _evaluate_expression(node.elements, env)
+
+        budget = limits.active.get()
+
+        if budget is not None:
+            budget.check_size(len(elements))
+
+        return new_array(elements)
+    elif node_type == ast.Index:
+        node = cast(ast.Index, node)
+
+        assert node.index is not None
+
+        left = evaluate(node.left, env)
+        index = evaluate(node.index, env)
+
+        assert left is not None and index is not None
+
+        return _evaluate_index_expression(left, index)
+    elif node_type == ast.HashLiteral:
+        node = cast(ast.HashLiteral, node)
+
+        assert node.pairs is not None
+
+        pairs: Dict[HashKey, Object] = {}
+
+        for key_node, value_node in node.pairs:
+            key = evaluate(key_node, env)
+
+            assert key is not None
+
+            if type(key) not in _HASHABLE_TYPES:
+                return _new_error(_UNUSABLE_HASH_KEY, [key.type().name])
+
+            value = evaluate(value_node, env)
+
+            assert value is not None
+
+            pairs[cast(Any, key).hash_key()] = value
+
+        budget = limits.active.get()
+
+        if budget is not None:
+            budget.check_size(len(pairs))
+
+        return Hash(pairs)
 
     return None
 
 
 def _apply_function(function: Object, args: List[Object]) -> Object:
-    if type(function) == Function:
-        function = cast(Function, function)
-        extended_environment = _extent_function_environment(function, args)
-        evaluated = evaluate(function.body, extended_environment)
+    budget = limits.active.get()
 
-        assert evaluated is not None
+    if budget is not None:
+        budget.enter()
+
+    while isinstance(function, Function):
+        evaluated = _evaluate_function_body(function, args)
 
-        return _unwrap_return_value(evaluated)
-    elif type(function) == Builtin:
+        if type(evaluated) is not TailCall:
+            if budget is not None:
+                budget.leave()
+
+            return evaluated
+
+        function = cast(TailCall, evaluated).function
+        args = cast(TailCall, evaluated).arguments
+
+        if budget is not None:
+            budget.step()
+
+    if budget is not None:
+        budget.leave()
+
+    if type(function) == Builtin:
         function = cast(Builtin, function)
 
         return function.function(*args)
@@ -141,29 +263,151 @@ def _apply_function(function: Object, args: List[Object]) -> Object:
         return _new_error(_NOT_A_FUNCTION, [function.type().name])
 
 
-def _extent_function_environment(function: Function, args: List[Object]) -> Environment:
-    env = Environment(outer=function.env)
+def _evaluate_function_body(function: Function, args: List[Object]) -> Object:
+    if len(args) != len(function.parameters):
+        return _new_error(_WRONG_NUMBER_OF_ARGUMENTS, [len(function.parameters), len(args)])
+
+    env = _extent_function_environment(function, args)
+    evaluated = evaluate(function.body, env)
+
+    if type(env) is Frame and not cast(Frame, env).scope.captures:
+        _release_frame(cast(Frame, env))
+
+    if evaluated is None:
+        return NULL
+
+    return _unwrap_return_value(evaluated)
+
+
+def _extent_function_environment(function: Function, args: List[Object]) -> Union[Frame, Environment]:
+    scope = function.scope
+
+    if scope is None:
+        env = Environment(outer=function.env)
+
+        for idx, param in enumerate(function.parameters):
+            env[param.value] = args[idx]
+
+        return env
+
+    values: List[Any] = args + [UNBOUND] * scope.locals if scope.locals else args[:]
+
+    if scope.cells:
+        for slot in scope.cells:
+            values[slot] = Cell(values[slot])
+
+        return Frame(scope, function.env, values, function.cells)
+
+    free = scope.free.frames
+
+    if free:
+        frame = free.pop()
+        frame.values = values
+        frame.outer = function.env
+        frame.globals = function.env.globals
+        frame.cells = function.cells
+
+        return frame
+
+    return Frame(scope, function.env, values, function.cells)
+
+
+def _release_frame(frame: Frame) -> None:
+    free = frame.scope.free.frames
+
+    if len(free) < FREE_FRAMES:
+        frame.values = _RELEASED
+        frame.cells = ()
+        free.append(frame)
 
-    for idx, param in enumerate(function.parameters):
-        env[param.value] = args[idx - 1]
 
-    return env
+def _capture(scope: ast.Scope, env: Union[Frame, Environment]) -> Tuple[Cell, ...]:
+    if not scope.closure:
+        return ()
 
+    frame = cast(Frame, env)
 
-def _evaluate_block_statement(block: ast.Block, env: Environment) -> Optional[Object]:
+    return tuple(frame.values[index] if local else frame.cells[index] for local, index in scope.closure)
+
+
+def _evaluate_block_statement(block: ast.Block, env: Union[Frame, Environment]) -> Optional[Object]:
     result: Optional[Object] = None
 
     for statement in block.statements:
         result = evaluate(statement, env)
 
         if result is not None and \
-                result.type() == ObjectType.RETURN or result.type() == ObjectType.ERROR:
+                (result.type() == ObjectType.RETURN or result.type() == ObjectType.ERROR):
+            if type(result) is Error:
+                return _locate_error(cast(Error, result), statement)
+
             return result
 
     return result
 
 
-def _evaluate_expression(expressions: List[ast.Expression], env: Environment) -> List[Object]:
+def _evaluate_while_statement(statement: ast.WhileStatement, env: Union[Frame, Environment]) -> Optional[Object]:
+    assert statement.condition is not None and statement.body is not None
+
+    condition_node = statement.condition
+    body = statement.body
+    budget = limits.active.get()
+
+    while True:
+        if budget is not None:
+            budget.step()
+
+        condition = evaluate(condition_node, env)
+
+        assert condition is not None
+
+        if type(condition) is Error:
+            return condition
+        elif not _is_truthy(condition):
+            return None
+
+        result = evaluate(body, env)
+
+        if type(result) is Return or type(result) is Error:
+            return result
+
+
+def _evaluate_for_statement(statement: ast.ForStatement, env: Union[Frame, Environment]) -> Optional[Object]:
+    assert statement.name is not None and statement.iterable is not None and statement.body is not None
+
+    iterable = evaluate(statement.iterable, env)
+
+    assert iterable is not None
+
+    values = _iterate(iterable)
+
+    if type(values) is Error:
+        return values
+
+    name = statement.name
+    body = statement.body
+    budget = limits.active.get()
+
+    for value in cast(Iterator[Object], values):
+        if budget is not None:
+            budget.step()
+
+        if name.depth >= 0:
+            cast(Frame, env).values[name.slot] = value
+        elif name.depth == ast.CELL:
+            cast(Frame, env).values[name.slot].value = value
+        else:
+            cast(Environment, env)[name.value] = value
+
+        result = evaluate(body, env)
+
+        if type(result) is Return or type(result) is Error:
+            return result
+
+    return None
+
+
+def _evaluate_expression(expressions: List[ast.Expression], env: Union[Frame, Environment]) -> List[Object]:
     result: List[Object] = []
 
     for expression in expressions:
@@ -175,7 +419,7 @@ def _evaluate_expression(expressions: List[ast.Expression], env: Environment) ->
     return result
 
 
-def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Optional[Object]:
+def _evaluate_if_expression(if_expression: ast.If, env: Union[Frame, Environment]) -> Optional[Object]:
     assert if_expression.condition is not None
 
     condition = evaluate(if_expression.condition, env)
@@ -203,13 +447,98 @@ def _is_truthy(obj: Object) -> bool:
         return True
 
 
-def _evaluate_identifier(node: ast.Identifier, env: Environment) -> Object:
+def _evaluate_identifier(node: ast.Identifier, env: Union[Frame, Environment]) -> Object:
+    depth = node.depth
+
+    if depth >= 0:
+        value = cast(Frame, env).values[node.slot]
+
+        if value is not UNBOUND:
+            return value
+    elif depth == ast.GLOBAL:
+        env = env.globals
+    elif depth == ast.FREE:
+        value = cast(Frame, env).cells[node.slot].value
+
+        if value is not UNBOUND:
+            return value
+    elif depth == ast.CELL:
+        value = cast(Frame, env).values[node.slot].value
+
+        if value is not UNBOUND:
+            return value
+
     try:
         return env[node.value]
     except KeyError:
         return BUILTINS.get(node.value, _new_error(_UNKNOWN_IDENTIFIER, [node.value]))
 
 
+def _assign(name: ast.Identifier, value: Object, env: Union[Frame, Environment]) -> Optional[Object]:
+    depth = name.depth
+
+    if depth >= 0:
+        if cast(Frame, env).values[name.slot] is not UNBOUND:
+            cast(Frame, env).values[name.slot] = value
+            return None
+    elif depth == ast.GLOBAL:
+        env = env.globals
+    elif depth == ast.FREE:
+        cell = cast(Frame, env).cells[name.slot]
+
+        if cell.value is not UNBOUND:
+            cell.value = value
+            return None
+    elif depth == ast.CELL:
+        cell = cast(Frame, env).values[name.slot]
+
+        if cell.value is not UNBOUND:
+            cell.value = value
+            return None
+
+    if env.assign(name.value, value):
+        return None
+
+    return _new_error(_UNKNOWN_IDENTIFIER, [name.value])
+
+
+def _iterate(iterable: Object) -> Union[Iterator[Object], Error]:
+    if type(iterable) is Range:
+        return map(new_integer, range(cast(Range, iterable).start, cast(Range, iterable).end))
+    elif type(iterable) is Array:
+        return iter(cast(Array, iterable).values())
+
+    return _new_error(_NOT_ITERABLE, [iterable.type().name])
+
+
+def _evaluate_index_expression(left: Object, index: Object) -> Object:
+    if type(left) is Array and type(index) is Integer:
+        element = cast(Array, left).get(cast(Integer, index).value)
+
+        return element if element is not None else NULL
+    elif type(left) is Hash:
+        if type(index) not in _HASHABLE_TYPES:
+            return _new_error(_UNUSABLE_HASH_KEY, [index.type().name])
+
+        return cast(Hash, left).pairs.get(cast(Any, index).hash_key(), NULL)
+
+    return _new_error(_UNSUPPORTED_INDEX, [left.type().name, index.type().name])
+
+
+def _new_hash(entries: List[Object]) -> Object:
+    pairs: Dict[HashKey, Object] = {}
+
+    for i in range(0, len(entries), 2):
+        key = entries[i]
+
+        if type(key) not in _HASHABLE_TYPES:
+            return _new_error(_UNUSABLE_HASH_KEY, [key.type().name])
+
+        pairs[cast(Any, key).hash_key()] = entries[i + 1]
+
+    return Hash(pairs)
+
+
 def _evaluate_infix_expression(operator: str, left: Object, right: Object) -> Object:
     if left.type() == ObjectType.INTEGER \
             and right.type() == ObjectType.INTEGER:
@@ -232,13 +561,21 @@ def _evaluate_integer_infix_expression(operator: str, left: Object, right: Objec
     right_value: int = cast(Integer, right).value
 
     if operator == '+':
-        return Integer(left_value + right_value)
+        return new_integer(left_value + right_value)
     elif operator == '-':
-        return Integer(left_value - right_value)
+        return new_integer(left_value - right_value)
     elif operator == '*':
-        return Integer(left_value * right_value)
+        product = left_value * right_value
+
+        if not _SMALL_INTEGER_MIN <= product <= _SMALL_INTEGER_MAX:
+            budget = limits.active.get()
+
+            if budget is not None:
+                budget.check_size(product.bit_length() // _WORD_BITS)
+
+        return new_integer(product)
     elif operator == '/':
-        return Integer(left_value // right_value)
+        return new_integer(left_value // right_value)
     elif operator == '<':
         return _to_boolean_object(left_value < right_value)
     elif operator == '>':
@@ -252,15 +589,19 @@ def _evaluate_integer_infix_expression(operator: str, left: Object, right: Objec
 
 
 def _evaluate_string_infix_expression(operator: str, left: Object, right: Object) -> Object:
-    left_value: str = cast(String, left).value
-    right_value: str = cast(String, right).value
-
     if operator == '+':
-        return String(left_value + right_value)
+        concatenated = cast(String, left).concat(cast(String, right))
+
+        budget = limits.active.get()
+
+        if budget is not None:
+            budget.check_size(len(concatenated))
+
+        return concatenated
     elif operator == '==':
-        return _to_boolean_object(left_value == right_value)
+        return _to_boolean_object(cast(String, left).value == cast(String, right).value)
     elif operator == '!=':
-        return _to_boolean_object(left_value != right_value)
+        return _to_boolean_object(cast(String, left).value != cast(String, right).value)
     else:
         return _new_error(_UNKNOWN_INFIX_OPERATOR, [left.type().name, operator, right.type().name])
 
@@ -291,12 +632,15 @@ def _evaluate_minus_operator_expression(right: Object) -> Object:
 
     right = cast(Integer, right)
 
-    return Integer(-right.value)
+    return new_integer(-right.value)
 
 
-def _evaluate_program(program: ast.Program, env: Environment) -> Optional[Object]:
+def _evaluate_program(program: ast.Program, env: Union[Frame, Environment]) -> Optional[Object]:
     result: Optional[Object] = None
 
+    if not program.resolved:
+        resolve(program)
+
     for statement in program.statements:
         result = evaluate(statement, env)
 
@@ -305,11 +649,18 @@ def _evaluate_program(program: ast.Program, env: Environment) -> Optional[Object
 
             return result.value
         elif type(result) == Error:
-            return result
+            return _locate_error(cast(Error, result), statement)
 
     return result
 
 
+def _locate_error(error: Error, statement: ast.Statement) -> Error:
+    if error.offset < 0:
+        error.offset = statement.offset
+
+    return error
+
+
 def _new_error(message: str, args: List[Any]) -> Error:
     return Error(message.format(*args))
 
@@ -1,143 +1,230 @@
-from re import match
-from cantte.token import TokenType, Token, lookup_token_type
+from array import array
+from bisect import bisect_right
+from itertools import repeat
+from operator import sub
+from typing import Dict, Iterator, NamedTuple, Optional, Pattern, Tuple
 
+from cantte.token import TokenType, Token, KEYWORDS
+
+_TOKEN_REGEX: str = r'''
+    \s*
+    (?:
+        (?P<word>[a-zA-ZñÑ_][a-zA-ZñÑ_\d]*|==|!=|[=+\-*/<>!(){}\[\],;:])
+      | (?P<number>\d+)
+      | (?P<string>"[^"]*"?|'[^']*'?)
+      | (?P<eof>\Z)
+      | (?P<illegal>.)
+    )
+'''
+
+_compiled_token_pattern: Optional[Pattern] = None
+
+OPERATORS: Dict[str, TokenType] = {
+    '=': TokenType.ASSIGN,
+    '==': TokenType.EQUAL,
+    '!=': TokenType.NOT_EQUAL,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLICATION,
+    '/': TokenType.DIVISION,
+    '<': TokenType.LESS_THAN,
+    '>': TokenType.GREATER_THAN,
+    '!': TokenType.NEGATION,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+    ':': TokenType.COLON,
+}
+
+_WORDS: Dict[str, TokenType] = {**KEYWORDS, **OPERATORS}
+
+_WORD_CODES: Dict[str, int] = {literal: token_type.value for literal, token_type in _WORDS.items()}
+
+_TOKEN_TYPES: Dict[int, TokenType] = {token_type.value: token_type for token_type in TokenType}
+
+_FIXED_TOKENS: Dict[int, Tuple[TokenType, str]] = {
+    **{token_type.value: (token_type, literal) for literal, token_type in _WORDS.items()},
+    TokenType.EOF.value: (TokenType.EOF, ''),
+}
+
+_STRING_CODE: int = TokenType.STRING.value
+
+_OFFSET_SHIFTS: Dict[int, int] = {token_type.value: int(token_type == TokenType.STRING) for token_type in TokenType}
+
+_new_token = tuple.__new__
+
+
+class Position(NamedTuple):
+    line: int
+    column: int
+
+    def __str__(self) -> str:
+        return f'line {self.line}, column {self.column}'
+
+
+class SourceMap:
+
+    __slots__ = ('source', '_line_starts')
 
-class Lexer:
     def __init__(self, source: str) -> None:
-        self._source: str = source
-        self._character: str = ''
-        self._read_position: int = 0
-        self._position: int = 0
+        self.source = source
+        self._line_starts: Optional[array] = None
 
-        self._read_character()
+    def position(self, offset: int) -> Position:
+        if self._line_starts is None:
+            self._line_starts = self._compute_line_starts()
 
-    def next_token(self) -> Token:
-        self._skip_whitespace()
-
-        if self._is_letter(self._character):
-            ident_literal: str = self._read_identifier()
-            token_type = lookup_token_type(ident_literal)
-            token = Token(token_type, ident_literal)
-        elif self._is_number(self._character):
-            num_literal: str = self._read_number()
-            token = Token(TokenType.INT, num_literal)
-        else:
-            token_type = self._get_token_type()
-            if token_type == TokenType.EQUAL or token_type == TokenType.NOT_EQUAL:
-                token = self._make_two_character_token(token_type)
-            elif token_type == TokenType.STRING:
-                literal = self._read_string()
+        line = bisect_right(self._line_starts, offset)
 
-                token = Token(token_type, literal)
-            else:
-                token = Token(token_type, self._character)
-            self._read_character()
+        return Position(line, offset - self._line_starts[line - 1] + 1)
 
-        return token
+    def _compute_line_starts(self) -> array:
+        line_starts = array('I', [0])
+        find = self.source.find
+        index = find('\n')
 
-    def _get_token_type(self):
-        if match(r'^=$', self._character):
-            if self._peek_character() == '=':
-                token_type = TokenType.EQUAL
-            else:
-                token_type = TokenType.ASSIGN
-        elif match(r'^\+$', self._character):
-            token_type = TokenType.PLUS
-        elif match(r'^-$', self._character):
-            token_type = TokenType.MINUS
-        elif match(r'^\*$', self._character):
-            token_type = TokenType.MULTIPLICATION
-        elif match(r'^/$', self._character):
-            token_type = TokenType.DIVISION
-        elif match(r'^$', self._character):
-            token_type = TokenType.EOF
-        elif match(r'^\($', self._character):
-            token_type = TokenType.LPAREN
-        elif match(r'^\)$', self._character):
-            token_type = TokenType.RPAREN
-        elif match(r'^{$', self._character):
-            token_type = TokenType.LBRACE
-        elif match(r'^}$', self._character):
-            token_type = TokenType.RBRACE
-        elif match(r'^,$', self._character):
-            token_type = TokenType.COMMA
-        elif match(r'^;$', self._character):
-            token_type = TokenType.SEMICOLON
-        elif match(r'^<$', self._character):
-            token_type = TokenType.LESS_THAN
-        elif match(r'^>$', self._character):
-            token_type = TokenType.GREATER_THAN
-        elif match(r'^!$', self._character):
-            if self._peek_character() == '=':
-                token_type = TokenType.NOT_EQUAL
-            else:
-                token_type = TokenType.NEGATION
-        elif match(r"^\"|'$", self._character):
-            token_type = TokenType.STRING
-        else:
-            token_type = TokenType.ILLEGAL
+        while index >= 0:
+            line_starts.append(index + 1)
+            index = find('\n', index + 1)
 
-        return token_type
+        return line_starts
 
-    @staticmethod
-    def _is_letter(character: str) -> bool:
-        return bool(match(r'^[a-zA-ZñÑ_]$', character))
 
-    @staticmethod
-    def _is_number(character: str) -> bool:
-        return bool(match(r'^\d$', character))
+class TokenBuffer:
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.types = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.source_map = SourceMap(source)
 
-    def _make_two_character_token(self, token_type: TokenType) -> Token:
-        prefix = self._character
-        self._read_character()
-        suffix = self._character
+    def __len__(self) -> int:
+        return len(self.types)
 
-        return Token(token_type, f'{prefix}{suffix}')
+    def __getitem__(self, index: int) -> Token:
+        code = self.types[index]
+        start = self.starts[index]
 
-    def _peek_character(self) -> str:
-        if self._read_position >= len(self._source):
-            return ''
-        return self._source[self._read_position]
+        try:
+            token_type, literal = _FIXED_TOKENS[code]
 
-    def _read_identifier(self) -> str:
-        initial_position = self._position
+            return _new_token(Token, (token_type, literal, start))
+        except KeyError:
+            literal = self.source[start:self.ends[index]]
 
-        while self._is_letter(self._character) or self._is_number(self._character):
-            self._read_character()
+            return _new_token(Token, (_TOKEN_TYPES[code], literal, start - 1 if code == _STRING_CODE else start))
 
-        return self._source[initial_position:self._position]
+    def __iter__(self) -> Iterator[Token]:
+        starts = self.starts
+        types = map(_TOKEN_TYPES.__getitem__, self.types)
+        literals = map(self.source.__getitem__, map(slice, starts, self.ends))
+        offsets = map(sub, starts, map(_OFFSET_SHIFTS.__getitem__, self.types))
 
-    def _read_character(self) -> None:
-        if self._read_position >= len(self._source):
-            self._character = ''
-        else:
-            self._character = self._source[self._read_position]
+        return map(_new_token, repeat(Token), zip(types, literals, offsets))
+
+    def token_type(self, index: int) -> TokenType:
+        return _TOKEN_TYPES[self.types[index]]
+
+    def literal(self, index: int) -> str:
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def position(self, index: int) -> Position:
+        start = self.starts[index]
+
+        return self.source_map.position(start - 1 if self.types[index] == _STRING_CODE else start)
+
+
+def _token_pattern() -> Pattern:
+    global _compiled_token_pattern
+
+    if _compiled_token_pattern is None:
+        import re
 
-        self._position = self._read_position
-        self._read_position += 1
+        _compiled_token_pattern = re.compile(_TOKEN_REGEX, re.DOTALL | re.VERBOSE)
 
-    def _read_number(self) -> str:
-        initial_position = self._position
+    return _compiled_token_pattern
 
-        while self._is_number(self._character):
-            self._read_character()
 
-        return self._source[initial_position:self._position]
+class Lexer:
+    def __init__(self, source: str) -> None:
+        self._source: str = source
+        self._position: int = 0
+        self._pattern: Pattern = _token_pattern()
+
+    def next_token(self) -> Token:
+        match = self._pattern.match(self._source, self._position)
 
-    def _read_string(self) -> str:
-        quote_type = self._character
+        assert match is not None
 
-        self._read_character()
+        kind = match.lastgroup
 
-        initial_position = self._position
-        while (self._character != quote_type) \
-                and self._read_position <= len(self._source):
-            self._read_character()
+        assert kind is not None
 
-        string = self._source[initial_position:self._position]
+        literal: str = match[kind]
+        offset = match.start(kind)
+        self._position = match.end()
 
-        return string
+        if kind == 'word':
+            return Token(_WORDS.get(literal, TokenType.IDENTIFIER), literal, offset)
+        elif kind == 'number':
+            return Token(TokenType.INT, literal, offset)
+        elif kind == 'string':
+            return Token(TokenType.STRING, self._string_value(literal), offset)
+        elif kind == 'eof':
+            return Token(TokenType.EOF, '', offset)
+        else:
+            return Token(TokenType.ILLEGAL, literal, offset)
+
+    def tokenize(self) -> TokenBuffer:
+        buffer = TokenBuffer(self._source)
+        types_append = buffer.types.append
+        starts_append = buffer.starts.append
+        ends_append = buffer.ends.append
+        word_codes = _WORD_CODES
+        identifier_code = TokenType.IDENTIFIER.value
+        int_code = TokenType.INT.value
+        string_code = TokenType.STRING.value
+        illegal_code = TokenType.ILLEGAL.value
+
+        for match in self._pattern.finditer(self._source, self._position):
+            kind = match.lastgroup
+
+            assert kind is not None
+
+            start, end = match.span(kind)
+
+            if kind == 'word':
+                types_append(word_codes.get(match[kind], identifier_code))
+            elif kind == 'number':
+                types_append(int_code)
+            elif kind == 'string':
+                types_append(string_code)
+                start += 1
+                if end > start and self._source[end - 1] == self._source[start - 1]:
+                    end -= 1
+            elif kind == 'eof':
+                types_append(TokenType.EOF.value)
+                starts_append(start)
+                ends_append(end)
+                break
+            else:
+                types_append(illegal_code)
+
+            starts_append(start)
+            ends_append(end)
 
-    def _skip_whitespace(self) -> None:
-        while match(r'^\s$', self._character):
-            self._read_character()
+        self._position = len(self._source)
+
+        return buffer
+
+    @staticmethod
+    def _string_value(literal: str) -> str:
+        if len(literal) > 1 and literal[-1] == literal[0]:
+            return literal[1:-1]
+        return literal[1:]
@@ -0,0 +1,130 @@
+import sys
+from contextvars import ContextVar, Token
+from time import monotonic
+from typing import Callable, Optional, Union
+
+import cantte.ast as ast
+from cantte.object import Environment, Error, Frame, Object
+
+CLOCK_INTERVAL: int = 256
+
+_STEPS_EXCEEDED = 'Step budget of {} exceeded'
+_DEPTH_EXCEEDED = 'Maximum call depth of {} exceeded'
+_SIZE_EXCEEDED = 'Maximum size of {} exceeded'
+_TIMEOUT_EXCEEDED = 'Timed out after {}s'
+_RECURSION_ERROR = 'Maximum call depth exceeded'
+_UNSUPPORTED_ENGINE = 'Limits are not enforced by the {} engine'
+
+active: ContextVar[Optional['Limits']] = ContextVar('active', default=None)
+
+
+class LimitExceeded(Exception):
+    pass
+
+
+class Limits:
+
+    __slots__ = ('max_steps', 'max_depth', 'max_size', 'timeout', 'steps', 'depth',
+                 '_step_limit', '_depth_limit', '_size_limit', '_deadline', '_next_check')
+
+    def __init__(self,
+                 max_steps: Optional[int] = None,
+                 max_depth: Optional[int] = None,
+                 max_size: Optional[int] = None,
+                 timeout: Optional[float] = None) -> None:
+        self.max_steps = max_steps
+        self.max_depth = max_depth
+        self.max_size = max_size
+        self.timeout = timeout
+        self.steps = 0
+        self.depth = 0
+        self._step_limit = max_steps if max_steps is not None else sys.maxsize
+        self._depth_limit = max_depth if max_depth is not None else sys.maxsize
+        self._size_limit = max_size if max_size is not None else sys.maxsize
+        self._deadline = 0.0
+        self._next_check = 0
+
+    def run(self,
+            program: ast.Program,
+            env: Union[Frame, Environment],
+            engine: str = 'evaluator') -> Optional[Object]:
+        run_program: Callable[[ast.Program, Union[Frame, Environment]], Optional[Object]]
+
+        if engine == 'evaluator':
+            from cantte.evaluator import evaluate as run_program
+        elif engine == 'trampoline':
+            from cantte.trampoline import evaluate_trampolined as run_program
+        else:
+            raise ValueError(_UNSUPPORTED_ENGINE.format(engine))
+
+        token = self._start()
+        try:
+            return run_program(program, env)
+        except LimitExceeded as exceeded:
+            return Error(str(exceeded))
+        except RecursionError:
+            return Error(_RECURSION_ERROR)
+        finally:
+            active.reset(token)
+
+    async def run_async(self,
+                        program: ast.Program,
+                        env: Union[Frame, Environment],
+                        yield_every: Optional[int] = None) -> Optional[Object]:
+        from cantte.trampoline import evaluate_async, YIELD_EVERY
+
+        token = self._start()
+        try:
+            return await evaluate_async(program, env, yield_every if yield_every is not None else YIELD_EVERY)
+        except LimitExceeded as exceeded:
+            return Error(str(exceeded))
+        except RecursionError:
+            return Error(_RECURSION_ERROR)
+        finally:
+            active.reset(token)
+
+    def step(self) -> None:
+        self.steps += 1
+
+        if self.steps >= self._next_check:
+            self._check()
+
+    def enter(self) -> None:
+        self.depth += 1
+
+        if self.depth > self._depth_limit:
+            raise LimitExceeded(_DEPTH_EXCEEDED.format(self.max_depth))
+
+        self.steps += 1
+
+        if self.steps >= self._next_check:
+            self._check()
+
+    def leave(self) -> None:
+        self.depth -= 1
+
+    def check_size(self, size: int) -> None:
+        if size > self._size_limit:
+            raise LimitExceeded(_SIZE_EXCEEDED.format(self.max_size))
+
+    def _start(self) -> 'Token[Optional[Limits]]':
+        self.steps = 0
+        self.depth = 0
+        self._deadline = monotonic() + self.timeout if self.timeout is not None else 0.0
+        self._next_check = self._following_check()
+
+        return active.set(self)
+
+    def _check(self) -> None:
+        if self.steps > self._step_limit:
+            raise LimitExceeded(_STEPS_EXCEEDED.format(self.max_steps))
+        elif self.timeout is not None and monotonic() > self._deadline:
+            raise LimitExceeded(_TIMEOUT_EXCEEDED.format(self.timeout))
+
+        self._next_check = self._following_check()
+
+    def _following_check(self) -> int:
+        if self.timeout is None:
+            return self._step_limit + 1
+
+        return min(self._step_limit + 1, self.steps + CLOCK_INTERVAL)
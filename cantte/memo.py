@@ -0,0 +1,106 @@
+from functools import lru_cache
+from typing import Any, cast, List, NamedTuple, Optional, Tuple
+
+from cantte.object import Boolean, Builtin, Error, Function, Integer, new_integer, Object, String
+
+DEFAULT_MEMO_SIZE: int = 1024
+
+_WRONG_NUMBER_OF_ARGS = 'Wrong number of arguments. {} received, {} expected'
+_UNSUPPORTED_ARGUMENT_TYPE = 'Argument of type \'{}\' is not supported'
+_INVALID_SIZE = 'Memo size must be a positive integer, got {}'
+
+Key = Tuple[Tuple[type, Any], ...]
+
+
+class MemoStatistics(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class MemoizedFunction:
+
+    def __init__(self, function: Object, maxsize: int = DEFAULT_MEMO_SIZE) -> None:
+        self.function = function
+        self.maxsize = maxsize
+        self._cached_call = lru_cache(maxsize=maxsize)(self._call)
+
+    def __call__(self, *args: Object) -> Object:
+        key = _key(args)
+
+        if key is None:
+            return _apply(self.function, list(args))
+
+        result = self._cached_call(key)
+
+        if type(result) is Error:
+            return Error(cast(Error, result).message, cast(Error, result).offset)
+
+        return result
+
+    def statistics(self) -> MemoStatistics:
+        info = self._cached_call.cache_info()
+
+        return MemoStatistics(info.hits, info.misses, info.currsize, self.maxsize)
+
+    def clear(self) -> None:
+        self._cached_call.cache_clear()
+
+    def _call(self, key: Key) -> Object:
+        return _apply(self.function, [_from_key(value_type, value) for value_type, value in key])
+
+
+def _key(args: Tuple[Object, ...]) -> Optional[Key]:
+    key: List[Tuple[type, Any]] = []
+
+    for arg in args:
+        arg_type = type(arg)
+
+        if arg_type is Integer or arg_type is String or arg_type is Boolean:
+            key.append((arg_type, cast(Any, arg).value))
+        else:
+            return None
+
+    return tuple(key)
+
+
+def _from_key(value_type: type, value: Any) -> Object:
+    from cantte.evaluator import FALSE, TRUE
+
+    if value_type is Integer:
+        return new_integer(value)
+    elif value_type is Boolean:
+        return TRUE if value else FALSE
+
+    return String(value)
+
+
+def _apply(function: Object, args: List[Object]) -> Object:
+    from cantte.evaluator import _apply_function
+
+    return _apply_function(function, args)
+
+
+def memo(*args: Object) -> Object:
+    if len(args) not in (1, 2):
+        return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), '1 or 2'))
+    elif not isinstance(args[0], (Function, Builtin)):
+        return Error(_UNSUPPORTED_ARGUMENT_TYPE.format(args[0].type().name))
+
+    maxsize = DEFAULT_MEMO_SIZE
+
+    if len(args) == 2:
+        if type(args[1]) is not Integer or cast(Integer, args[1]).value <= 0:
+            return Error(_INVALID_SIZE.format(args[1].inspect()))
+
+        maxsize = cast(Integer, args[1]).value
+
+    return Builtin(function=MemoizedFunction(args[0], maxsize))
+
+
+def memo_statistics(value: Object) -> Optional[MemoStatistics]:
+    if type(value) is Builtin and isinstance(cast(Builtin, value).function, MemoizedFunction):
+        return cast(MemoizedFunction, cast(Builtin, value).function).statistics()
+
+    return None
@@ -1,24 +1,30 @@
-from typing import Dict, List
+from array import array
+from typing import Any, cast, Dict, List, Mapping, Optional, Protocol, Tuple, Union
 from abc import ABC, abstractmethod
 from enum import auto, Enum
-from typing_extensions import Protocol
 
-from cantte.ast import Block, Identifier
+from cantte.ast import Block, Identifier, Scope
 
 
 class ObjectType(Enum):
+    ARRAY = auto()
     BOOLEAN = auto()
     BUILTIN = auto()
     ERROR = auto()
     FUNCTION = auto()
+    HASH = auto()
     INTEGER = auto()
     NULL = auto()
+    RANGE = auto()
     RETURN = auto()
     STRING = auto()
+    TAIL_CALL = auto()
 
 
 class Object(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def type(self) -> ObjectType:
         pass
@@ -28,8 +34,13 @@ class Object(ABC):
         pass
 
 
+HashKey = Union[int, str, Tuple[ObjectType, bool]]
+
+
 class Integer(Object):
 
+    __slots__ = ('value',)
+
     def __init__(self, value: int) -> None:
         self.value = value
 
@@ -39,9 +50,39 @@ class Integer(Object):
     def inspect(self) -> str:
         return str(self.value)
 
+    def hash_key(self) -> HashKey:
+        return self.value
+
+
+SMALL_INTEGER_RANGE: Tuple[int, int] = (-5, 256)
+
+_small_integer_minimum: int = 0
+_small_integer_maximum: int = -1
+_small_integers: List[Integer] = []
+
+
+def configure_integer_cache(minimum: int, maximum: int) -> None:
+    global _small_integer_minimum, _small_integer_maximum, _small_integers
+
+    _small_integers = [Integer(value) for value in range(minimum, maximum + 1)]
+    _small_integer_minimum = minimum
+    _small_integer_maximum = maximum
+
+
+def new_integer(value: int) -> Integer:
+    if _small_integer_minimum <= value <= _small_integer_maximum:
+        return _small_integers[value - _small_integer_minimum]
+
+    return Integer(value)
+
+
+configure_integer_cache(*SMALL_INTEGER_RANGE)
+
 
 class Boolean(Object):
 
+    __slots__ = ('value',)
+
     def __init__(self, value: bool) -> None:
         self.value = value
 
@@ -51,9 +92,20 @@ class Boolean(Object):
     def inspect(self) -> str:
         return 'true' if self.value else 'false'
 
+    def hash_key(self) -> HashKey:
+        return _BOOLEAN_KEYS[self.value]
+
+
+_BOOLEAN_KEYS: Dict[bool, HashKey] = {
+    True: (ObjectType.BOOLEAN, True),
+    False: (ObjectType.BOOLEAN, False),
+}
+
 
 class Null(Object):
 
+    __slots__ = ()
+
     def type(self) -> ObjectType:
         return ObjectType.NULL
 
@@ -63,6 +115,8 @@ class Null(Object):
 
 class Return(Object):
 
+    __slots__ = ('value',)
+
     def __init__(self, value: Object) -> None:
         self.value = value
 
@@ -73,10 +127,28 @@ class Return(Object):
         return self.value.inspect()
 
 
+class TailCall(Object):
+
+    __slots__ = ('function', 'arguments')
+
+    def __init__(self, function: Object, arguments: List[Object]) -> None:
+        self.function = function
+        self.arguments = arguments
+
+    def type(self) -> ObjectType:
+        return ObjectType.TAIL_CALL
+
+    def inspect(self) -> str:
+        return f'tail call to {self.function.inspect()}'
+
+
 class Error(Object):
 
-    def __init__(self, message: str) -> None:
+    __slots__ = ('message', 'offset')
+
+    def __init__(self, message: str, offset: int = -1) -> None:
         self.message = message
+        self.offset = offset
 
     def type(self) -> ObjectType:
         return ObjectType.ERROR
@@ -87,10 +159,13 @@ class Error(Object):
 
 class Environment(Dict):
 
+    __slots__ = ('_store', '_outer', 'globals')
+
     def __init__(self, outer=None):
         super().__init__()
         self._store = dict()
         self._outer = outer
+        self.globals = self
 
     def __getitem__(self, item):
         try:
@@ -106,13 +181,124 @@ class Environment(Dict):
     def __delitem__(self, key):
         del self._store[key]
 
+    def assign(self, key, value):
+        if key in self._store:
+            self._store[key] = value
+            return True
+        elif self._outer is not None:
+            return self._outer.assign(key, value)
+
+        return False
+
+
+class FrozenEnvironment(Environment):
+
+    __slots__ = ()
+
+    def __init__(self, values: Mapping[str, Any], outer=None):
+        super().__init__(outer)
+        self._store.update(values)
+
+    def __setitem__(self, key, value):
+        raise TypeError(f'Cannot bind {key} in a frozen environment')
+
+    def __delitem__(self, key):
+        raise TypeError(f'Cannot unbind {key} in a frozen environment')
+
+    def assign(self, key, value):
+        return False
+
+
+UNBOUND: Any = object()
+
+
+class Cell:
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any = UNBOUND) -> None:
+        self.value = value
+
+
+class Frame:
+
+    __slots__ = ('values', 'scope', 'outer', 'globals', 'cells')
+
+    def __init__(self,
+                 scope: Scope,
+                 outer: Union['Frame', Environment],
+                 values: Optional[List[Any]] = None,
+                 cells: Tuple[Cell, ...] = ()) -> None:
+        self.values: List[Any] = [UNBOUND] * len(scope.names) if values is None else values
+        self.scope = scope
+        self.outer = outer
+        self.globals: Environment = outer.globals
+        self.cells = cells
+
+    def __getitem__(self, item):
+        slot = self.scope.slots.get(item)
+
+        if slot is not None:
+            value = self.values[slot]
+
+            if type(value) is Cell:
+                value = value.value
+
+            if value is not UNBOUND:
+                return value
+
+        slot = self.scope.closure_slots.get(item)
+
+        while slot is not None:
+            value = self.cells[slot].value
+
+            if value is not UNBOUND:
+                return value
+
+            slot = self.scope.fallbacks.get(slot)
+
+        return self.outer[item]
+
+    def assign(self, key, value):
+        slot = self.scope.slots.get(key)
+
+        if slot is not None:
+            current = self.values[slot]
+
+            if type(current) is Cell and current.value is not UNBOUND:
+                current.value = value
+                return True
+            elif type(current) is not Cell and current is not UNBOUND:
+                self.values[slot] = value
+                return True
+
+        slot = self.scope.closure_slots.get(key)
+
+        while slot is not None:
+            if self.cells[slot].value is not UNBOUND:
+                self.cells[slot].value = value
+                return True
+
+            slot = self.scope.fallbacks.get(slot)
+
+        return self.outer.assign(key, value)
+
 
 class Function(Object):
 
-    def __init__(self, parameters: List[Identifier], body: Block, env: Environment) -> None:
+    __slots__ = ('parameters', 'body', 'env', 'scope', 'cells')
+
+    def __init__(self,
+                 parameters: List[Identifier],
+                 body: Block,
+                 env: Union[Frame, Environment],
+                 scope: Optional[Scope] = None,
+                 cells: Tuple[Cell, ...] = ()) -> None:
         self.parameters = parameters
         self.body = body
         self.env = env
+        self.scope = scope
+        self.cells = cells
 
     def type(self) -> ObjectType:
         return ObjectType.FUNCTION
@@ -123,10 +309,36 @@ class Function(Object):
         return f'func({params} {{\n{str(self.body)}\n}}'
 
 
+FLAT_CONCAT_LIMIT: int = 64
+
+
 class String(Object):
 
-    def __init__(self, value: str) -> None:
-        self.value = value
+    __slots__ = ('_value', '_left', '_right', '_length')
+
+    def __init__(self, value: Optional[str], left: Optional['String'] = None, right: Optional['String'] = None) -> None:
+        self._value = value
+        self._left = left
+        self._right = right
+
+        if value is not None:
+            self._length = len(value)
+        else:
+            assert left is not None and right is not None
+
+            self._length = left._length + right._length
+
+    @property
+    def value(self) -> str:
+        if self._value is None:
+            self._value = self._flatten()
+            self._left = None
+            self._right = None
+
+        return self._value
+
+    def __len__(self) -> int:
+        return self._length
 
     def type(self) -> ObjectType:
         return ObjectType.STRING
@@ -134,6 +346,155 @@ class String(Object):
     def inspect(self) -> str:
         return self.value
 
+    def hash_key(self) -> HashKey:
+        return self.value
+
+    def is_rope(self) -> bool:
+        return self._value is None
+
+    def concat(self, other: 'String') -> 'String':
+        if other._length == 0:
+            return self
+        elif self._length == 0:
+            return other
+        elif self._value is not None and other._value is not None \
+                and self._length + other._length <= FLAT_CONCAT_LIMIT:
+            return String(self._value + other._value)
+
+        return String(None, self, other)
+
+    def _flatten(self) -> str:
+        pieces: List[str] = []
+        pending: List[String] = [self]
+
+        while pending:
+            node = pending.pop()
+
+            if node._value is not None:
+                pieces.append(node._value)
+            else:
+                assert node._left is not None and node._right is not None
+
+                pending.append(node._right)
+                pending.append(node._left)
+
+        return ''.join(pieces)
+
+
+class Array(Object):
+
+    __slots__ = ('elements', 'start', 'end')
+
+    def __init__(self, elements: Union[array, List[Object]], start: int = 0, end: Optional[int] = None) -> None:
+        self.elements = elements
+        self.start = start
+        self.end = len(elements) if end is None else end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def type(self) -> ObjectType:
+        return ObjectType.ARRAY
+
+    def inspect(self) -> str:
+        return f'[{", ".join(element.inspect() for element in self.values())}]'
+
+    def get(self, index: int) -> Optional[Object]:
+        if index < 0 or index >= self.end - self.start:
+            return None
+
+        element = self.elements[self.start + index]
+
+        return new_integer(cast(int, element)) if type(self.elements) is array else element
+
+    def slice(self, start: int, end: int) -> 'Array':
+        return Array(self.elements, self.start + start, self.start + end)
+
+    def values(self) -> List[Object]:
+        if type(self.elements) is array:
+            return [new_integer(element) for element in self.elements[self.start:self.end]]
+
+        return cast(List[Object], self.elements[self.start:self.end])
+
+    def append(self, element: Object) -> 'Array':
+        elements = self.elements
+
+        if type(elements) is array:
+            if type(element) is Integer:
+                if self.end != len(elements):
+                    elements = elements[self.start:self.end]
+
+                try:
+                    elements.append(cast(Integer, element).value)
+                except OverflowError:
+                    return Array(self.values() + [element])
+
+                return Array(elements, self.start if elements is self.elements else 0, len(elements))
+
+            return Array(self.values() + [element])
+
+        if self.end != len(elements):
+            elements = elements[self.start:self.end]
+
+        elements.append(element)
+
+        return Array(elements, self.start if elements is self.elements else 0, len(elements))
+
+
+def new_array(elements: List[Object]) -> Array:
+    for element in elements:
+        if type(element) is not Integer:
+            return Array(elements)
+
+    try:
+        return Array(array('q', [cast(Integer, element).value for element in elements]))
+    except OverflowError:
+        return Array(elements)
+
+
+class Range(Object):
+
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return max(0, self.end - self.start)
+
+    def type(self) -> ObjectType:
+        return ObjectType.RANGE
+
+    def inspect(self) -> str:
+        return f'range({self.start}, {self.end})'
+
+
+class Hash(Object):
+
+    __slots__ = ('pairs',)
+
+    def __init__(self, pairs: Dict[HashKey, Object]) -> None:
+        self.pairs = pairs
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def type(self) -> ObjectType:
+        return ObjectType.HASH
+
+    def inspect(self) -> str:
+        return f'{{{", ".join(f"{_inspect_key(key)}: {value.inspect()}" for key, value in self.pairs.items())}}}'
+
+
+def _inspect_key(key: HashKey) -> str:
+    if type(key) is tuple:
+        return 'true' if cast(Tuple[ObjectType, bool], key)[1] else 'false'
+    elif type(key) is str:
+        return f'"{key}"'
+
+    return str(key)
+
 
 class BuiltinFunction(Protocol):
 
@@ -142,6 +503,8 @@ class BuiltinFunction(Protocol):
 
 class Builtin(Object):
 
+    __slots__ = ('function',)
+
     def __init__(self, function: BuiltinFunction):
         self.function = function
 
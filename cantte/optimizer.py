@@ -0,0 +1,200 @@
+from typing import cast, Optional, Type
+
+import cantte.ast as ast
+from cantte.evaluator import (FALSE, TRUE, _evaluate_infix_expression,
+                              _evaluate_prefix_expression, _is_truthy)
+from cantte.object import Boolean, Integer, Object, String
+from cantte.token import Token, TokenType
+
+
+class Optimizer:
+
+    def optimize(self, program: ast.Program) -> ast.Program:
+        program.statements = [self._optimize_statement(statement) for statement in program.statements]
+
+        return program
+
+    def _optimize_statement(self, statement: ast.Statement) -> ast.Statement:
+        statement_type: Type = type(statement)
+
+        if statement_type == ast.ExpressionStatement:
+            statement = cast(ast.ExpressionStatement, statement)
+
+            if statement.expression is not None:
+                statement.expression = self._optimize_expression(statement.expression)
+        elif statement_type == ast.LetStatement:
+            statement = cast(ast.LetStatement, statement)
+
+            if statement.value is not None:
+                statement.value = self._optimize_expression(statement.value)
+        elif statement_type == ast.ReturnStatement:
+            statement = cast(ast.ReturnStatement, statement)
+
+            if statement.return_value is not None:
+                statement.return_value = self._optimize_expression(statement.return_value)
+        elif statement_type == ast.Block:
+            self._optimize_block(cast(ast.Block, statement))
+        elif statement_type == ast.AssignStatement:
+            statement = cast(ast.AssignStatement, statement)
+
+            if statement.value is not None:
+                statement.value = self._optimize_expression(statement.value)
+        elif statement_type == ast.WhileStatement:
+            statement = cast(ast.WhileStatement, statement)
+
+            if statement.condition is not None:
+                statement.condition = self._optimize_expression(statement.condition)
+            if statement.body is not None:
+                self._optimize_block(statement.body)
+        elif statement_type == ast.ForStatement:
+            statement = cast(ast.ForStatement, statement)
+
+            if statement.iterable is not None:
+                statement.iterable = self._optimize_expression(statement.iterable)
+            if statement.body is not None:
+                self._optimize_block(statement.body)
+
+        return statement
+
+    def _optimize_block(self, block: ast.Block) -> ast.Block:
+        block.statements = [self._optimize_statement(statement) for statement in block.statements]
+
+        return block
+
+    def _optimize_expression(self, expression: ast.Expression) -> ast.Expression:
+        expression_type: Type = type(expression)
+
+        if expression_type == ast.Infix:
+            return self._optimize_infix(cast(ast.Infix, expression))
+        elif expression_type == ast.Prefix:
+            return self._optimize_prefix(cast(ast.Prefix, expression))
+        elif expression_type == ast.If:
+            return self._optimize_if(cast(ast.If, expression))
+        elif expression_type == ast.Function:
+            expression = cast(ast.Function, expression)
+
+            if expression.body is not None:
+                self._optimize_block(expression.body)
+        elif expression_type == ast.Call:
+            expression = cast(ast.Call, expression)
+
+            expression.function = self._optimize_expression(expression.function)
+            if expression.arguments is not None:
+                expression.arguments = [self._optimize_expression(argument) for argument in expression.arguments]
+        elif expression_type == ast.ArrayLiteral:
+            expression = cast(ast.ArrayLiteral, expression)
+
+            if expression.elements is not None:
+                expression.elements = [self._optimize_expression(element) for element in expression.elements]
+        elif expression_type == ast.Index:
+            expression = cast(ast.Index, expression)
+
+            expression.left = self._optimize_expression(expression.left)
+            if expression.index is not None:
+                expression.index = self._optimize_expression(expression.index)
+        elif expression_type == ast.HashLiteral:
+            expression = cast(ast.HashLiteral, expression)
+
+            if expression.pairs is not None:
+                expression.pairs = [(self._optimize_expression(key), self._optimize_expression(value))
+                                    for key, value in expression.pairs]
+
+        return expression
+
+    def _optimize_infix(self, infix: ast.Infix) -> ast.Expression:
+        assert infix.left is not None and infix.right is not None
+
+        infix.left = self._optimize_expression(infix.left)
+        infix.right = self._optimize_expression(infix.right)
+
+        left = _literal_value(infix.left)
+        right = _literal_value(infix.right)
+
+        if left is None or right is None:
+            return infix
+
+        try:
+            folded = _evaluate_infix_expression(infix.operator, left, right)
+        except ZeroDivisionError:
+            return infix
+
+        return _to_literal(folded, infix.left.offset) or infix
+
+    def _optimize_prefix(self, prefix: ast.Prefix) -> ast.Expression:
+        assert prefix.right is not None
+
+        prefix.right = self._optimize_expression(prefix.right)
+
+        right = _literal_value(prefix.right)
+
+        if right is None:
+            return prefix
+
+        return _to_literal(_evaluate_prefix_expression(prefix.operator, right), prefix.offset) or prefix
+
+    def _optimize_if(self, if_expression: ast.If) -> ast.Expression:
+        assert if_expression.condition is not None and if_expression.consequence is not None
+
+        if_expression.condition = self._optimize_expression(if_expression.condition)
+        self._optimize_block(if_expression.consequence)
+        if if_expression.alternative is not None:
+            self._optimize_block(if_expression.alternative)
+
+        condition = _literal_value(if_expression.condition)
+
+        if condition is None:
+            return if_expression
+
+        if _is_truthy(condition):
+            if_expression.alternative = None
+        elif if_expression.alternative is not None:
+            if_expression.condition = _to_boolean_literal(True, if_expression.condition.offset)
+            if_expression.consequence = if_expression.alternative
+            if_expression.alternative = None
+        else:
+            if_expression.consequence = ast.Block(if_expression.consequence.token, [])
+
+        return if_expression
+
+
+def _literal_value(expression: ast.Expression) -> Optional[Object]:
+    expression_type: Type = type(expression)
+
+    if expression_type == ast.Integer:
+        value = cast(ast.Integer, expression).value
+
+        return Integer(value) if value is not None else None
+    elif expression_type == ast.StringLiteral:
+        return String(cast(ast.StringLiteral, expression).value)
+    elif expression_type == ast.Boolean:
+        return TRUE if cast(ast.Boolean, expression).value else FALSE
+
+    return None
+
+
+def _to_literal(value: Object, offset: int) -> Optional[ast.Expression]:
+    value_type: Type = type(value)
+
+    if value_type == Integer:
+        integer = cast(Integer, value).value
+
+        return ast.Integer(Token(TokenType.INT, str(integer), offset), integer)
+    elif value_type == String:
+        string = cast(String, value).value
+
+        return ast.StringLiteral(Token(TokenType.STRING, string, offset), string)
+    elif value_type == Boolean:
+        return _to_boolean_literal(cast(Boolean, value).value, offset)
+
+    return None
+
+
+def _to_boolean_literal(value: bool, offset: int) -> ast.Boolean:
+    if value:
+        return ast.Boolean(Token(TokenType.TRUE, 'true', offset), True)
+
+    return ast.Boolean(Token(TokenType.FALSE, 'false', offset), False)
+
+
+def optimize(program: ast.Program) -> ast.Program:
+    return Optimizer().optimize(program)
@@ -1,12 +1,14 @@
-from typing import Optional, List, Callable, Dict
+from typing import Optional, Iterator, List, Callable, Dict, Union
 from enum import IntEnum
 
 from cantte.token import Token, TokenType
-from cantte.lexer import Lexer
+from cantte.lexer import Lexer, TokenBuffer
 from cantte.ast import (Program, Statement, LetStatement, Identifier,
                         ReturnStatement, Expression, ExpressionStatement,
                         Integer, Prefix, Infix, Boolean,
-                        If, Block, Function, Call, StringLiteral)
+                        If, Block, Function, Call, StringLiteral,
+                        ArrayLiteral, Index, HashLiteral, AssignStatement,
+                        WhileStatement, ForStatement)
 
 PrefixParseFunc = Callable[[], Optional[Expression]]
 InfixParseFunc = Callable[[Expression], Optional[Expression]]
@@ -22,6 +24,7 @@ class Precedence(IntEnum):
     PRODUCT = 5,
     PREFIX = 6
     CALL = 7
+    INDEX = 8
 
 
 PRECEDENCES: Dict[TokenType, Precedence] = {
@@ -34,13 +37,16 @@ PRECEDENCES: Dict[TokenType, Precedence] = {
     TokenType.DIVISION: Precedence.PRODUCT,
     TokenType.MULTIPLICATION: Precedence.PRODUCT,
     TokenType.LPAREN: Precedence.CALL,
+    TokenType.LBRACKET: Precedence.INDEX,
 }
 
 
 class Parser:
 
-    def __init__(self, lexer: Lexer) -> None:
-        self._lexer = lexer
+    def __init__(self, lexer: Union[Lexer, TokenBuffer]) -> None:
+        self._tokens: TokenBuffer = lexer if isinstance(lexer, TokenBuffer) else lexer.tokenize()
+        self._stream: Iterator[Token] = iter(self._tokens)
+        self._eof: Token = self._tokens[len(self._tokens) - 1]
         self._current_token: Optional[Token] = None
         self._peek_token: Optional[Token] = None
         self._errors: List[str] = []
@@ -72,7 +78,7 @@ class Parser:
 
     def _advance_tokens(self) -> None:
         self._current_token = self._peek_token
-        self._peek_token = self._lexer.next_token()
+        self._peek_token = next(self._stream, self._eof)
 
     def _current_precedence(self) -> Precedence:
         assert self._current_token is not None
@@ -98,7 +104,40 @@ class Parser:
         error = f'The following token \'{self._peek_token.token_type}\' was not expected. ' \
                 f'Was expected \'{token_type}\'.'
 
-        self._errors.append(error)
+        self._error(error, self._peek_token)
+
+    def _error(self, message: str, token: Token) -> None:
+        if token.offset < 0:
+            self._errors.append(message)
+        else:
+            self._errors.append(f'{message} ({self._tokens.source_map.position(token.offset)})')
+
+    def _parse_array(self) -> Optional[ArrayLiteral]:
+        assert self._current_token is not None
+
+        array = ArrayLiteral(self._current_token)
+        array.elements = self._parse_expression_list(TokenType.RBRACKET)
+
+        if array.elements is None:
+            return None
+
+        return array
+
+    def _parse_assign_statement(self) -> Optional[AssignStatement]:
+        assert self._current_token is not None
+
+        assign_statement = AssignStatement(token=self._current_token, name=self._parse_identifier())
+
+        self._advance_tokens()
+        self._advance_tokens()
+
+        assign_statement.value = self._parse_expression(Precedence.LOWEST)
+
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
+
+        return assign_statement
 
     def _parse_block(self) -> Block:
         assert self._current_token is not None
@@ -127,34 +166,34 @@ class Parser:
         assert self._current_token is not None
 
         call = Call(self._current_token, function)
-        call.arguments = self._parse_call_arguments()
+        call.arguments = self._parse_expression_list(TokenType.RPAREN)
 
         return call
 
-    def _parse_call_arguments(self) -> Optional[List[Expression]]:
-        arguments: List[Expression] = []
+    def _parse_expression_list(self, end: TokenType) -> Optional[List[Expression]]:
+        expressions: List[Expression] = []
 
         assert self._peek_token is not None
 
-        if self._peek_token.token_type == TokenType.RPAREN:
+        if self._peek_token.token_type == end:
             self._advance_tokens()
-            return arguments
+            return expressions
         self._advance_tokens()
 
         if expression := self._parse_expression(Precedence.LOWEST):
-            arguments.append(expression)
+            expressions.append(expression)
 
         while self._peek_token.token_type == TokenType.COMMA:
             self._advance_tokens()
             self._advance_tokens()
 
             if expression := self._parse_expression(Precedence.LOWEST):
-                arguments.append(expression)
+                expressions.append(expression)
 
-        if not self._expected_token(TokenType.RPAREN):
+        if not self._expected_token(end):
             return None
 
-        return arguments
+        return expressions
 
     def _parse_statement(self) -> Optional[Statement]:
         assert self._current_token is not None
@@ -163,6 +202,13 @@ class Parser:
             return self._parse_let_statement()
         elif self._current_token.token_type == TokenType.RETURN:
             return self._parse_return_statement()
+        elif self._current_token.token_type == TokenType.WHILE:
+            return self._parse_while_statement()
+        elif self._current_token.token_type == TokenType.FOR:
+            return self._parse_for_statement()
+        elif self._current_token.token_type == TokenType.IDENTIFIER \
+                and self._peek_token is not None and self._peek_token.token_type == TokenType.ASSIGN:
+            return self._parse_assign_statement()
         else:
             return self._parse_expression_statements()
 
@@ -172,7 +218,7 @@ class Parser:
             prefix_parse_funcs = self._prefix_parse_funcs[self._current_token.token_type]
         except KeyError:
             message = f'There is no function that can parse \'{self._current_token.literal}\''
-            self._errors.append(message)
+            self._error(message, self._current_token)
             return None
 
         left_expression = prefix_parse_funcs()
@@ -255,6 +301,37 @@ class Parser:
 
         return expression
 
+    def _parse_hash(self) -> Optional[HashLiteral]:
+        assert self._current_token is not None
+
+        hash_literal = HashLiteral(self._current_token, [])
+
+        assert self._peek_token is not None and hash_literal.pairs is not None
+
+        while self._peek_token.token_type != TokenType.RBRACE:
+            self._advance_tokens()
+
+            key = self._parse_expression(Precedence.LOWEST)
+
+            if not self._expected_token(TokenType.COLON):
+                return None
+            self._advance_tokens()
+
+            value = self._parse_expression(Precedence.LOWEST)
+
+            if key is None or value is None:
+                return None
+
+            hash_literal.pairs.append((key, value))
+
+            if self._peek_token.token_type != TokenType.RBRACE and not self._expected_token(TokenType.COMMA):
+                return None
+
+        if not self._expected_token(TokenType.RBRACE):
+            return None
+
+        return hash_literal
+
     def _parse_identifier(self) -> Identifier:
         assert self._current_token is not None
 
@@ -290,6 +367,20 @@ class Parser:
 
         return if_expression
 
+    def _parse_index(self, left: Expression) -> Optional[Index]:
+        assert self._current_token is not None
+
+        index = Index(self._current_token, left)
+
+        self._advance_tokens()
+
+        index.index = self._parse_expression(Precedence.LOWEST)
+
+        if not self._expected_token(TokenType.RBRACKET):
+            return None
+
+        return index
+
     def _parse_infix_expression(self, left: Expression) -> Infix:
         assert self._current_token is not None
 
@@ -311,7 +402,7 @@ class Parser:
             integer.value = int(self._current_token.literal)
         except ValueError:
             message = f'Can\'t parse \'{self._current_token.literal}\' to an integer.'
-            self._errors.append(message)
+            self._error(message, self._current_token)
             return None
         return integer
 
@@ -352,6 +443,61 @@ class Parser:
         assert self._current_token is not None
         return StringLiteral(self._current_token, self._current_token.literal)
 
+    def _parse_while_statement(self) -> Optional[WhileStatement]:
+        assert self._current_token is not None
+
+        while_statement = WhileStatement(self._current_token)
+
+        if not self._expected_token(TokenType.LPAREN):
+            return None
+        self._advance_tokens()
+
+        while_statement.condition = self._parse_expression(Precedence.LOWEST)
+
+        if not self._expected_token(TokenType.RPAREN):
+            return None
+        if not self._expected_token(TokenType.LBRACE):
+            return None
+
+        while_statement.body = self._parse_block()
+
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
+
+        return while_statement
+
+    def _parse_for_statement(self) -> Optional[ForStatement]:
+        assert self._current_token is not None
+
+        for_statement = ForStatement(self._current_token)
+
+        if not self._expected_token(TokenType.LPAREN):
+            return None
+        if not self._expected_token(TokenType.IDENTIFIER):
+            return None
+
+        for_statement.name = self._parse_identifier()
+
+        if not self._expected_token(TokenType.IN):
+            return None
+        self._advance_tokens()
+
+        for_statement.iterable = self._parse_expression(Precedence.LOWEST)
+
+        if not self._expected_token(TokenType.RPAREN):
+            return None
+        if not self._expected_token(TokenType.LBRACE):
+            return None
+
+        for_statement.body = self._parse_block()
+
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
+
+        return for_statement
+
     def _parse_return_statement(self) -> Optional[ReturnStatement]:
         assert self._current_token is not None
         return_statement = ReturnStatement(token=self._current_token)
@@ -384,7 +530,8 @@ class Parser:
             TokenType.NOT_EQUAL: self._parse_infix_expression,
             TokenType.LESS_THAN: self._parse_infix_expression,
             TokenType.GREATER_THAN: self._parse_infix_expression,
-            TokenType.LPAREN: self._parse_call
+            TokenType.LPAREN: self._parse_call,
+            TokenType.LBRACKET: self._parse_index
         }
 
     def _register_prefix_funcs(self) -> PrefixParseFuncs:
@@ -395,6 +542,8 @@ class Parser:
             TokenType.IDENTIFIER: self._parse_identifier,
             TokenType.IF: self._parse_if,
             TokenType.INT: self._parse_integer,
+            TokenType.LBRACKET: self._parse_array,
+            TokenType.LBRACE: self._parse_hash,
             TokenType.LPAREN: self._parse_grouped_expression,
             TokenType.MINUS: self._parse_prefix_expression,
             TokenType.NEGATION: self._parse_prefix_expression,
@@ -0,0 +1,220 @@
+import threading
+from time import perf_counter
+from typing import Callable, cast, Dict, List, Optional, Union
+
+import cantte.ast as ast
+import cantte.evaluator as evaluator
+from cantte.lexer import SourceMap
+from cantte.object import Environment, Frame, Function, Object
+
+PROGRAM_FRAME: str = '<program>'
+
+
+class NodeStatistics:
+
+    __slots__ = ('count', 'self_time', 'total_time')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.self_time = 0.0
+        self.total_time = 0.0
+
+
+class FunctionStatistics:
+
+    __slots__ = ('calls', 'self_time', 'total_time')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.self_time = 0.0
+        self.total_time = 0.0
+
+
+class _Entry:
+
+    __slots__ = ('key', 'start', 'child_time')
+
+    def __init__(self, key: str, start: float) -> None:
+        self.key = key
+        self.start = start
+        self.child_time = 0.0
+
+
+class Profiler:
+
+    def __init__(self, clock: Callable[[], float] = perf_counter, source: Optional[str] = None) -> None:
+        self.nodes: Dict[str, NodeStatistics] = {}
+        self.functions: Dict[str, FunctionStatistics] = {}
+        self.stacks: Dict[str, float] = {}
+        self._clock = clock
+        self._source_map: Optional[SourceMap] = SourceMap(source) if source is not None else None
+        self._labels: Dict[ast.Block, str] = {}
+        self._node_stack: List[_Entry] = []
+        self._node_depths: Dict[str, int] = {}
+        self._call_stack: List[_Entry] = [_Entry(PROGRAM_FRAME, 0.0)]
+        self._call_depths: Dict[str, int] = {}
+        self._evaluate: Optional[Callable] = None
+        self._evaluate_function_body: Optional[Callable] = None
+        self._thread: Optional[int] = None
+
+    def __enter__(self) -> 'Profiler':
+        self.enable()
+
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.disable()
+
+    def enable(self) -> None:
+        if self._evaluate is not None:
+            return
+
+        self._evaluate = evaluator.evaluate
+        self._evaluate_function_body = evaluator._evaluate_function_body
+        self._thread = threading.get_ident()
+        self._call_stack[0].start = self._clock()
+
+        setattr(evaluator, 'evaluate', self._profiled_evaluate)
+        setattr(evaluator, '_evaluate_function_body', self._profiled_function_body)
+
+    def disable(self) -> None:
+        if self._evaluate is None:
+            return
+
+        setattr(evaluator, 'evaluate', self._evaluate)
+        setattr(evaluator, '_evaluate_function_body', self._evaluate_function_body)
+        self._evaluate = None
+        self._evaluate_function_body = None
+        self._thread = None
+
+        root = self._call_stack[0]
+        elapsed = self._clock() - root.start
+        self._add_stack(PROGRAM_FRAME, elapsed - root.child_time)
+        root.child_time = 0.0
+
+    def run(self, program: ast.Program, env: Union[Frame, Environment]) -> Optional[Object]:
+        self.register(program)
+
+        with self:
+            return evaluator.evaluate(program, env)
+
+    def register(self, node: ast.ASTNode) -> None:
+        if type(node) == ast.LetStatement:
+            let_statement = cast(ast.LetStatement, node)
+
+            if type(let_statement.value) == ast.Function and let_statement.name is not None:
+                function = cast(ast.Function, let_statement.value)
+
+                if function.body is not None:
+                    self._labels[function.body] = self._signature(let_statement.name.value, function)
+
+        for child in node.children():
+            self.register(child)
+
+    def report(self, limit: Optional[int] = None) -> str:
+        lines: List[str] = [f'{"node type":<24}{"count":>12}{"self (ms)":>14}{"total (ms)":>14}']
+
+        for name, node in sorted(self.nodes.items(), key=lambda item: item[1].self_time, reverse=True)[:limit]:
+            lines.append(f'{name:<24}{node.count:>12}{node.self_time * 1e3:>14.3f}{node.total_time * 1e3:>14.3f}')
+
+        lines.append('')
+        lines.append(f'{"function":<40}{"calls":>12}{"self (ms)":>14}{"total (ms)":>14}')
+
+        functions = sorted(self.functions.items(), key=lambda item: item[1].self_time, reverse=True)[:limit]
+        for label, function in functions:
+            lines.append(f'{label:<40}{function.calls:>12}'
+                         f'{function.self_time * 1e3:>14.3f}{function.total_time * 1e3:>14.3f}')
+
+        return '\n'.join(lines)
+
+    def collapsed_stacks(self) -> List[str]:
+        return [f'{stack} {round(seconds * 1e6)}' for stack, seconds in sorted(self.stacks.items())]
+
+    def write_collapsed_stacks(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as output:
+            for line in self.collapsed_stacks():
+                output.write(line + '\n')
+
+    def _profiled_evaluate(self, node: ast.ASTNode, env: Union[Frame, Environment]) -> Optional[Object]:
+        assert self._evaluate is not None
+
+        if threading.get_ident() != self._thread:
+            return self._evaluate(node, env)
+
+        key = type(node).__name__
+        depth = self._node_depths.get(key, 0)
+        entry = _Entry(key, self._clock())
+
+        self._node_depths[key] = depth + 1
+        self._node_stack.append(entry)
+        try:
+            return self._evaluate(node, env)
+        finally:
+            elapsed = self._clock() - entry.start
+            self._node_stack.pop()
+            self._node_depths[key] = depth
+
+            if self._node_stack:
+                self._node_stack[-1].child_time += elapsed
+
+            statistics = self.nodes.get(key)
+            if statistics is None:
+                statistics = self.nodes[key] = NodeStatistics()
+
+            statistics.count += 1
+            statistics.self_time += elapsed - entry.child_time
+            if depth == 0:
+                statistics.total_time += elapsed
+
+    def _profiled_function_body(self, function: Function, args: List[Object]) -> Object:
+        assert self._evaluate_function_body is not None
+
+        if threading.get_ident() != self._thread:
+            return self._evaluate_function_body(function, args)
+
+        key = self._label(function)
+        depth = self._call_depths.get(key, 0)
+        entry = _Entry(key, self._clock())
+
+        self._call_depths[key] = depth + 1
+        self._call_stack.append(entry)
+        try:
+            return self._evaluate_function_body(function, args)
+        finally:
+            elapsed = self._clock() - entry.start
+            stack = ';'.join(frame.key for frame in self._call_stack)
+            self._call_stack.pop()
+            self._call_depths[key] = depth
+            self._call_stack[-1].child_time += elapsed
+
+            statistics = self.functions.get(key)
+            if statistics is None:
+                statistics = self.functions[key] = FunctionStatistics()
+
+            statistics.calls += 1
+            statistics.self_time += elapsed - entry.child_time
+            if depth == 0:
+                statistics.total_time += elapsed
+
+            self._add_stack(stack, elapsed - entry.child_time)
+
+    def _add_stack(self, stack: str, seconds: float) -> None:
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + seconds
+
+    def _label(self, function: Function) -> str:
+        try:
+            return self._labels[function.body]
+        except KeyError:
+            label = self._labels[function.body] = self._signature('<anonymous>', function)
+
+            return label
+
+    def _signature(self, name: str, function: Union[ast.Function, Function]) -> str:
+        signature = f'{name}({", ".join(parameter.value for parameter in function.parameters)})'
+
+        if self._source_map is None or function.body is None or function.body.offset < 0:
+            return signature
+
+        position = self._source_map.position(function.body.offset)
+
+        return f'{signature}:{position.line}:{position.column}'
@@ -1,38 +1,81 @@
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
 
 from cantte.ast import Program
 from cantte.lexer import Lexer
 from cantte.token import Token, TokenType
 from cantte.parser import Parser
 from cantte.evaluator import evaluate
-from cantte.object import Environment
+from cantte.object import Environment, Object
 
 
 EOF_TOKEN: Token = Token(TokenType.EOF, '')
 
+Engine = Callable[[Program, Environment], Optional[Object]]
+
+
+def _run_closures(program: Program, env: Environment) -> Optional[Object]:
+    from cantte.closure_compiler import compile_program
+
+    return compile_program(program)(env)
+
+
+def _run_vm(program: Program, env: Environment) -> Optional[Object]:
+    from cantte.compiler import Compiler
+    from cantte.vm import VirtualMachine
+
+    return VirtualMachine(Compiler().compile_program(program)).run(env)
+
+
+def _run_trampolined(program: Program, env: Environment) -> Optional[Object]:
+    from cantte.trampoline import evaluate_trampolined
+
+    return evaluate_trampolined(program, env)
+
+
+ENGINES: Dict[str, Engine] = {
+    'evaluator': evaluate,
+    'closures': _run_closures,
+    'vm': _run_vm,
+    'trampoline': _run_trampolined,
+}
+
 
 def _print_parse_errors(errors: List[str]):
     for error in errors:
         print(error)
 
 
-def start_repl() -> None:
-    scanned: List[str] = []
+class Session:
 
-    while (source := input('>> ')) != 'exit()':
-        scanned.append(source)
-        lexer: Lexer = Lexer(' '.join(scanned))
-        parser: Parser = Parser(lexer)
+    def __init__(self, engine: str = 'evaluator', optimized: bool = False) -> None:
+        self._execute: Engine = ENGINES[engine]
+        self._optimized = optimized
+        self.env: Environment = Environment()
 
+    def run(self, source: str) -> Tuple[Optional[Object], List[str]]:
+        parser: Parser = Parser(Lexer(source))
         program: Program = parser.parse_program()
-        env: Environment = Environment()
 
         if len(parser.errors) > 0:
-            _print_parse_errors(parser.errors)
-            scanned.pop()
-            continue
+            return None, parser.errors
+
+        if self._optimized:
+            from cantte.optimizer import optimize
+
+            program = optimize(program)
+
+        return self._execute(program, self.env), []
 
-        evaluated = evaluate(program, env)
+
+def start_repl(engine: str = 'evaluator', optimized: bool = False) -> None:
+    session: Session = Session(engine, optimized)
+
+    while (source := input('>> ')) != 'exit()':
+        evaluated, errors = session.run(source)
+
+        if len(errors) > 0:
+            _print_parse_errors(errors)
+            continue
 
         if evaluated is not None:
             print(evaluated.inspect())
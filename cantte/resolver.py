@@ -0,0 +1,203 @@
+from typing import cast, Dict, Iterator, List, Optional, Set, Tuple
+
+import cantte.ast as ast
+
+
+class _Context:
+
+    __slots__ = ('slots', 'parameters', 'cells', 'closure', 'closure_slots', 'fallbacks', 'identifiers')
+
+    def __init__(self, slots: Dict[str, int], parameters: int) -> None:
+        self.slots = slots
+        self.parameters = parameters
+        self.cells: Set[int] = set()
+        self.closure: List[Tuple[bool, int]] = []
+        self.closure_slots: Dict[str, int] = {}
+        self.fallbacks: Dict[int, int] = {}
+        self.identifiers: List[ast.Identifier] = []
+
+
+class Resolver:
+
+    def __init__(self) -> None:
+        self._contexts: List[_Context] = []
+
+    def resolve(self, program: ast.Program) -> ast.Program:
+        for statement in program.statements:
+            self._resolve(statement)
+
+        program.resolved = True
+
+        return program
+
+    def _resolve(self, node: ast.ASTNode) -> None:
+        node_type = type(node)
+
+        if node_type == ast.Identifier:
+            self._resolve_identifier(cast(ast.Identifier, node))
+        elif node_type == ast.Function:
+            self._resolve_function(cast(ast.Function, node))
+        else:
+            for child in node.children():
+                self._resolve(child)
+
+    def _resolve_identifier(self, identifier: ast.Identifier) -> None:
+        if self._contexts:
+            context = self._contexts[-1]
+            slot = context.slots.get(identifier.value)
+
+            if slot is not None:
+                identifier.depth = 0
+                identifier.slot = slot
+                context.identifiers.append(identifier)
+
+                if slot >= context.parameters:
+                    self._capture(identifier.value, len(self._contexts) - 1)
+                return
+
+            index = self._capture(identifier.value, len(self._contexts) - 1)
+
+            if index is not None:
+                identifier.depth = ast.FREE
+                identifier.slot = index
+                return
+
+        identifier.depth = ast.GLOBAL
+        identifier.slot = -1
+
+    def _capture(self, name: str, level: int) -> Optional[int]:
+        context = self._contexts[level]
+        index = context.closure_slots.get(name)
+
+        if index is not None or level == 0:
+            return index
+
+        outer = self._contexts[level - 1]
+        slot = outer.slots.get(name)
+
+        if slot is not None:
+            outer.cells.add(slot)
+            context.closure.append((True, slot))
+            index = len(context.closure) - 1
+
+            if slot >= outer.parameters:
+                shadowed = self._capture(name, level - 1)
+
+                if shadowed is not None:
+                    context.fallbacks[index] = _forward(context, outer, shadowed)
+        else:
+            outer_index = self._capture(name, level - 1)
+
+            if outer_index is None:
+                return None
+
+            index = _forward(context, outer, outer_index)
+
+        context.closure_slots[name] = index
+
+        return index
+
+    def _resolve_function(self, function: ast.Function) -> None:
+        names: List[str] = []
+        slots: Dict[str, int] = {}
+
+        for parameter in function.parameters:
+            slots[parameter.value] = len(names)
+            names.append(parameter.value)
+
+        if function.body is not None:
+            for name in _declarations(function.body):
+                if name not in slots:
+                    slots[name] = len(names)
+                    names.append(name)
+
+            _mark_tail_calls(function.body, True)
+
+        context = _Context(slots, len(function.parameters))
+
+        self._contexts.append(context)
+        for child in function.children():
+            self._resolve(child)
+        self._contexts.pop()
+
+        for identifier in context.identifiers:
+            if identifier.slot in context.cells:
+                identifier.depth = ast.CELL
+
+        captures = function.body is not None and _contains_function(function.body)
+        function.scope = ast.Scope(tuple(names), slots, len(function.parameters), captures,
+                                   tuple(sorted(context.cells)), tuple(context.closure), context.closure_slots,
+                                   context.fallbacks)
+
+
+def _forward(context: _Context, outer: _Context, outer_index: int) -> int:
+    context.closure.append((False, outer_index))
+    index = len(context.closure) - 1
+    fallback = outer.fallbacks.get(outer_index)
+
+    if fallback is not None:
+        context.fallbacks[index] = _forward(context, outer, fallback)
+
+    return index
+
+
+def _declarations(node: ast.ASTNode) -> Iterator[str]:
+    for child in node.children():
+        if type(child) == ast.LetStatement:
+            let_statement = cast(ast.LetStatement, child)
+
+            if let_statement.name is not None:
+                yield let_statement.name.value
+        elif type(child) == ast.ForStatement:
+            for_statement = cast(ast.ForStatement, child)
+
+            if for_statement.name is not None:
+                yield for_statement.name.value
+
+        if type(child) != ast.Function:
+            yield from _declarations(child)
+
+
+def _contains_function(node: ast.ASTNode) -> bool:
+    for child in node.children():
+        if type(child) == ast.Function or _contains_function(child):
+            return True
+
+    return False
+
+
+def _mark_tail_calls(node: ast.ASTNode, tail: bool) -> None:
+    node_type = type(node)
+
+    if node_type == ast.Function:
+        return
+    elif node_type == ast.Call:
+        cast(ast.Call, node).tail = tail
+        tail = False
+    elif node_type == ast.ReturnStatement:
+        tail = True
+    elif node_type == ast.Block:
+        statements = cast(ast.Block, node).statements
+
+        for idx, statement in enumerate(statements):
+            _mark_tail_calls(statement, tail and idx == len(statements) - 1)
+        return
+    elif node_type == ast.If:
+        if_expression = cast(ast.If, node)
+
+        assert if_expression.condition is not None
+
+        _mark_tail_calls(if_expression.condition, False)
+        for branch in (if_expression.consequence, if_expression.alternative):
+            if branch is not None:
+                _mark_tail_calls(branch, tail)
+        return
+    elif node_type != ast.ExpressionStatement:
+        tail = False
+
+    for child in node.children():
+        _mark_tail_calls(child, tail)
+
+
+def resolve(program: ast.Program) -> ast.Program:
+    return Resolver().resolve(program)
@@ -0,0 +1,111 @@
+from typing import Any, Callable, cast, List, Mapping, Optional
+
+from cantte.ast import Program
+from cantte.lexer import Lexer
+from cantte.object import Environment, FrozenEnvironment, Object, new_array, new_integer, String
+from cantte.parser import Parser
+from cantte.resolver import resolve
+
+Runner = Callable[[Environment], Optional[Object]]
+
+_UNSUPPORTED_VALUE = 'Cannot convert {} to a Cantte object'
+_UNKNOWN_ENGINE = 'Unknown engine: {}'
+
+
+class ScriptError(Exception):
+
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__('\n'.join(errors))
+        self.errors = errors
+
+
+class CompiledScript:
+
+    __slots__ = ('source', 'engine', 'globals', '_runner')
+
+    def __init__(self,
+                 source: str,
+                 globals: Optional[Mapping[str, Any]] = None,
+                 engine: str = 'evaluator',
+                 optimized: bool = False) -> None:
+        parser = Parser(Lexer(source))
+        program = parser.parse_program()
+
+        if len(parser.errors) > 0:
+            raise ScriptError(parser.errors)
+
+        if optimized:
+            from cantte.optimizer import optimize
+
+            program = optimize(program)
+
+        self.source = source
+        self.engine = engine
+        self.globals = FrozenEnvironment({name: to_object(value) for name, value in (globals or {}).items()})
+        self._runner = _prepare(engine, program)
+
+    def run(self, bindings: Optional[Mapping[str, Any]] = None) -> Optional[Object]:
+        env = Environment(outer=self.globals)
+
+        if bindings:
+            for name, value in bindings.items():
+                env[name] = to_object(value)
+
+        return self._runner(env)
+
+
+def to_object(value: Any) -> Object:
+    from cantte.evaluator import FALSE, NULL, TRUE, _new_hash
+
+    if isinstance(value, Object):
+        return value
+    elif value is None:
+        return NULL
+    elif value is True:
+        return TRUE
+    elif value is False:
+        return FALSE
+    elif type(value) is int:
+        return new_integer(value)
+    elif type(value) is str:
+        return String(value)
+    elif isinstance(value, (list, tuple)):
+        return new_array([to_object(element) for element in value])
+    elif isinstance(value, dict):
+        entries: List[Object] = []
+
+        for key, element in value.items():
+            entries.append(to_object(key))
+            entries.append(to_object(element))
+
+        return _new_hash(entries)
+
+    raise TypeError(_UNSUPPORTED_VALUE.format(type(value).__name__))
+
+
+def _prepare(engine: str, program: Program) -> Runner:
+    if engine == 'evaluator':
+        from cantte.evaluator import evaluate
+
+        resolve(program)
+
+        return lambda env: evaluate(program, env)
+    elif engine == 'trampoline':
+        from cantte.trampoline import evaluate_trampolined
+
+        resolve(program)
+
+        return lambda env: evaluate_trampolined(program, env)
+    elif engine == 'closures':
+        from cantte.closure_compiler import compile_program
+
+        return cast(Runner, compile_program(program))
+    elif engine == 'vm':
+        from cantte.compiler import Compiler
+        from cantte.vm import VirtualMachine
+
+        bytecode = Compiler().compile_program(program)
+
+        return lambda env: VirtualMachine(bytecode).run(env)
+
+    raise ValueError(_UNKNOWN_ENGINE.format(engine))
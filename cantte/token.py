@@ -5,19 +5,23 @@ from typing import NamedTuple, Dict
 @unique
 class TokenType(Enum):
     ASSIGN = auto()
+    COLON = auto()
     COMMA = auto()
     DIVISION = auto()
     ELSE = auto()
     EOF = auto()
     EQUAL = auto()
     FALSE = auto()
+    FOR = auto()
     FUNCTION = auto()
     GREATER_THAN = auto()
     IDENTIFIER = auto()
     IF = auto()
     ILLEGAL = auto()
+    IN = auto()
     INT = auto()
     LBRACE = auto()
+    LBRACKET = auto()
     LET = auto()
     LPAREN = auto()
     LESS_THAN = auto()
@@ -27,31 +31,53 @@ class TokenType(Enum):
     NOT_EQUAL = auto()
     PLUS = auto()
     RBRACE = auto()
+    RBRACKET = auto()
     RETURN = auto()
     RPAREN = auto()
     SEMICOLON = auto()
     STRING = auto()
     TRUE = auto()
+    WHILE = auto()
+
+    __hash__ = object.__hash__
 
 
 class Token(NamedTuple):
     token_type: TokenType
     literal: str
+    offset: int = -1
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Token):
+            return NotImplemented
+
+        return self.token_type == other.token_type and self.literal == other.literal
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        return hash((self.token_type, self.literal))
 
     def __str__(self) -> str:
         return f'Type: {self.token_type}, Literal: {self.literal}'
 
 
-def lookup_token_type(literal: str) -> TokenType:
-    keywords: Dict[str, TokenType] = {
-        'false': TokenType.FALSE,
-        'func': TokenType.FUNCTION,
-        'return': TokenType.RETURN,
-        'if': TokenType.IF,
-        'else': TokenType.ELSE,
-        'let': TokenType.LET,
-        'true': TokenType.TRUE
-    }
-
-    return keywords.get(literal, TokenType.IDENTIFIER)
+KEYWORDS: Dict[str, TokenType] = {
+    'false': TokenType.FALSE,
+    'func': TokenType.FUNCTION,
+    'return': TokenType.RETURN,
+    'if': TokenType.IF,
+    'else': TokenType.ELSE,
+    'let': TokenType.LET,
+    'true': TokenType.TRUE,
+    'while': TokenType.WHILE,
+    'for': TokenType.FOR,
+    'in': TokenType.IN,
+}
 
+
+def lookup_token_type(literal: str) -> TokenType:
+    return KEYWORDS.get(literal, TokenType.IDENTIFIER)
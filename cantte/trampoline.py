@@ -0,0 +1,386 @@
+import asyncio
+from inspect import isawaitable
+from typing import Any, cast, Generator, Iterator, List, Optional, Tuple, Type, Union
+
+import cantte.ast as ast
+import cantte.limits as limits
+from cantte.evaluator import (evaluate, NULL, _assign, _evaluate_index_expression, _evaluate_infix_expression,
+                              _evaluate_prefix_expression, _extent_function_environment,
+                              _is_truthy, _iterate, _locate_error, _new_error, _new_hash, _NOT_A_FUNCTION,
+                              _release_frame, _unwrap_return_value, _WRONG_NUMBER_OF_ARGUMENTS)
+from cantte.object import (Builtin, Environment, Error, Frame, Function, Hash, new_array, Object,
+                           Return, TailCall)
+from cantte.resolver import resolve
+
+Evaluation = Generator[Any, Optional[Object], Optional[Object]]
+
+YIELD_EVERY: int = 1000
+
+_LEAVES: Tuple[Type, ...] = (ast.Identifier, ast.Integer, ast.Boolean, ast.StringLiteral, ast.Function)
+
+
+def evaluate_trampolined(node: ast.ASTNode, env: Union[Frame, Environment]) -> Optional[Object]:
+    return run(_evaluate(node, env))
+
+
+def run(evaluation: Evaluation) -> Optional[Object]:
+    stack: List[Evaluation] = []
+    value: Optional[Object] = None
+
+    while True:
+        try:
+            child = evaluation.send(value)
+        except StopIteration as stop:
+            if not stack:
+                return stop.value
+
+            evaluation = stack.pop()
+            value = stop.value
+            continue
+
+        stack.append(evaluation)
+        evaluation = child
+        value = None
+
+
+async def evaluate_async(node: ast.ASTNode,
+                         env: Union[Frame, Environment],
+                         yield_every: int = YIELD_EVERY) -> Optional[Object]:
+    return await run_async(_evaluate(node, env), yield_every)
+
+
+async def run_async(evaluation: Evaluation, yield_every: int = YIELD_EVERY) -> Optional[Object]:
+    stack: List[Evaluation] = []
+    value: Optional[Object] = None
+    countdown = yield_every
+
+    while True:
+        countdown -= 1
+
+        if countdown == 0:
+            countdown = yield_every
+            await asyncio.sleep(0)
+
+        try:
+            child = evaluation.send(value)
+        except StopIteration as stop:
+            value = stop.value
+
+            if isawaitable(value):
+                value = await cast(Any, value)
+
+            if not stack:
+                return value
+
+            evaluation = stack.pop()
+            continue
+
+        stack.append(evaluation)
+        evaluation = child
+        value = None
+
+
+def _evaluate(node: ast.ASTNode, env: Union[Frame, Environment]) -> Evaluation:
+    node_type: Type = type(node)
+    value: Optional[Object]
+
+    if node_type in _LEAVES:
+        return evaluate(node, env)
+    elif node_type == ast.ExpressionStatement:
+        expression = cast(ast.ExpressionStatement, node).expression
+
+        assert expression is not None
+
+        return evaluate(expression, env) if type(expression) in _LEAVES else (yield _evaluate(expression, env))
+    elif node_type == ast.Call:
+        return (yield from _evaluate_call(cast(ast.Call, node), env))
+    elif node_type == ast.Infix:
+        node = cast(ast.Infix, node)
+
+        assert node.left is not None and node.right is not None
+
+        left = evaluate(node.left, env) if type(node.left) in _LEAVES else (yield _evaluate(node.left, env))
+        right = evaluate(node.right, env) if type(node.right) in _LEAVES else (yield _evaluate(node.right, env))
+
+        assert left is not None and right is not None
+
+        return _evaluate_infix_expression(node.operator, left, right)
+    elif node_type == ast.Block:
+        return (yield from _evaluate_block_statement(cast(ast.Block, node), env))
+    elif node_type == ast.If:
+        return (yield from _evaluate_if_expression(cast(ast.If, node), env))
+    elif node_type == ast.ReturnStatement:
+        node = cast(ast.ReturnStatement, node)
+
+        assert node.return_value is not None
+
+        value = evaluate(node.return_value, env) if type(node.return_value) in _LEAVES \
+            else (yield _evaluate(node.return_value, env))
+
+        assert value is not None
+
+        if type(value) is Error:
+            return value
+
+        return Return(value)
+    elif node_type == ast.LetStatement:
+        node = cast(ast.LetStatement, node)
+
+        assert node.name is not None and node.value is not None
+
+        value = evaluate(node.value, env) if type(node.value) in _LEAVES else (yield _evaluate(node.value, env))
+
+        if node.name.depth >= 0:
+            cast(Frame, env).values[node.name.slot] = value
+        elif node.name.depth == ast.CELL:
+            cast(Frame, env).values[node.name.slot].value = value
+        else:
+            cast(Environment, env)[node.name.value] = value
+    elif node_type == ast.AssignStatement:
+        node = cast(ast.AssignStatement, node)
+
+        assert node.name is not None and node.value is not None
+
+        value = evaluate(node.value, env) if type(node.value) in _LEAVES else (yield _evaluate(node.value, env))
+
+        assert value is not None
+
+        if type(value) is Error:
+            return value
+
+        return _assign(node.name, value, env)
+    elif node_type == ast.WhileStatement:
+        return (yield from _evaluate_while_statement(cast(ast.WhileStatement, node), env))
+    elif node_type == ast.ForStatement:
+        return (yield from _evaluate_for_statement(cast(ast.ForStatement, node), env))
+    elif node_type == ast.Prefix:
+        node = cast(ast.Prefix, node)
+
+        assert node.right is not None
+
+        value = evaluate(node.right, env) if type(node.right) in _LEAVES else (yield _evaluate(node.right, env))
+
+        assert value is not None
+
+        return _evaluate_prefix_expression(node.operator, value)
+    elif node_type == ast.Program:
+        return (yield from _evaluate_program(cast(ast.Program, node), env))
+    elif node_type == ast.ArrayLiteral:
+        node = cast(ast.ArrayLiteral, node)
+        elements: List[Object] = []
+
+        assert node.elements is not None
+
+        for element in node.elements:
+            value = evaluate(element, env) if type(element) in _LEAVES else (yield _evaluate(element, env))
+
+            assert value is not None
+
+            elements.append(value)
+
+        budget = limits.active.get()
+
+        if budget is not None:
+            budget.check_size(len(elements))
+
+        return new_array(elements)
+    elif node_type == ast.Index:
+        node = cast(ast.Index, node)
+
+        assert node.index is not None
+
+        left = evaluate(node.left, env) if type(node.left) in _LEAVES else (yield _evaluate(node.left, env))
+        value = evaluate(node.index, env) if type(node.index) in _LEAVES else (yield _evaluate(node.index, env))
+
+        assert left is not None and value is not None
+
+        return _evaluate_index_expression(left, value)
+    elif node_type == ast.HashLiteral:
+        node = cast(ast.HashLiteral, node)
+        entries: List[Object] = []
+
+        assert node.pairs is not None
+
+        for pair in node.pairs:
+            for expression in pair:
+                value = evaluate(expression, env) if type(expression) in _LEAVES else (yield _evaluate(expression, env))
+
+                assert value is not None
+
+                entries.append(value)
+
+        hash_object = _new_hash(entries)
+        budget = limits.active.get()
+
+        if budget is not None and type(hash_object) is Hash:
+            budget.check_size(len(cast(Hash, hash_object)))
+
+        return hash_object
+
+    return None
+
+
+def _evaluate_call(node: ast.Call, env: Union[Frame, Environment]) -> Evaluation:
+    function = evaluate(node.function, env) if type(node.function) in _LEAVES \
+        else (yield _evaluate(node.function, env))
+    args: List[Object] = []
+
+    assert node.arguments is not None
+
+    for argument in node.arguments:
+        evaluated = evaluate(argument, env) if type(argument) in _LEAVES else (yield _evaluate(argument, env))
+
+        assert evaluated is not None
+
+        args.append(evaluated)
+
+    assert function is not None
+
+    if node.tail:
+        return TailCall(function, args)
+
+    budget = limits.active.get()
+
+    if budget is not None and isinstance(function, Function):
+        budget.enter()
+
+    while isinstance(function, Function):
+        if len(args) != len(function.parameters):
+            evaluated = _new_error(_WRONG_NUMBER_OF_ARGUMENTS, [len(function.parameters), len(args)])
+        else:
+            call_env = _extent_function_environment(function, args)
+            evaluated = yield _evaluate(function.body, call_env)
+
+            if type(call_env) is Frame and not cast(Frame, call_env).scope.captures:
+                _release_frame(cast(Frame, call_env))
+
+            evaluated = NULL if evaluated is None else _unwrap_return_value(evaluated)
+
+        if type(evaluated) is not TailCall:
+            if budget is not None:
+                budget.leave()
+
+            return evaluated
+
+        function = cast(TailCall, evaluated).function
+        args = cast(TailCall, evaluated).arguments
+
+        if budget is not None:
+            budget.step()
+
+    if budget is not None:
+        budget.leave()
+
+    if type(function) == Builtin:
+        return cast(Builtin, function).function(*args)
+
+    return _new_error(_NOT_A_FUNCTION, [function.type().name])
+
+
+def _evaluate_block_statement(block: ast.Block, env: Union[Frame, Environment]) -> Evaluation:
+    result: Optional[Object] = None
+
+    for statement in block.statements:
+        result = yield _evaluate(statement, env)
+
+        if type(result) is Return:
+            return result
+        elif type(result) is Error:
+            return _locate_error(cast(Error, result), statement)
+
+    return result
+
+
+def _evaluate_if_expression(if_expression: ast.If, env: Union[Frame, Environment]) -> Evaluation:
+    assert if_expression.condition is not None
+
+    condition = evaluate(if_expression.condition, env) if type(if_expression.condition) in _LEAVES \
+        else (yield _evaluate(if_expression.condition, env))
+
+    assert condition is not None
+
+    if _is_truthy(condition):
+        assert if_expression.consequence is not None
+
+        return (yield _evaluate(if_expression.consequence, env))
+    elif if_expression.alternative is not None:
+        return (yield _evaluate(if_expression.alternative, env))
+
+    return NULL
+
+
+def _evaluate_while_statement(statement: ast.WhileStatement, env: Union[Frame, Environment]) -> Evaluation:
+    assert statement.condition is not None and statement.body is not None
+
+    budget = limits.active.get()
+
+    while True:
+        if budget is not None:
+            budget.step()
+
+        condition = evaluate(statement.condition, env) if type(statement.condition) in _LEAVES \
+            else (yield _evaluate(statement.condition, env))
+
+        assert condition is not None
+
+        if type(condition) is Error:
+            return condition
+        elif not _is_truthy(condition):
+            return None
+
+        result = yield _evaluate(statement.body, env)
+
+        if type(result) is Return or type(result) is Error:
+            return result
+
+
+def _evaluate_for_statement(statement: ast.ForStatement, env: Union[Frame, Environment]) -> Evaluation:
+    assert statement.name is not None and statement.iterable is not None and statement.body is not None
+
+    iterable = evaluate(statement.iterable, env) if type(statement.iterable) in _LEAVES \
+        else (yield _evaluate(statement.iterable, env))
+
+    assert iterable is not None
+
+    values = _iterate(iterable)
+
+    if type(values) is Error:
+        return values
+
+    name = statement.name
+    budget = limits.active.get()
+
+    for value in cast(Iterator[Object], values):
+        if budget is not None:
+            budget.step()
+
+        if name.depth >= 0:
+            cast(Frame, env).values[name.slot] = value
+        elif name.depth == ast.CELL:
+            cast(Frame, env).values[name.slot].value = value
+        else:
+            cast(Environment, env)[name.value] = value
+
+        result = yield _evaluate(statement.body, env)
+
+        if type(result) is Return or type(result) is Error:
+            return result
+
+    return None
+
+
+def _evaluate_program(program: ast.Program, env: Union[Frame, Environment]) -> Evaluation:
+    result: Optional[Object] = None
+
+    if not program.resolved:
+        resolve(program)
+
+    for statement in program.statements:
+        result = yield _evaluate(statement, env)
+
+        if type(result) is Return:
+            return cast(Return, result).value
+        elif type(result) is Error:
+            return _locate_error(cast(Error, result), statement)
+
+    return result
@@ -0,0 +1,314 @@
+from typing import Any, cast, List, Optional
+
+from cantte.ast import Block, Identifier
+from cantte.buildtins import BUILTINS
+from cantte.compiler import Bytecode, FunctionCode, OpCode
+from cantte.evaluator import (FALSE, NULL, TRUE, _apply_function,
+                              _evaluate_index_expression, _evaluate_infix_expression,
+                              _evaluate_prefix_expression, _iterate, _new_error, _new_hash,
+                              _NOT_A_FUNCTION, _UNKNOWN_IDENTIFIER, _WRONG_NUMBER_OF_ARGUMENTS)
+from cantte.object import Builtin, Environment, Error, Function, Integer, new_array, new_integer, Object
+
+_CONSTANT = OpCode.CONSTANT.value
+_TRUE = OpCode.TRUE.value
+_FALSE = OpCode.FALSE.value
+_NULL = OpCode.NULL.value
+_NONE = OpCode.NONE.value
+_POP = OpCode.POP.value
+_POP_STATEMENT = OpCode.POP_STATEMENT.value
+_ADD = OpCode.ADD.value
+_SUB = OpCode.SUB.value
+_MUL = OpCode.MUL.value
+_DIV = OpCode.DIV.value
+_EQUAL = OpCode.EQUAL.value
+_NOT_EQUAL = OpCode.NOT_EQUAL.value
+_LESS_THAN = OpCode.LESS_THAN.value
+_GREATER_THAN = OpCode.GREATER_THAN.value
+_BANG = OpCode.BANG.value
+_MINUS = OpCode.MINUS.value
+_JUMP = OpCode.JUMP.value
+_JUMP_NOT_TRUTHY = OpCode.JUMP_NOT_TRUTHY.value
+_GET_NAME = OpCode.GET_NAME.value
+_SET_NAME = OpCode.SET_NAME.value
+_CLOSURE = OpCode.CLOSURE.value
+_CALL = OpCode.CALL.value
+_RETURN_VALUE = OpCode.RETURN_VALUE.value
+_ARRAY = OpCode.ARRAY.value
+_INDEX = OpCode.INDEX.value
+_HASH = OpCode.HASH.value
+_ASSIGN_NAME = OpCode.ASSIGN_NAME.value
+_LOOP_TEST = OpCode.LOOP_TEST.value
+_ITERATE = OpCode.ITERATE.value
+_FOR_ITER = OpCode.FOR_ITER.value
+_END_FOR = OpCode.END_FOR.value
+
+_OPERATORS: List[str] = [''] * len(OpCode)
+_OPERATORS[_ADD] = '+'
+_OPERATORS[_SUB] = '-'
+_OPERATORS[_MUL] = '*'
+_OPERATORS[_DIV] = '/'
+_OPERATORS[_EQUAL] = '=='
+_OPERATORS[_NOT_EQUAL] = '!='
+_OPERATORS[_LESS_THAN] = '<'
+_OPERATORS[_GREATER_THAN] = '>'
+
+
+class Closure(Function):
+
+    __slots__ = ('code',)
+
+    def __init__(self, parameters: List[Identifier], body: Block, env: Environment, code: FunctionCode) -> None:
+        super().__init__(parameters, body, env)
+        self.code = code
+
+
+class Frame:
+
+    __slots__ = ('code', 'env', 'base_pointer', 'ip')
+
+    def __init__(self, code: FunctionCode, env: Environment, base_pointer: int) -> None:
+        self.code = code
+        self.env = env
+        self.base_pointer = base_pointer
+        self.ip = 0
+
+
+class VirtualMachine:
+
+    def __init__(self, bytecode: Bytecode) -> None:
+        self._bytecode = bytecode
+
+    def run(self, env: Environment) -> Optional[Object]:
+        operators = _OPERATORS
+
+        stack: List[Any] = []
+        push = stack.append
+        pop = stack.pop
+
+        frame = Frame(self._bytecode.main, env, 0)
+        frames: List[Frame] = []
+        instructions = frame.code.instructions
+        offsets = frame.code.offsets
+        constants = frame.code.constants
+        names = frame.code.names
+        ip = 0
+
+        while True:
+            opcode = instructions[ip]
+            ip += 1
+
+            if opcode == _GET_NAME:
+                name = names[instructions[ip]]
+                ip += 1
+
+                try:
+                    push(env[name])
+                except KeyError:
+                    builtin = BUILTINS.get(name, _new_error(_UNKNOWN_IDENTIFIER, [name]))
+                    push(_located(builtin, offsets[ip - 1]) if type(builtin) is Error else builtin)
+            elif opcode == _CONSTANT:
+                push(constants[instructions[ip]])
+                ip += 1
+            elif opcode == _ADD or opcode == _SUB or opcode == _MUL or opcode == _DIV:
+                right = pop()
+                left = stack[-1]
+
+                if type(left) is Integer and type(right) is Integer:
+                    if opcode == _ADD:
+                        stack[-1] = new_integer(left.value + right.value)
+                    elif opcode == _SUB:
+                        stack[-1] = new_integer(left.value - right.value)
+                    elif opcode == _MUL:
+                        stack[-1] = new_integer(left.value * right.value)
+                    else:
+                        stack[-1] = new_integer(left.value // right.value)
+                else:
+                    value = _evaluate_infix_expression(operators[opcode], left, right)
+                    stack[-1] = _located(value, offsets[ip - 1]) if type(value) is Error else value
+            elif opcode == _LESS_THAN or opcode == _GREATER_THAN or opcode == _EQUAL or opcode == _NOT_EQUAL:
+                right = pop()
+                left = stack[-1]
+
+                if type(left) is Integer and type(right) is Integer:
+                    if opcode == _LESS_THAN:
+                        stack[-1] = TRUE if left.value < right.value else FALSE
+                    elif opcode == _GREATER_THAN:
+                        stack[-1] = TRUE if left.value > right.value else FALSE
+                    elif opcode == _EQUAL:
+                        stack[-1] = TRUE if left.value == right.value else FALSE
+                    else:
+                        stack[-1] = TRUE if left.value != right.value else FALSE
+                else:
+                    value = _evaluate_infix_expression(operators[opcode], left, right)
+                    stack[-1] = _located(value, offsets[ip - 1]) if type(value) is Error else value
+            elif opcode == _JUMP_NOT_TRUTHY:
+                condition = pop()
+
+                if condition is FALSE or condition is NULL:
+                    ip = instructions[ip]
+                else:
+                    ip += 1
+            elif opcode == _JUMP:
+                ip = instructions[ip]
+            elif opcode == _CALL:
+                argument_count = instructions[ip]
+                ip += 1
+
+                function = stack[-1 - argument_count]
+
+                if type(function) is Closure and len(function.code.parameter_names) != argument_count:
+                    del stack[len(stack) - argument_count - 1:]
+                    push(_located(_new_error(_WRONG_NUMBER_OF_ARGUMENTS,
+                                             [len(function.code.parameter_names), argument_count]), offsets[ip - 1]))
+                elif type(function) is Closure:
+                    code = function.code
+                    call_env = Environment(outer=function.env)
+                    args = stack[len(stack) - argument_count:]
+
+                    for idx, name in enumerate(code.parameter_names):
+                        call_env[name] = args[idx]
+
+                    frame.ip = ip
+                    frames.append(frame)
+
+                    frame = Frame(code, call_env, len(stack) - argument_count - 1)
+                    env = call_env
+                    instructions = code.instructions
+                    offsets = code.offsets
+                    constants = code.constants
+                    names = code.names
+                    ip = 0
+                else:
+                    args = stack[len(stack) - argument_count:]
+                    del stack[len(stack) - argument_count - 1:]
+                    value = _call_object(function, args)
+                    push(_located(value, offsets[ip - 1]) if type(value) is Error else value)
+            elif opcode == _RETURN_VALUE:
+                value = pop()
+
+                if not frames:
+                    return value
+
+                del stack[frame.base_pointer:]
+                push(value if value is not None else NULL)
+
+                frame = frames.pop()
+                env = frame.env
+                instructions = frame.code.instructions
+                offsets = frame.code.offsets
+                constants = frame.code.constants
+                names = frame.code.names
+                ip = frame.ip
+            elif opcode == _POP_STATEMENT:
+                if type(stack[-1]) is Error:
+                    ip = instructions[ip]
+                else:
+                    pop()
+                    ip += 1
+            elif opcode == _SET_NAME:
+                env[names[instructions[ip]]] = pop()
+                ip += 1
+            elif opcode == _TRUE:
+                push(TRUE)
+            elif opcode == _FALSE:
+                push(FALSE)
+            elif opcode == _NULL:
+                push(NULL)
+            elif opcode == _NONE:
+                push(None)
+            elif opcode == _POP:
+                pop()
+            elif opcode == _BANG:
+                value = stack[-1]
+                stack[-1] = TRUE if value is FALSE or value is NULL else FALSE
+            elif opcode == _MINUS:
+                value = stack[-1]
+
+                if type(value) is Integer:
+                    stack[-1] = new_integer(-value.value)
+                else:
+                    value = _evaluate_prefix_expression('-', value)
+                    stack[-1] = _located(value, offsets[ip - 1]) if type(value) is Error else value
+            elif opcode == _CLOSURE:
+                code = cast(FunctionCode, constants[instructions[ip]])
+                ip += 1
+
+                assert code.body is not None
+
+                push(Closure(code.parameters, code.body, env, code))
+            elif opcode == _ARRAY:
+                element_count = instructions[ip]
+                ip += 1
+
+                elements = stack[len(stack) - element_count:]
+                del stack[len(stack) - element_count:]
+                push(new_array(elements))
+            elif opcode == _INDEX:
+                index = pop()
+                value = _evaluate_index_expression(stack[-1], index)
+                stack[-1] = _located(value, offsets[ip - 1]) if type(value) is Error else value
+            elif opcode == _HASH:
+                entry_count = instructions[ip] * 2
+                ip += 1
+
+                entries = stack[len(stack) - entry_count:]
+                del stack[len(stack) - entry_count:]
+                value = _new_hash(entries)
+                push(_located(value, offsets[ip - 1]) if type(value) is Error else value)
+            elif opcode == _ASSIGN_NAME:
+                name = names[instructions[ip]]
+                ip += 1
+
+                if type(stack[-1]) is not Error:
+                    if env.assign(name, stack[-1]):
+                        stack[-1] = None
+                    else:
+                        stack[-1] = _located(_new_error(_UNKNOWN_IDENTIFIER, [name]), offsets[ip - 1])
+            elif opcode == _LOOP_TEST:
+                condition = stack[-1]
+
+                if condition is FALSE or condition is NULL:
+                    stack[-1] = None
+                    ip = instructions[ip]
+                elif type(condition) is Error:
+                    ip = instructions[ip]
+                else:
+                    pop()
+                    ip += 1
+            elif opcode == _FOR_ITER:
+                try:
+                    push(next(stack[-1]))
+                    ip += 1
+                except StopIteration:
+                    stack[-1] = None
+                    ip = instructions[ip]
+            elif opcode == _ITERATE:
+                values = _iterate(stack[-1])
+                stack[-1] = values
+
+                if type(values) is Error:
+                    _located(values, offsets[ip])
+                    ip = instructions[ip]
+                else:
+                    ip += 1
+            elif opcode == _END_FOR:
+                error = pop()
+                stack[-1] = error
+            else:
+                raise ValueError(f'Unknown opcode {opcode}')
+
+
+def _located(error: Error, offset: int) -> Error:
+    if error.offset < 0:
+        error.offset = offset
+
+    return error
+
+
+def _call_object(function: Object, args: List[Object]) -> Object:
+    if type(function) is Builtin:
+        return function.function(*args)
+    elif isinstance(function, Function):
+        return _apply_function(function, args)
+    else:
+        return _new_error(_NOT_A_FUNCTION, [function.type().name])
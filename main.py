@@ -1,10 +1,19 @@
-from cantte.repl import start_repl
+from argparse import ArgumentParser
+
+from cantte.repl import ENGINES, start_repl
 
 
 def main() -> None:
+    parser = ArgumentParser(description='The Cantte programming language')
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='evaluator',
+                        help='execution engine used to run the programs')
+    parser.add_argument('--optimize', action='store_true',
+                        help='fold constants and drop dead branches before running')
+    args = parser.parse_args()
+
     print('Welcome to the Cantte programming language')
 
-    start_repl()
+    start_repl(args.engine, args.optimize)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from cantte.allocations import AllocationCounter
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment, Integer, Null, String
+from cantte.parser import Parser
+
+
+class AllocationCounterTest(TestCase):
+
+    def test_counts_allocations(self) -> None:
+        with AllocationCounter(Integer, String, Null) as counter:
+            Integer(1000)
+            Integer(1001)
+            String('a')
+            Null()
+
+        self.assertEqual(counter.counts, {'Integer': 2, 'String': 1, 'Null': 1})
+        self.assertEqual(counter.total(), 4)
+
+        Integer(1002)
+        Null()
+
+        self.assertEqual(counter.total(), 4)
+        self.assertNotIn('__init__', Null.__dict__)
+
+    def test_literals_and_small_integers_are_not_reallocated(self) -> None:
+        program = Parser(Lexer('''
+            let countdown = func(n) {
+                if (n == 0) {
+                    return "done";
+                }
+                countdown(n - 1);
+            };
+            countdown(50);
+        ''')).parse_program()
+
+        evaluate(program, Environment())
+
+        with AllocationCounter(Integer, String) as counter:
+            evaluate(program, Environment())
+
+        self.assertEqual(counter.counts, {'Integer': 0, 'String': 0})
+
+    def test_large_integers_are_allocated(self) -> None:
+        program = Parser(Lexer('100000 + 100000 * 2')).parse_program()
+
+        evaluate(program, Environment())
+
+        with AllocationCounter(Integer) as counter:
+            evaluate(program, Environment())
+
+        self.assertEqual(counter.counts['Integer'], 2)
@@ -0,0 +1,89 @@
+from typing import List
+from unittest import TestCase
+
+import cantte.batch as batch
+from cantte.batch import BatchRunner, encode, Result, run_many, TIMEOUT
+from cantte.object import Array, Error, Integer, String
+
+
+class BatchTest(TestCase):
+
+    runner: BatchRunner
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.runner = BatchRunner(workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.runner.shutdown()
+        batch.shutdown()
+
+    def test_encode(self) -> None:
+        self.assertEqual(encode(0, Integer(5)), Result(0, 'INTEGER', 5, '5'))
+        self.assertEqual(encode(1, String('a')), Result(1, 'STRING', 'a', 'a'))
+        self.assertEqual(encode(2, Error('boom')), Result(2, 'ERROR', 'boom', 'Error: boom'))
+        self.assertEqual(encode(3, Array([])), Result(3, 'ARRAY', None, '[]'))
+        self.assertEqual(encode(4, None), Result(4, 'NONE', None, ''))
+
+    def test_ordered_results(self) -> None:
+        sources: List[str] = [
+            '1 + 2',
+            '"a" + "b"',
+            '1 < 2',
+            'let x = 1;',
+            '[1, 2 * 2]',
+            '1 + true',
+            'let = 5;',
+        ]
+
+        results = list(self.runner.run_many(sources, chunk_size=2))
+
+        self.assertEqual([result.position for result in results], list(range(len(sources))))
+        self.assertEqual([(result.type, result.value) for result in results[:5]], [
+            ('INTEGER', 3),
+            ('STRING', 'ab'),
+            ('BOOLEAN', True),
+            ('NONE', None),
+            ('ARRAY', None),
+        ])
+        self.assertEqual(results[4].inspect, '[1, 4]')
+        self.assertEqual(results[5].inspect, 'Error: Type mismatch: INTEGER + BOOLEAN')
+        self.assertEqual(results[6].type, 'ERROR')
+        self.assertIn('Was expected \'TokenType.IDENTIFIER\'', results[6].value)
+
+    def test_streaming_results(self) -> None:
+        sources: List[str] = [f'{value} * 2' for value in range(40)]
+
+        results = list(self.runner.run_many(sources, ordered=False, chunk_size=3))
+
+        self.assertEqual(sorted(result.position for result in results), list(range(40)))
+        for result in results:
+            self.assertEqual(result.value, result.position * 2)
+
+    def test_timeouts(self) -> None:
+        results = list(self.runner.run_many(['while (true) { }', '"still warm"'], timeout=0.2, chunk_size=1))
+
+        self.assertEqual(results[0], Result(0, TIMEOUT, 0.2, 'Timed out after 0.2s'))
+        self.assertEqual(results[1].value, 'still warm')
+
+    def test_recursion_errors(self) -> None:
+        result = next(self.runner.run_many(['let f = func(n) { 1 + f(n + 1) }; f(0)']))
+
+        self.assertEqual(result.type, 'ERROR')
+        self.assertIn('recursion', result.value)
+
+    def test_failing_scripts_do_not_fail_the_batch(self) -> None:
+        results = list(self.runner.run_many(['1', '1 / 0', '2'], chunk_size=3))
+
+        self.assertEqual([result.value for result in (results[0], results[2])], [1, 2])
+        self.assertEqual(results[1].type, 'ERROR')
+        self.assertIn('ZeroDivisionError', results[1].value)
+
+    def test_shared_runner_is_reused(self) -> None:
+        self.assertEqual([result.value for result in run_many(['1', '2'], workers=1)], [1, 2])
+
+        runner = batch._runner
+
+        self.assertEqual([result.value for result in run_many(['3'], workers=1)], [3])
+        self.assertIs(batch._runner, runner)
@@ -0,0 +1,145 @@
+import os
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import TestCase
+
+from cantte.cache import deserialize, ParseCache, serialize
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment
+from cantte.parser import Parser
+
+
+class CacheTest(TestCase):
+
+    def test_round_trip(self) -> None:
+        sources: List[str] = [
+            'let five = 5; let ten = 10;',
+            'let add = func(x, y) { return x + y; }; add(five, -ten);',
+            'if (!(1 < 2)) { "yes" } else { false == true };',
+            'func() { }();',
+            'let a = [1, "two", [3]]; a[2][0] + first(a);',
+            'let h = {"one": 1, 2: [2], true: {}}; h["one"] + size(keys(h));',
+            'let i = 0; while (i < 3) { i = i + 1; } for (x in range(i)) { i = i + x; };',
+            '',
+        ]
+
+        for source in sources:
+            program = Parser(Lexer(source)).parse_program()
+            restored = deserialize(serialize(program))
+
+            self.assertEqual(str(restored), str(program))
+            self.assertEqual(restored.token_literal(), program.token_literal())
+            self.assertEqual([statement.offset for statement in restored.statements],
+                             [statement.offset for statement in program.statements])
+
+    def test_restored_program_evaluates(self) -> None:
+        source: str = '''
+            let fibonacci = func(n) {
+                if (n < 2) {
+                    return n;
+                }
+                return fibonacci(n - 1) + fibonacci(n - 2);
+            };
+            fibonacci(10);
+        '''
+
+        program = deserialize(serialize(Parser(Lexer(source)).parse_program()))
+        evaluated = evaluate(program, Environment())
+
+        assert evaluated is not None
+        self.assertEqual(evaluated.inspect(), '55')
+
+    def test_hits_and_misses(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory)
+
+            program, errors = cache.parse('let a = 1; a + 2;')
+            self.assertEqual(errors, [])
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+            cached, errors = cache.parse('let a = 1; a + 2;')
+            self.assertEqual(errors, [])
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertEqual(str(cached), str(program))
+
+            self.assertEqual((ParseCache(directory).parse('let a = 1; a + 2;')[0].token_literal()), 'let')
+
+    def test_parse_errors_are_not_cached(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory)
+
+            _, errors = cache.parse('let = 5;')
+            self.assertGreater(len(errors), 0)
+
+            _, errors = cache.parse('let = 5;')
+            self.assertGreater(len(errors), 0)
+            self.assertEqual(cache.hits, 0)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_unserializable_programs_are_not_cached(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory)
+            source = ' + '.join(['1'] * 3000)
+
+            program, errors = cache.parse(source)
+
+            self.assertEqual(errors, [])
+            self.assertEqual(program.statements[0].token_literal(), '1')
+            self.assertEqual(os.listdir(directory), [])
+
+            cache.parse(source)
+
+            self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_corrupted_entries_are_replaced(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory)
+            cache.parse('1 + 2;')
+
+            [name] = os.listdir(directory)
+            with open(os.path.join(directory, name), 'wb') as cache_file:
+                cache_file.write(b'not a program')
+
+            program, errors = cache.parse('1 + 2;')
+
+            self.assertEqual(errors, [])
+            self.assertEqual(str(program), '(1 + 2)')
+            self.assertEqual(cache.misses, 2)
+
+    def test_stale_versions_are_removed(self) -> None:
+        with TemporaryDirectory() as directory:
+            stale = os.path.join(directory, '0.0.0-0-py00-deadbeef.ast')
+            with open(stale, 'wb') as cache_file:
+                cache_file.write(b'stale')
+
+            ParseCache(directory).parse('1;')
+
+            self.assertFalse(os.path.exists(stale))
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_eviction(self) -> None:
+        with TemporaryDirectory() as directory:
+            cache = ParseCache(directory, max_bytes=0)
+            cache.parse('1;')
+
+            self.assertEqual(os.listdir(directory), [])
+
+            cache = ParseCache(directory, max_bytes=10 ** 6)
+            for value in range(5):
+                cache.parse(f'{value};')
+
+            names = sorted(os.listdir(directory))
+            for age, name in enumerate(names):
+                os.utime(os.path.join(directory, name), (1000 + age, 1000 + age))
+
+            sizes = [os.path.getsize(os.path.join(directory, name)) for name in names]
+            self.assertEqual(len(sizes), 5)
+
+            cache.max_bytes = sum(sizes) - 1
+            oldest = names[0]
+            cache.parse('5;')
+
+            self.assertNotIn(oldest, os.listdir(directory))
+            self.assertLessEqual(sum(os.path.getsize(os.path.join(directory, name))
+                                     for name in os.listdir(directory)), cache.max_bytes)
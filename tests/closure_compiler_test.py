@@ -0,0 +1,57 @@
+from typing import cast
+
+import tests.evaluator_test as evaluator_test
+from cantte.ast import Program
+from cantte.closure_compiler import compile_program, CompiledFunction
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment, Integer, Object
+from cantte.parser import Parser
+
+
+class ClosureCompilerTest(evaluator_test.EvaluatorTest):
+
+    def test_compiled_functions(self) -> None:
+        env: Environment = Environment()
+
+        evaluate(self._parse('let double = func(x) { x * 2 };'), env)
+        compile_program(self._parse('let add = func(x, y) { x + y };'))(env)
+
+        self.assertIsInstance(env['add'], CompiledFunction)
+
+        evaluated = compile_program(self._parse('add(double(3), 1)'))(env)
+        self._test_integer_object(cast(Object, evaluated), 7)
+
+        evaluated = evaluate(self._parse('double(add(3, 1))'), env)
+        self._test_integer_object(cast(Object, evaluated), 8)
+
+    def test_compiled_program_reuse(self) -> None:
+        code = compile_program(self._parse('let x = y * 2; x;'))
+
+        for value in range(3):
+            env: Environment = Environment()
+            env['y'] = Integer(value)
+
+            evaluated = code(env)
+            self._test_integer_object(cast(Object, evaluated), value * 2)
+
+    def test_unknown_nodes_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            compile_program(cast(Program, object()))
+
+    @staticmethod
+    def _parse(source: str) -> Program:
+        return Parser(Lexer(source)).parse_program()
+
+    @staticmethod
+    def _evaluate_tests(source: str) -> Object:
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+        env: Environment = Environment()
+
+        evaluated = compile_program(program)(env)
+
+        assert evaluated is not None
+
+        return evaluated
@@ -0,0 +1,153 @@
+from typing import List
+from unittest import TestCase
+
+from cantte.compiler import Bytecode, Compiler, FunctionCode, OpCode
+from cantte.lexer import Lexer
+from cantte.object import Integer
+from cantte.parser import Parser
+
+
+class CompilerTest(TestCase):
+
+    def test_integer_arithmetic(self) -> None:
+        bytecode = self._compile('1 + 2; 3')
+
+        self.assertEqual(bytecode.main.instructions, [
+            OpCode.CONSTANT, 0,
+            OpCode.CONSTANT, 1,
+            OpCode.ADD,
+            OpCode.POP_STATEMENT, 9,
+            OpCode.CONSTANT, 2,
+            OpCode.RETURN_VALUE,
+        ])
+        self.assertEqual([constant.value for constant in bytecode.constants
+                          if isinstance(constant, Integer)], [1, 2, 3])
+
+    def test_let_statements(self) -> None:
+        bytecode = self._compile('let a = true; let b = !a; b;')
+
+        self.assertEqual(bytecode.main.instructions, [
+            OpCode.TRUE,
+            OpCode.SET_NAME, 0,
+            OpCode.GET_NAME, 0,
+            OpCode.BANG,
+            OpCode.SET_NAME, 1,
+            OpCode.GET_NAME, 1,
+            OpCode.RETURN_VALUE,
+        ])
+        self.assertEqual(bytecode.names, ['a', 'b'])
+
+    def test_conditionals(self) -> None:
+        bytecode = self._compile('if (1 < 2) { 10 }')
+
+        self.assertEqual(bytecode.main.instructions, [
+            OpCode.CONSTANT, 0,
+            OpCode.CONSTANT, 1,
+            OpCode.LESS_THAN,
+            OpCode.JUMP_NOT_TRUTHY, 11,
+            OpCode.CONSTANT, 2,
+            OpCode.JUMP, 12,
+            OpCode.NULL,
+            OpCode.RETURN_VALUE,
+        ])
+
+    def test_functions(self) -> None:
+        bytecode = self._compile('let sum = func(x, y) { return x + y; }; sum(1, 2);')
+
+        function = bytecode.constants[0]
+
+        self.assertIsInstance(function, FunctionCode)
+        assert isinstance(function, FunctionCode)
+
+        self.assertEqual(function.parameter_names, ['x', 'y'])
+        self.assertEqual(function.instructions, [
+            OpCode.GET_NAME, 0,
+            OpCode.GET_NAME, 1,
+            OpCode.ADD,
+            OpCode.RETURN_VALUE,
+            OpCode.RETURN_VALUE,
+        ])
+        self.assertEqual(bytecode.main.instructions, [
+            OpCode.CLOSURE, 0,
+            OpCode.SET_NAME, 2,
+            OpCode.GET_NAME, 2,
+            OpCode.CONSTANT, 1,
+            OpCode.CONSTANT, 2,
+            OpCode.CALL, 2,
+            OpCode.RETURN_VALUE,
+        ])
+
+    def test_arrays(self) -> None:
+        bytecode = self._compile('[1, 2 + 3][0];')
+
+        self.assertEqual(bytecode.main.instructions, [
+            OpCode.CONSTANT, 0,
+            OpCode.CONSTANT, 1,
+            OpCode.CONSTANT, 2,
+            OpCode.ADD,
+            OpCode.ARRAY, 2,
+            OpCode.CONSTANT, 3,
+            OpCode.INDEX,
+            OpCode.RETURN_VALUE,
+        ])
+
+    def test_hashes(self) -> None:
+        bytecode = self._compile('{1: 2, "a": 3 * 4}[1];')
+
+        self.assertEqual(bytecode.main.instructions, [
+            OpCode.CONSTANT, 0,
+            OpCode.CONSTANT, 1,
+            OpCode.CONSTANT, 2,
+            OpCode.CONSTANT, 3,
+            OpCode.CONSTANT, 4,
+            OpCode.MUL,
+            OpCode.HASH, 2,
+            OpCode.CONSTANT, 5,
+            OpCode.INDEX,
+            OpCode.RETURN_VALUE,
+        ])
+
+    def test_while_loops(self) -> None:
+        bytecode = self._compile('while (true) { i = 1; }')
+
+        self.assertEqual(bytecode.main.instructions, [
+            OpCode.TRUE,
+            OpCode.LOOP_TEST, 11,
+            OpCode.CONSTANT, 0,
+            OpCode.ASSIGN_NAME, 0,
+            OpCode.POP_STATEMENT, 11,
+            OpCode.JUMP, 0,
+            OpCode.RETURN_VALUE,
+        ])
+
+    def test_for_loops(self) -> None:
+        bytecode = self._compile('for (x in xs) { x }')
+
+        self.assertEqual(bytecode.main.instructions, [
+            OpCode.GET_NAME, 0,
+            OpCode.ITERATE, 15,
+            OpCode.FOR_ITER, 15,
+            OpCode.SET_NAME, 1,
+            OpCode.GET_NAME, 1,
+            OpCode.POP_STATEMENT, 14,
+            OpCode.JUMP, 4,
+            OpCode.END_FOR,
+            OpCode.RETURN_VALUE,
+        ])
+
+    def test_disassemble(self) -> None:
+        bytecode = self._compile('-5')
+
+        expected: List[str] = [
+            '0000 CONSTANT 0',
+            '0002 MINUS',
+            '0003 RETURN_VALUE',
+        ]
+
+        self.assertEqual(str(bytecode), '\n'.join(expected))
+
+    @staticmethod
+    def _compile(source: str) -> Bytecode:
+        program = Parser(Lexer(source)).parse_program()
+
+        return Compiler().compile_program(program)
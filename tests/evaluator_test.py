@@ -1,10 +1,11 @@
+import threading
 from typing import cast, List, Tuple, Any, Union
 from unittest import TestCase
 
 from cantte.ast import Program
-from cantte.evaluator import evaluate, NULL
+from cantte.evaluator import evaluate, FALSE, NULL
 from cantte.lexer import Lexer
-from cantte.object import Integer, Object, Boolean, Error, Environment, Function, String
+from cantte.object import Array, Hash, Integer, Object, Boolean, Error, Environment, Function, String
 from cantte.parser import Parser
 
 
@@ -191,6 +192,26 @@ class EvaluatorTest(TestCase):
                 sum(5 + 5, sum(10, 10));
             ''', 30),
             ('func(x) { x }(5)', 5),
+            ('''
+                let sub = func(x, y, z) {
+                    return x - y - z;
+                }
+                sub(10, 3, 2);
+            ''', 5),
+            ('''
+                let area = func(width, height) {
+                    let result = width * height;
+                    result;
+                }
+                area(3, 4);
+            ''', 12),
+            ('''
+                let adder = func(x) {
+                    func(y) { x + y };
+                }
+                let add_two = adder(2);
+                add_two(3);
+            ''', 5),
         ]
 
         for source, expected in tests:
@@ -198,6 +219,53 @@ class EvaluatorTest(TestCase):
 
             self._test_integer_object(evaluated, expected)
 
+    def test_scoping(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('''
+                let x = 1;
+                let f = func() {
+                    let y = x;
+                    let x = 2;
+                    y * 10 + x;
+                };
+                f();
+            ''', 12),
+            ('''
+                let x = 1;
+                let f = func(flag) {
+                    if (flag) {
+                        let x = 5;
+                    }
+                    x;
+                };
+                f(false) * 10 + f(true);
+            ''', 15),
+            ('''
+                let outer = func(a) {
+                    let middle = func(b) {
+                        let inner = func(c) { a * 100 + b * 10 + c };
+                        inner(3);
+                    };
+                    middle(2);
+                };
+                outer(1);
+            ''', 123),
+            ('''
+                let f = func() {
+                    let is_even = func(n) { if (n == 0) { true } else { is_odd(n - 1) } };
+                    let is_odd = func(n) { if (n == 0) { false } else { is_even(n - 1) } };
+                    if (is_even(10)) { 1 } else { 0 };
+                };
+                f();
+            ''', 1),
+            ('let pick = func(x, x) { x }; pick(1, 2);', 2),
+            ('let later = func() { value }; let value = 7; later();', 7),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_integer_object(evaluated, expected)
+
     def test_string_evaluation(self) -> None:
         tests: List[Tuple[str, str]] = [
             ('"Hello!"', 'Hello!'),
@@ -222,7 +290,18 @@ class EvaluatorTest(TestCase):
                     return "Hello " + name + "!";
                 };
                 hi("Manolo");
-            ''', 'Hello Manolo!')
+            ''', 'Hello Manolo!'),
+            ('''
+                let repeat = func(n, piece, result) {
+                    if (n == 0) {
+                        return result;
+                    }
+                    return repeat(n - 1, piece, result + piece);
+                };
+                let line = repeat(40, "ab", "");
+                let report = repeat(3, line + "|", "");
+                report;
+            ''', ('ab' * 40 + '|') * 3),
         ]
 
         for source, expected in tests:
@@ -236,6 +315,24 @@ class EvaluatorTest(TestCase):
             ('"a" != "a"', False),
             ('"a" == "b"', False),
             ('"a" != "b"', True),
+            ('"' + 'x' * 40 + '" + "' + 'y' * 40 + '" == "' + 'x' * 40 + 'y' * 40 + '"', True),
+            ('"' + 'x' * 40 + '" + "' + 'y' * 40 + '" != "' + 'x' * 40 + '" + "' + 'y' * 40 + '"', False),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            self._test_boolean_object(evaluated, expected)
+
+    def test_equality_semantics(self) -> None:
+        tests: List[Tuple[str, bool]] = [
+            ('100000 + 1 == 100001', True),
+            ('-100000 == 0 - 100000', True),
+            ('1 == true', False),
+            ('0 != false', True),
+            ('let f = func() { 1 }; f == f', True),
+            ('func() { 1 } == func() { 1 }', False),
+            ('let f = func() { 1 }; f() == f()', True),
         ]
 
         for source, expected in tests:
@@ -248,6 +345,7 @@ class EvaluatorTest(TestCase):
             ('size("");', 0),
             ('size("four");', 4),
             ('size("Hello world");', 11),
+            ('size("Hello" + " " + "' + 'w' * 100 + '");', 106),
             ('size(1);', 'Argument of type \'INTEGER\' is not supported'),
             ('size("one", "two");', 'Wrong number of arguments. 2 received, 1 expected'),
         ]
@@ -262,6 +360,34 @@ class EvaluatorTest(TestCase):
                 expected = cast(str, expected)
                 self._test_error_object(evaluated, expected)
 
+    def test_memo(self) -> None:
+        tests: List[Tuple[str, Union[str, int]]] = [
+            ('''
+                let fibonacci = memo(func(n) {
+                    if (n < 2) {
+                        return n;
+                    }
+                    return fibonacci(n - 1) + fibonacci(n - 2);
+                });
+                fibonacci(60);
+            ''', 1548008755920),
+            ('let paths = memo(func(x, y) { if (x == 0) { 1 } else { if (y == 0) { 1 } else { '
+             'paths(x - 1, y) + paths(x, y - 1) } } }, 64); paths(16, 16);', 601080390),
+            ('let twice = memo(func(f) { f(f(1)) }); twice(func(x) { x + 1 });', 3),
+            ('let length = memo(size); length("four") + length("four");', 8),
+            ('memo(1);', 'Argument of type \'INTEGER\' is not supported'),
+            ('memo();', 'Wrong number of arguments. 0 received, 1 or 2 expected'),
+            ('memo(size, 0);', 'Memo size must be a positive integer, got 0'),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, cast(int, expected))
+            else:
+                self._test_error_object(evaluated, cast(str, expected))
+
     def _test_error_object(self, evaluated: Object, expected: str) -> None:
         self.assertIsInstance(evaluated, Error)
 
@@ -269,6 +395,288 @@ class EvaluatorTest(TestCase):
 
         self.assertEqual(evaluated.message, expected)
 
+    def test_array_literals(self) -> None:
+        evaluated = self._evaluate_tests('[1, 2 * 2, 3 + 3, "four", [5]]')
+
+        self.assertIsInstance(evaluated, Array)
+        self.assertEqual(evaluated.inspect(), '[1, 4, 6, four, [5]]')
+
+    def test_array_indexing(self) -> None:
+        tests: List[Tuple[str, Any]] = [
+            ('[1, 2, 3][0]', 1),
+            ('[1, 2, 3][1 + 1]', 3),
+            ('let i = 0; [1][i];', 1),
+            ('let my_array = [1, 2, 3]; my_array[0] + my_array[1] + my_array[2];', 6),
+            ('let my_array = [1, 2, 3]; let i = my_array[0]; my_array[i]', 2),
+            ('[[1, 2], ["a"]][1][0]', 'a'),
+            ('[1, 2, 3][3]', None),
+            ('[1, 2, 3][-1]', None),
+            ('1[0]', Error('Index operator not supported: INTEGER[INTEGER]')),
+            ('[1]["a"]', Error('Index operator not supported: ARRAY[STRING]')),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            elif type(expected) == str:
+                self._test_string_object(evaluated, expected)
+            elif type(expected) == Error:
+                self._test_error_object(evaluated, expected.message)
+            else:
+                self._test_null_object(evaluated)
+
+    def test_array_builtins(self) -> None:
+        tests: List[Tuple[str, Any]] = [
+            ('size([1, 2, 3])', 3),
+            ('size([])', 0),
+            ('first([1, 2, 3])', 1),
+            ('first([])', None),
+            ('last([1, 2, 3])', 3),
+            ('last(rest([1]))', None),
+            ('rest([1, 2, 3])', '[2, 3]'),
+            ('rest(rest(rest([1, 2, 3])))', '[]'),
+            ('rest([])', None),
+            ('push([], 1)', '[1]'),
+            ('let a = [1, 2]; let b = push(a, 3); let c = push(a, "x"); [a, b, c]', '[[1, 2], [1, 2, 3], [1, 2, x]]'),
+            ('let a = rest([1, 2, 3]); let b = push(a, 4); let c = push(a, 5); [a, b, c]',
+             '[[2, 3], [2, 3, 4], [2, 3, 5]]'),
+            ('first(1)', Error('Argument of type \'INTEGER\' is not supported')),
+            ('rest([1], [2])', Error('Wrong number of arguments. 2 received, 1 expected')),
+            ('push([1])', Error('Wrong number of arguments. 1 received, 2 expected')),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            elif type(expected) == str:
+                self.assertIsInstance(evaluated, Array)
+                self.assertEqual(evaluated.inspect(), expected)
+            elif type(expected) == Error:
+                self._test_error_object(evaluated, expected.message)
+            else:
+                self._test_null_object(evaluated)
+
+    def test_hash_literals(self) -> None:
+        evaluated = self._evaluate_tests('''
+            let two = "two";
+            {"one": 10 - 9, two: 1 + 1, "thr" + "ee": 6 / 2, 4: 4, true: 5, false: 6, "one": 1}
+        ''')
+
+        self.assertIsInstance(evaluated, Hash)
+        self.assertEqual(evaluated.inspect(), '{"one": 1, "two": 2, "three": 3, 4: 4, true: 5, false: 6}')
+
+        evaluated = self._evaluate_tests('{1: 2, "1": 2, true: 3, "true": 3}')
+
+        self.assertEqual(evaluated.inspect(), '{1: 2, "1": 2, true: 3, "true": 3}')
+
+    def test_hash_indexing(self) -> None:
+        tests: List[Tuple[str, Any]] = [
+            ('{"foo": 5}["foo"]', 5),
+            ('{"foo": 5}["bar"]', None),
+            ('let key = "foo"; {"foo": 5}[key]', 5),
+            ('{}["foo"]', None),
+            ('{5: 5}[5]', 5),
+            ('{true: 5}[true]', 5),
+            ('{false: 5}[false]', 5),
+            ('{1: "a"}[true]', None),
+            ('{"h": {"x": [1, "y"]}}["h"]["x"][1]', 'y'),
+            ('{[1]: 2}', Error('Unusable as hash key: ARRAY')),
+            ('{"a": 1}[func(x) { x }]', Error('Unusable as hash key: FUNCTION')),
+            ('{}[{}]', Error('Unusable as hash key: HASH')),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            elif type(expected) == str:
+                self._test_string_object(evaluated, expected)
+            elif type(expected) == Error:
+                self._test_error_object(evaluated, expected.message)
+            else:
+                self._test_null_object(evaluated)
+
+    def test_hash_builtins(self) -> None:
+        tests: List[Tuple[str, Any]] = [
+            ('size({"a": 1, "b": 2})', 2),
+            ('size({})', 0),
+            ('keys({"a": 1, 2: 2, true: 3})', '[a, 2, true]'),
+            ('values({"a": 1, 2: "b", true: [3]})', '[1, b, [3]]'),
+            ('keys({})', '[]'),
+            ('has({"a": 1}, "a")', True),
+            ('has({"a": 1}, "b")', False),
+            ('has({false: 1}, false)', True),
+            ('has({}, [])', Error('Unusable as hash key: ARRAY')),
+            ('keys([1])', Error('Argument of type \'ARRAY\' is not supported')),
+            ('values({}, {})', Error('Wrong number of arguments. 2 received, 1 expected')),
+            ('has({})', Error('Wrong number of arguments. 1 received, 2 expected')),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            elif type(expected) == bool:
+                self._test_boolean_object(evaluated, expected)
+            elif type(expected) == str:
+                self.assertIsInstance(evaluated, Array)
+                self.assertEqual(evaluated.inspect(), expected)
+            else:
+                self._test_error_object(evaluated, expected.message)
+
+    def test_while_loops(self) -> None:
+        tests: List[Tuple[str, Any]] = [
+            ('let i = 0; let total = 0; while (i < 10) { total = total + i; i = i + 1; } total', 45),
+            ('let i = 0; while (i < 100000) { i = i + 1; } i', 100000),
+            ('let i = 5; while (false) { i = 0; } i', 5),
+            ('let f = func() { let i = 0; while (true) { i = i + 1; if (i == 3) { return i * 10; } } }; f()', 30),
+            ('let i = 0; while (i < 3) { let j = i; i = i + 1; } j', 2),
+            ('while (1 < "a") { }', Error('Type mismatch: INTEGER < STRING')),
+            ('let i = 0; while (true) { i = i + 1; if (i > 2) { i - true; } }',
+             Error('Type mismatch: INTEGER - BOOLEAN')),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            else:
+                self._test_error_object(evaluated, expected.message)
+
+    def test_for_loops(self) -> None:
+        tests: List[Tuple[str, Any]] = [
+            ('let total = 0; for (i in range(5)) { total = total + i; } total', 10),
+            ('let total = 0; for (i in range(3, 6)) { total = total + i; } total', 12),
+            ('let total = 0; for (i in range(5, 3)) { total = total + 1; } total', 0),
+            ('let total = 0; for (x in [1, 2, 3]) { total = total * 10 + x; } total', 123),
+            ('let total = 0; for (x in rest([1, 2, 3])) { total = total * 10 + x; } total', 23),
+            ('let s = ""; for (x in ["a", "b"]) { s = s + x; } s', 'ab'),
+            ('for (i in range(4)) { } i', 3),
+            ('let f = func(xs) { for (x in xs) { if (x > 1) { return x; } } }; f([0, 5, 9])', 5),
+            ('let n = 0; for (i in range(3)) { for (j in range(3)) { n = n + 1; } } n', 9),
+            ('size(range(2, 7))', 5),
+            ('for (x in 1) { }', Error('Not iterable: INTEGER')),
+            ('for (x in range("a")) { }', Error('Not iterable: ERROR')),
+            ('range("a")', Error('Argument of type \'STRING\' is not supported')),
+            ('range(1, 2, 3)', Error('Wrong number of arguments. 3 received, 1 or 2 expected')),
+            ('range()', Error('Wrong number of arguments. 0 received, 1 or 2 expected')),
+            ('for (x in [1, "a"]) { x + 1; }', Error('Type mismatch: STRING + INTEGER')),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            elif type(expected) == str:
+                self._test_string_object(evaluated, expected)
+            else:
+                self._test_error_object(evaluated, expected.message)
+
+    def test_reassignment(self) -> None:
+        tests: List[Tuple[str, Any]] = [
+            ('let a = 1; a = a + 1; a', 2),
+            ('let a = 1; let f = func() { a = 10; }; f(); a', 10),
+            ('let counter = func() { let n = 0; func() { n = n + 1; n } }; let c = counter(); c(); c(); c()', 3),
+            ('let a = 1; let f = func(a) { a = 5; a }; f(2) + a', 6),
+            ('let f = func() { let b = 1; if (true) { b = 2; } b }; f()', 2),
+            ('b = 1', Error('Unknown identifier: b')),
+            ('let f = func() { c = 1; }; f()', Error('Unknown identifier: c')),
+            ('let a = 1; a = 1 + true; a', Error('Type mismatch: INTEGER + BOOLEAN')),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            if type(expected) == int:
+                self._test_integer_object(evaluated, expected)
+            else:
+                self._test_error_object(evaluated, expected.message)
+
+    def test_recursive_list_processing(self) -> None:
+        source: str = '''
+            let map = func(items, f, accumulated) {
+                if (size(items) == 0) {
+                    return accumulated;
+                }
+                return map(rest(items), f, push(accumulated, f(first(items))));
+            };
+            let sum = func(items, total) {
+                if (size(items) == 0) {
+                    return total;
+                }
+                return sum(rest(items), total + first(items));
+            };
+            sum(map([1, 2, 3, 4], func(x) { x * 2 }, []), 0);
+        '''
+
+        self._test_integer_object(self._evaluate_tests(source), 20)
+
+    def test_wrong_number_of_arguments(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('let f = func(x, y) { x }; f(1)', 'Wrong number of arguments: want=2, got=1'),
+            ('let f = func(x) { x }; f(1, 2)', 'Wrong number of arguments: want=1, got=2'),
+            ('let f = func(x, y) { x }; let g = func() { return f(1); }; g()',
+             'Wrong number of arguments: want=2, got=1'),
+            ('func() { 1 }(2)', 'Wrong number of arguments: want=0, got=1'),
+        ]
+
+        for source, expected in tests:
+            self._test_error_object(self._evaluate_tests(source), expected)
+
+    def test_closure_captures(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('let make = func() { let n = 0; [func() { n = n + 1; n }, func() { n }] }; '
+             'let pair = make(); pair[0](); pair[0](); pair[1]()', '2'),
+            ('let f = func(a) { func(b) { func(c) { a + b + c } } }; f(1)(2)(3)', '6'),
+            ('let f = func(x) { func(flag) { if (flag) { let x = 10; } x } }; let g = f(1); [g(false), g(true)]',
+             '[1, 10]'),
+            ('let f = func() { let fact = func(n) { if (n < 2) { 1 } else { n * fact(n - 1) } }; fact(5) }; f()',
+             '120'),
+            ('let f = func(n) { let g = func() { n }; n = n + 1; g() }; f(1)', '2'),
+            ('let a = func() { let x = 1; let b = func() { let c = func() { x }; let r = c(); let x = 2; r }; '
+             'b() }; a()', '1'),
+        ]
+
+        for source, expected in tests:
+            self.assertEqual(self._evaluate_tests(source).inspect(), expected)
+
+    def test_locals_do_not_leak_between_calls(self) -> None:
+        source: str = '''
+            let x = "outer";
+            let f = func(flag) {
+                if (flag) {
+                    let x = "inner";
+                }
+                x;
+            };
+            let g = func(n) { let y = n * 2; if (n > 0) { g(n - 1) + y } else { y } };
+            [f(true), f(false), f(true), g(3), g(2)];
+        '''
+
+        self.assertEqual(self._evaluate_tests(source).inspect(), '[inner, outer, inner, 12, 6]')
+
+    def test_error_locations(self) -> None:
+        tests: List[Tuple[str, int]] = [
+            ('5 + true;', 0),
+            ('let a = 1;\n  -true;', 13),
+            ('let f = func() {\n  1;\n  x;\n};\nf();', 24),
+            ('if (true) {\n  if (1 > 0) { return "a" - "b"; }\n}', 27),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+
+            self.assertIsInstance(evaluated, Error)
+            self.assertEqual(cast(Error, evaluated).offset, expected)
+
     def _test_string_object(self, evaluated: Object, expected: str) -> None:
         self.assertIsInstance(evaluated, String)
 
@@ -305,3 +713,102 @@ class EvaluatorTest(TestCase):
         evaluated = cast(Integer, evaluated)
 
         self.assertEqual(evaluated.value, expected)
+
+
+class TailCallTest(TestCase):
+
+    def test_tail_recursion(self) -> None:
+        source: str = '''
+            let count = func(n, acc) {
+                if (n == 0) {
+                    return acc;
+                }
+                return count(n - 1, acc + 1);
+            };
+            count(1000000, 0);
+        '''
+
+        evaluated = evaluate(Parser(Lexer(source)).parse_program(), Environment())
+
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEqual(cast(Integer, evaluated).value, 1000000)
+
+    def test_mutual_tail_recursion(self) -> None:
+        source: str = '''
+            let is_even = func(n) { if (n == 0) { true } else { is_odd(n - 1) } };
+            let is_odd = func(n) { if (n == 0) { false } else { is_even(n - 1) } };
+            is_even(10001);
+        '''
+
+        evaluated = evaluate(Parser(Lexer(source)).parse_program(), Environment())
+
+        self.assertIs(evaluated, FALSE)
+
+
+class FrameTest(TestCase):
+
+    def test_frames_are_reused(self) -> None:
+        program = Parser(Lexer('''
+            let add = func(a, b) { let c = a + b; c };
+            let adder = func(n) { func(x) { x + n } };
+            add(1, 2) + add(3, 4) + adder(5)(6);
+        ''')).parse_program()
+        env = Environment()
+
+        evaluated = evaluate(program, env)
+
+        self._test_integer(evaluated, 21)
+
+        add = cast(Function, env['add'])
+        adder = cast(Function, env['adder'])
+
+        assert add.scope is not None and adder.scope is not None
+        self.assertEqual(len(add.scope.free.frames), 1)
+        self.assertEqual(adder.scope.free.frames, [])
+
+        frame = add.scope.free.frames[0]
+        again = evaluate(Parser(Lexer('add(10, 20)')).parse_program(), env)
+
+        self._test_integer(again, 30)
+        self.assertEqual(add.scope.free.frames, [frame])
+        self.assertEqual(frame.values, [])
+
+        free = add.scope.free
+        counts: List[int] = []
+
+        def call() -> None:
+            evaluate(Parser(Lexer('add(1, 2) + add(3, 4)')).parse_program(), env)
+            counts.append(len(free.frames))
+
+        thread = threading.Thread(target=call)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(counts, [1])
+        self.assertEqual(free.frames, [frame])
+
+    def test_closures_retain_only_captured_cells(self) -> None:
+        program = Parser(Lexer('''
+            let make = func(n) {
+                let data = [1, 2, 3];
+                [func(x) { x + n }, func(x) { x * 2 }]
+            };
+            let pair = make(5);
+            let capturing = pair[0];
+            let plain = pair[1];
+        ''')).parse_program()
+        env = Environment()
+
+        evaluate(program, env)
+
+        capturing = cast(Function, env['capturing'])
+        plain = cast(Function, env['plain'])
+
+        self.assertIs(capturing.env, env)
+        self.assertIs(plain.env, env)
+        self.assertEqual([cell.value.inspect() for cell in capturing.cells], ['5'])
+        self.assertEqual(plain.cells, ())
+
+    def _test_integer(self, evaluated: Any, expected: int) -> None:
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEqual(evaluated.value, expected)
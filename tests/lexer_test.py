@@ -1,7 +1,7 @@
 from unittest import TestCase
 from typing import List
 from cantte.token import Token, TokenType
-from cantte.lexer import Lexer
+from cantte.lexer import Lexer, Position, SourceMap, TokenBuffer
 
 
 class LexerTest(TestCase):
@@ -187,6 +187,38 @@ class LexerTest(TestCase):
 
         self.assertEqual(tokens, expected_tokens)
 
+    def test_loop_statements(self) -> None:
+        source: str = 'while (i < 3) { i = i + 1; } for (x in xs) {}'
+        lexer: Lexer = Lexer(source)
+
+        tokens: List[Token] = [lexer.next_token() for _ in range(21)]
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.WHILE, 'while'),
+            Token(TokenType.LPAREN, '('),
+            Token(TokenType.IDENTIFIER, 'i'),
+            Token(TokenType.LESS_THAN, '<'),
+            Token(TokenType.INT, '3'),
+            Token(TokenType.RPAREN, ')'),
+            Token(TokenType.LBRACE, '{'),
+            Token(TokenType.IDENTIFIER, 'i'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.IDENTIFIER, 'i'),
+            Token(TokenType.PLUS, '+'),
+            Token(TokenType.INT, '1'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.RBRACE, '}'),
+            Token(TokenType.FOR, 'for'),
+            Token(TokenType.LPAREN, '('),
+            Token(TokenType.IDENTIFIER, 'x'),
+            Token(TokenType.IN, 'in'),
+            Token(TokenType.IDENTIFIER, 'xs'),
+            Token(TokenType.RPAREN, ')'),
+            Token(TokenType.LBRACE, '{'),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
     def test_two_character_operator(self) -> None:
         source: str = '''
             10 == 10;
@@ -233,3 +265,126 @@ class LexerTest(TestCase):
         ]
 
         self.assertEqual(tokens, expected_tokens)
+
+    def test_identifiers_and_whitespace(self) -> None:
+        source: str = 'let año_2\t=\n\r  valor1;'
+        lexer: Lexer = Lexer(source)
+
+        tokens: List[Token] = []
+        for i in range(6):
+            tokens.append(lexer.next_token())
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.LET, 'let'),
+            Token(TokenType.IDENTIFIER, 'año_2'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.IDENTIFIER, 'valor1'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.EOF, ''),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
+    def test_unterminated_string(self) -> None:
+        source: str = '"foo\' + 1'
+        lexer: Lexer = Lexer(source)
+
+        tokens: List[Token] = []
+        for i in range(2):
+            tokens.append(lexer.next_token())
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.STRING, 'foo\' + 1'),
+            Token(TokenType.EOF, ''),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
+    def test_tokenize(self) -> None:
+        source: str = '''
+            let add = func(x, y) { x + y; };
+            if (add(1, 2) != 3) { "bad" } else { 'good' }
+            "open @
+        '''
+        lexer: Lexer = Lexer(source)
+
+        expected_tokens: List[Token] = []
+        while (token := lexer.next_token()).token_type != TokenType.EOF:
+            expected_tokens.append(token)
+        expected_tokens.append(token)
+
+        buffer: TokenBuffer = Lexer(source).tokenize()
+        tokens: List[Token] = [buffer[i] for i in range(len(buffer))]
+
+        self.assertEqual(tokens, expected_tokens)
+        self.assertEqual(buffer.token_type(1), TokenType.IDENTIFIER)
+        self.assertEqual(buffer.literal(1), 'add')
+
+    def test_brackets(self) -> None:
+        source: str = 'numbers[0];'
+        lexer: Lexer = Lexer(source)
+
+        tokens: List[Token] = [lexer.next_token() for _ in range(6)]
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.IDENTIFIER, 'numbers'),
+            Token(TokenType.LBRACKET, '['),
+            Token(TokenType.INT, '0'),
+            Token(TokenType.RBRACKET, ']'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.EOF, ''),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
+    def test_colon(self) -> None:
+        source: str = '{"a": 1}'
+        lexer: Lexer = Lexer(source)
+
+        tokens: List[Token] = [lexer.next_token() for _ in range(6)]
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.LBRACE, '{'),
+            Token(TokenType.STRING, 'a'),
+            Token(TokenType.COLON, ':'),
+            Token(TokenType.INT, '1'),
+            Token(TokenType.RBRACE, '}'),
+            Token(TokenType.EOF, ''),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
+    def test_positions(self) -> None:
+        source: str = 'let a = 5;\n\n  "hi" + a;\n'
+        lexer: Lexer = Lexer(source)
+
+        offsets: List[int] = []
+        while (token := lexer.next_token()).token_type != TokenType.EOF:
+            offsets.append(token.offset)
+        offsets.append(token.offset)
+
+        buffer: TokenBuffer = Lexer(source).tokenize()
+
+        self.assertEqual(offsets, [0, 4, 6, 8, 9, 14, 19, 21, 22, 24])
+        self.assertEqual([buffer[i].offset for i in range(len(buffer))], offsets)
+        self.assertEqual([token.offset for token in buffer], offsets)
+        self.assertEqual(list(buffer), [buffer[i] for i in range(len(buffer))])
+        self.assertEqual([buffer.position(i) for i in range(len(buffer))], [
+            Position(1, 1), Position(1, 5), Position(1, 7), Position(1, 9), Position(1, 10),
+            Position(3, 3), Position(3, 8), Position(3, 10), Position(3, 11), Position(4, 1),
+        ])
+        self.assertEqual(str(buffer.position(5)), 'line 3, column 3')
+
+    def test_positions_do_not_affect_equality(self) -> None:
+        self.assertEqual(Token(TokenType.INT, '5', 8), Token(TokenType.INT, '5'))
+        self.assertNotEqual(Token(TokenType.INT, '5', 8), Token(TokenType.INT, '6', 8))
+        self.assertEqual(hash(Token(TokenType.INT, '5', 8)), hash(Token(TokenType.INT, '5')))
+
+    def test_source_map(self) -> None:
+        source_map: SourceMap = SourceMap('a\nbc\n\nd')
+
+        self.assertEqual(source_map.position(0), Position(1, 1))
+        self.assertEqual(source_map.position(1), Position(1, 2))
+        self.assertEqual(source_map.position(3), Position(2, 2))
+        self.assertEqual(source_map.position(5), Position(3, 1))
+        self.assertEqual(source_map.position(6), Position(4, 1))
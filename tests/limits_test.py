@@ -0,0 +1,201 @@
+import asyncio
+import sys
+import threading
+from typing import cast, Optional
+from unittest import TestCase
+
+import cantte.limits as limits
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.limits import Limits
+from cantte.object import Environment, Error, Integer, Object, String
+from cantte.parser import Parser
+
+
+class LimitsTest(TestCase):
+
+    def test_unlimited_runs(self) -> None:
+        evaluated = self._run(Limits(), '''
+            let fibonacci = func(n) {
+                if (n < 2) {
+                    return n;
+                }
+                return fibonacci(n - 1) + fibonacci(n - 2);
+            };
+            fibonacci(10);
+        ''')
+
+        self.assertEqual(cast(Integer, evaluated).value, 55)
+
+    def test_step_budget(self) -> None:
+        budget = Limits(max_steps=1000)
+        evaluated = self._run(budget, 'while (true) { }')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Step budget of 1000 exceeded')
+        self.assertEqual(budget.steps, 1001)
+
+        evaluated = self._run(Limits(max_steps=1000), 'let i = 0; while (i < 100) { i = i + 1; } i')
+
+        self.assertEqual(cast(Integer, evaluated).value, 100)
+
+        evaluated = self._run(Limits(max_steps=50), 'let count = func(n) { if (n > 0) { count(n - 1) } }; count(100)')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Step budget of 50 exceeded')
+
+    def test_call_depth(self) -> None:
+        source = 'let f = func(n) { if (n == 0) { return 0; } 1 + f(n - 1) }; f({n})'
+
+        evaluated = self._run(Limits(max_depth=50), source.replace('{n}', '40'))
+
+        self.assertEqual(cast(Integer, evaluated).value, 40)
+
+        evaluated = self._run(Limits(max_depth=50), source.replace('{n}', '60'))
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum call depth of 50 exceeded')
+
+        evaluated = self._run(Limits(), source.replace('{n}', str(sys.getrecursionlimit())))
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum call depth exceeded')
+
+    def test_tail_calls_do_not_grow_depth(self) -> None:
+        budget = Limits(max_depth=2)
+        evaluated = self._run(budget, 'let count = func(n) { if (n == 0) { return 0; } count(n - 1) }; count(500)')
+
+        self.assertEqual(cast(Integer, evaluated).value, 0)
+        self.assertEqual(budget.depth, 0)
+
+    def test_size_cap(self) -> None:
+        evaluated = self._run(Limits(max_size=1000), 'let s = "ab"; while (true) { s = s + s; }')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum size of 1000 exceeded')
+
+        evaluated = self._run(Limits(max_size=1000), 'let s = "ab"; for (i in range(8)) { s = s + s; } size(s)')
+
+        self.assertEqual(cast(Integer, evaluated).value, 512)
+
+        evaluated = self._run(Limits(max_size=10), 'let a = []; for (i in range(20)) { a = push(a, i); } a')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum size of 10 exceeded')
+
+        evaluated = self._run(Limits(max_size=2), '[1, 2, 3]')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum size of 2 exceeded')
+
+        evaluated = self._run(Limits(max_size=2), '{"a": 1, "b": 2, "c": 3}')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum size of 2 exceeded')
+
+    def test_integer_growth(self) -> None:
+        evaluated = self._run(Limits(max_size=4096), 'let x = 2; while (true) { x = x * x; }')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum size of 4096 exceeded')
+
+        evaluated = self._run(Limits(max_size=4096), 'let x = 2; for (i in range(10)) { x = x * x; } x > 0')
+
+        self.assertEqual(cast(Object, evaluated).inspect(), 'true')
+
+        evaluated = self._run(Limits(max_size=10), 'let x = 2; for (i in range(9)) { x = x * x; } x > 0')
+
+        self.assertEqual(cast(Object, evaluated).inspect(), 'true')
+
+        evaluated = self._run(Limits(max_size=10), 'let x = 2; for (i in range(10)) { x = x * x; } x > 0')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum size of 10 exceeded')
+
+    def test_limits_are_local_to_the_running_thread(self) -> None:
+        started = threading.Event()
+        results = []
+
+        def limited() -> None:
+            started.set()
+            results.append(self._run(Limits(timeout=0.2), 'while (true) { }'))
+
+        thread = threading.Thread(target=limited)
+        thread.start()
+        started.wait()
+
+        program = Parser(Lexer('let i = 0; while (i < 100000) { i = i + 1; } i')).parse_program()
+        evaluated = evaluate(program, Environment())
+        thread.join()
+
+        self.assertEqual(cast(Integer, evaluated).value, 100000)
+        self.assertEqual(cast(Error, results[0]).message, 'Timed out after 0.2s')
+
+    def test_timeout(self) -> None:
+        evaluated = self._run(Limits(timeout=0.05), 'while (true) { }')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Timed out after 0.05s')
+
+        evaluated = self._run(Limits(timeout=5, max_steps=100), 'while (true) { }')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Step budget of 100 exceeded')
+
+    def test_trampoline_limits(self) -> None:
+        evaluated = self._run(Limits(max_steps=1000), 'while (true) { }', 'trampoline')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Step budget of 1000 exceeded')
+
+        source = 'let f = func(n) { if (n == 0) { return 0; } 1 + f(n - 1) }; f({n})'
+        evaluated = self._run(Limits(max_depth=50), source.replace('{n}', '40'), 'trampoline')
+
+        self.assertEqual(cast(Integer, evaluated).value, 40)
+
+        evaluated = self._run(Limits(max_depth=50), source.replace('{n}', '60'), 'trampoline')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum call depth of 50 exceeded')
+
+        budget = Limits(max_depth=2)
+        evaluated = self._run(budget, 'let count = func(n) { if (n == 0) { return 0; } count(n - 1) }; count(500)',
+                              'trampoline')
+
+        self.assertEqual(cast(Integer, evaluated).value, 0)
+        self.assertEqual(budget.depth, 0)
+
+        evaluated = self._run(Limits(max_size=2), '[1, 2, 3]', 'trampoline')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum size of 2 exceeded')
+
+        evaluated = self._run(Limits(max_size=2), '{"a": 1, "b": 2, "c": 3}', 'trampoline')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Maximum size of 2 exceeded')
+
+        evaluated = self._run(Limits(timeout=0.05), 'for (i in range(10 * 1000 * 1000)) { }', 'trampoline')
+
+        self.assertEqual(cast(Error, evaluated).message, 'Timed out after 0.05s')
+
+    def test_async_limits(self) -> None:
+        program = Parser(Lexer('let i = 0; while (true) { i = i + 1; }')).parse_program()
+        evaluated = asyncio.run(Limits(max_steps=500).run_async(program, Environment(), yield_every=10))
+
+        self.assertEqual(cast(Error, evaluated).message, 'Step budget of 500 exceeded')
+
+        evaluated = asyncio.run(Limits(timeout=0.05).run_async(program, Environment()))
+
+        self.assertEqual(cast(Error, evaluated).message, 'Timed out after 0.05s')
+        self.assertIsNone(limits.active.get())
+
+    def test_unsupported_engines(self) -> None:
+        for engine in ['closures', 'vm']:
+            with self.assertRaises(ValueError):
+                self._run(Limits(max_steps=10), '1', engine)
+
+    def test_active_limits_are_restored(self) -> None:
+        self.assertIsNone(limits.active.get())
+
+        self._run(Limits(max_steps=10), 'while (true) { }')
+
+        self.assertIsNone(limits.active.get())
+
+        evaluated = self._run(Limits(), '"a" + "b"')
+
+        self.assertEqual(cast(String, evaluated).value, 'ab')
+        self.assertIsNone(limits.active.get())
+
+    @staticmethod
+    def _run(budget: Limits, source: str, engine: str = 'evaluator') -> Optional[Object]:
+        parser = Parser(Lexer(source))
+        program = parser.parse_program()
+
+        assert len(parser.errors) == 0, parser.errors
+
+        return budget.run(program, Environment(), engine)
@@ -0,0 +1,89 @@
+import os
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
+from typing import Tuple
+from unittest import TestCase
+
+from cantte.__main__ import main
+
+
+class MainTest(TestCase):
+
+    def test_run_file(self) -> None:
+        source: str = '''
+            let add = func(x, y) { x + y };
+            let hours = 24;
+            add(hours * 60, 1);
+        '''
+
+        for arguments in [[], ['--engine', 'vm'], ['--engine', 'closures', '--optimize']]:
+            code, out, err = self._run(source, *arguments)
+
+            self.assertEqual((code, out, err), (0, '1441\n', ''))
+
+    def test_run_file_without_result(self) -> None:
+        self.assertEqual(self._run('let a = 1;'), (0, '', ''))
+
+    def test_run_file_errors(self) -> None:
+        code, out, err = self._run('let = 5;')
+
+        self.assertEqual((code, out), (1, ''))
+        self.assertIn('was not expected', err)
+
+        self.assertIn('(line 1, column 5)', err)
+
+        code, out, err = self._run('let a = 1;\n  -true;')
+
+        self.assertEqual((code, out, err), (1, '', 'Error: Unknown operator: -BOOLEAN (line 2, column 3)\n'))
+
+        code, out, err = self._run('-true;', '--engine', 'vm')
+
+        self.assertEqual((code, out, err), (1, '', 'Error: Unknown operator: -BOOLEAN (line 1, column 1)\n'))
+
+    def test_run_file_with_cache(self) -> None:
+        with TemporaryDirectory() as directory:
+            previous = os.environ.get('CANTTE_CACHE_DIR')
+            os.environ['CANTTE_CACHE_DIR'] = directory
+
+            try:
+                for _ in range(2):
+                    self.assertEqual(self._run('1 + 2;', '--cache'), (0, '3\n', ''))
+            finally:
+                if previous is None:
+                    del os.environ['CANTTE_CACHE_DIR']
+                else:
+                    os.environ['CANTTE_CACHE_DIR'] = previous
+
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+    def test_run_file_with_profile(self) -> None:
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.folded')
+            code, out, err = self._run('let f = func(x) { x * 2 }; f(f(3));', '--profile-output', path)
+
+            self.assertEqual((code, out), (0, '12\n'))
+            self.assertIn('node type', err)
+            self.assertIn('f(x)', err)
+
+            with open(path, encoding='utf-8') as output:
+                self.assertIn('<program>;f(x)', output.read())
+
+    def test_profile_requires_the_evaluator(self) -> None:
+        for arguments in [['--profile', '--engine', 'vm'],
+                          ['--profile-output', 'profile.folded', '--engine', 'closures']]:
+            with self.assertRaises(SystemExit):
+                self._run('1;', *arguments)
+
+    @staticmethod
+    def _run(source: str, *arguments: str) -> Tuple[int, str, str]:
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'script.cnt')
+            with open(path, 'w', encoding='utf-8') as script:
+                script.write(source)
+
+            out, err = StringIO(), StringIO()
+            with redirect_stdout(out), redirect_stderr(err):
+                code = main(['run', path, *arguments])
+
+        return code, out.getvalue(), err.getvalue()
@@ -0,0 +1,99 @@
+from typing import cast, Optional
+from unittest import TestCase
+
+from cantte.buildtins import BUILTINS
+from cantte.evaluator import evaluate, TRUE
+from cantte.lexer import Lexer
+from cantte.memo import memo_statistics, MemoizedFunction, MemoStatistics
+from cantte.object import Builtin, Environment, Error, Integer, Object
+from cantte.parser import Parser
+
+
+class MemoTest(TestCase):
+
+    def test_statistics(self) -> None:
+        env = self._run('''
+            let fibonacci = memo(func(n) {
+                if (n < 2) {
+                    return n;
+                }
+                return fibonacci(n - 1) + fibonacci(n - 2);
+            });
+            fibonacci(20);
+        ''')
+
+        self.assertEqual(memo_statistics(env['fibonacci']), MemoStatistics(hits=18, misses=21, size=21, maxsize=1024))
+
+        evaluate(Parser(Lexer('fibonacci(20);')).parse_program(), env)
+
+        self.assertEqual(memo_statistics(env['fibonacci']), MemoStatistics(hits=19, misses=21, size=21, maxsize=1024))
+        self.assertIsNone(memo_statistics(BUILTINS['size']))
+
+    def test_bounded_size(self) -> None:
+        env = self._run('''
+            let square = memo(func(n) { n * n }, 2);
+            square(1); square(2); square(3); square(1);
+        ''')
+
+        self.assertEqual(memo_statistics(env['square']), MemoStatistics(hits=0, misses=4, size=2, maxsize=2))
+
+        self._run('square(1); square(3);', env)
+
+        self.assertEqual(memo_statistics(env['square']), MemoStatistics(hits=2, misses=4, size=2, maxsize=2))
+
+        cast(MemoizedFunction, cast(Builtin, env['square']).function).clear()
+
+        self.assertEqual(memo_statistics(env['square']), MemoStatistics(hits=0, misses=0, size=0, maxsize=2))
+
+    def test_arguments_are_hashed_by_value(self) -> None:
+        env = self._run('''
+            let identity = memo(func(x) { x });
+            identity(100000);
+            identity(50000 + 50000);
+            identity("a");
+            identity("a");
+            identity(true);
+            identity(1);
+            identity(func() { 1 });
+        ''')
+
+        self.assertEqual(memo_statistics(env['identity']), MemoStatistics(hits=2, misses=4, size=4, maxsize=1024))
+
+        evaluated = self._evaluate('identity(true)', env)
+        self.assertIs(evaluated, TRUE)
+
+        evaluated = self._evaluate('identity(1)', env)
+        self.assertIsInstance(evaluated, Integer)
+        self.assertEqual(cast(Integer, evaluated).value, 1)
+
+    def test_cached_errors_are_located_per_call(self) -> None:
+        env = self._run('let f = memo(first); f;')
+
+        evaluated = self._evaluate('f(1);', env)
+        self.assertEqual(cast(Error, evaluated).offset, 0)
+
+        again = self._evaluate('let a = 1;\nf(1);', env)
+        self.assertEqual(cast(Error, again).message, cast(Error, evaluated).message)
+        self.assertEqual(cast(Error, again).offset, 11)
+        self.assertEqual(memo_statistics(env['f']), MemoStatistics(hits=1, misses=1, size=1, maxsize=1024))
+
+    def test_wrong_number_of_arguments(self) -> None:
+        for source, received in [('memo()', 0), ('memo(first, 1, 2)', 3)]:
+            evaluated = self._evaluate(source, Environment())
+
+            self.assertEqual(cast(Error, evaluated).message,
+                             f'Wrong number of arguments. {received} received, 1 or 2 expected')
+
+    def _run(self, source: str, env: Optional[Environment] = None) -> Environment:
+        env = env if env is not None else Environment()
+        self._evaluate(source, env)
+
+        return env
+
+    @staticmethod
+    def _evaluate(source: str, env: Environment) -> Object:
+        evaluated = evaluate(Parser(Lexer(source)).parse_program(), env)
+
+        assert evaluated is not None
+
+        return evaluated
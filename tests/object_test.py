@@ -0,0 +1,121 @@
+from array import array
+from typing import cast
+from unittest import TestCase
+
+from cantte.object import (Array, Boolean, configure_integer_cache, FLAT_CONCAT_LIMIT, Hash, Integer,
+                           new_array, new_integer, SMALL_INTEGER_RANGE, String)
+
+
+class ObjectTest(TestCase):
+
+    def tearDown(self) -> None:
+        configure_integer_cache(*SMALL_INTEGER_RANGE)
+
+    def test_small_integer_cache(self) -> None:
+        minimum, maximum = SMALL_INTEGER_RANGE
+
+        for value in [minimum, 0, 1, maximum]:
+            integer = new_integer(value)
+
+            self.assertIsInstance(integer, Integer)
+            self.assertEqual(integer.value, value)
+            self.assertIs(integer, new_integer(value))
+
+        for value in [minimum - 1, maximum + 1]:
+            self.assertEqual(new_integer(value).value, value)
+            self.assertIsNot(new_integer(value), new_integer(value))
+
+    def test_configure_integer_cache(self) -> None:
+        configure_integer_cache(0, 1000)
+
+        self.assertIs(new_integer(1000), new_integer(1000))
+        self.assertIsNot(new_integer(-1), new_integer(-1))
+
+        configure_integer_cache(0, -1)
+
+        self.assertIsNot(new_integer(0), new_integer(0))
+
+    def test_array_backing_store(self) -> None:
+        integers = new_array([new_integer(value) for value in range(3)])
+
+        self.assertIsInstance(integers.elements, array)
+        self.assertEqual(cast(array, integers.elements).typecode, 'q')
+        self.assertIs(integers.get(1), new_integer(1))
+        self.assertIsNone(integers.get(3))
+
+        self.assertIsInstance(new_array([new_integer(1), String('a')]).elements, list)
+        self.assertIsInstance(new_array([Integer(2 ** 64)]).elements, list)
+        self.assertIsInstance(integers.append(String('a')).elements, list)
+        self.assertIsInstance(integers.append(Integer(2 ** 64)).elements, list)
+
+    def test_array_views(self) -> None:
+        numbers = new_array([new_integer(value) for value in range(5)])
+        rest = numbers.slice(1, len(numbers))
+
+        self.assertIs(rest.elements, numbers.elements)
+        self.assertEqual(rest.inspect(), '[1, 2, 3, 4]')
+        self.assertEqual(rest.slice(2, 3).inspect(), '[3]')
+
+        pushed = numbers.append(new_integer(5))
+
+        self.assertIs(pushed.elements, numbers.elements)
+        self.assertEqual(numbers.inspect(), '[0, 1, 2, 3, 4]')
+        self.assertEqual(pushed.inspect(), '[0, 1, 2, 3, 4, 5]')
+
+        branched = numbers.append(new_integer(6))
+
+        self.assertIsNot(branched.elements, numbers.elements)
+        self.assertEqual(branched.inspect(), '[0, 1, 2, 3, 4, 6]')
+        self.assertEqual(pushed.inspect(), '[0, 1, 2, 3, 4, 5]')
+        self.assertEqual(len(Array([])), 0)
+
+    def test_string_ropes(self) -> None:
+        short = String('ab').concat(String('cd'))
+
+        self.assertFalse(short.is_rope())
+        self.assertEqual(short.value, 'abcd')
+
+        piece = String('x' * FLAT_CONCAT_LIMIT)
+        rope = piece.concat(String('y'))
+
+        self.assertTrue(rope.is_rope())
+        self.assertEqual(len(rope), FLAT_CONCAT_LIMIT + 1)
+        self.assertIs(piece.concat(String('')), piece)
+        self.assertIs(String('').concat(piece), piece)
+
+        left = String('<').concat(rope)
+
+        self.assertEqual(left.inspect(), '<' + 'x' * FLAT_CONCAT_LIMIT + 'y')
+        self.assertFalse(left.is_rope())
+        self.assertTrue(rope.is_rope())
+        self.assertEqual(rope.hash_key(), 'x' * FLAT_CONCAT_LIMIT + 'y')
+        self.assertFalse(rope.is_rope())
+
+    def test_deep_rope_flattening(self) -> None:
+        report = String('')
+
+        for _ in range(100_000):
+            report = report.concat(String('x' * 10))
+
+        self.assertTrue(report.is_rope())
+        self.assertEqual(len(report), 1_000_000)
+        self.assertEqual(report.value, 'x' * 1_000_000)
+
+    def test_hash_keys(self) -> None:
+        self.assertEqual(String('Hello').hash_key(), String('Hello').hash_key())
+        self.assertNotEqual(String('Hello').hash_key(), String('World').hash_key())
+        self.assertEqual(Integer(2 ** 70).hash_key(), Integer(2 ** 70).hash_key())
+        self.assertEqual(Boolean(True).hash_key(), Boolean(True).hash_key())
+        self.assertNotEqual(Boolean(True).hash_key(), Integer(1).hash_key())
+        self.assertNotEqual(Boolean(False).hash_key(), Integer(0).hash_key())
+        self.assertNotEqual(String('1').hash_key(), Integer(1).hash_key())
+
+        pairs = Hash({Integer(1).hash_key(): String('one'), Boolean(True).hash_key(): String('yes')})
+
+        self.assertEqual(len(pairs), 2)
+        self.assertEqual(pairs.inspect(), '{1: one, true: yes}')
+
+        mixed = Hash({Integer(1).hash_key(): Integer(2), String('1').hash_key(): Integer(2)})
+
+        self.assertEqual(mixed.inspect(), '{1: 2, "1": 2}')
+
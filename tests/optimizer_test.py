@@ -0,0 +1,100 @@
+from typing import cast, List, Tuple
+from unittest import TestCase
+
+from cantte.ast import ExpressionStatement, If, Infix, Integer, Program
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment, Error
+from cantte.optimizer import optimize
+from cantte.parser import Parser
+
+
+class OptimizerTest(TestCase):
+
+    def test_constant_folding(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('60 * 60 * 24;', '86400'),
+            ('"prefix" + "suffix";', 'prefixsuffix'),
+            ('!true;', 'false'),
+            ('-(5 - 10);', '5'),
+            ('1 < 2 == true;', 'true'),
+            ('"a" != "b";', 'true'),
+            ('7 / 2;', '3'),
+            ('let x = 2 * 3 + y;', 'let x = (6 + y);'),
+            ('func(a) { a * (2 + 3) }(1 + 1);', 'func(a) (a * 5)(2)'),
+            ('x + 1 + 2;', '((x + 1) + 2)'),
+            ('[1 + 1, x * (2 * 2)][0 + 1];', '([2, (x * 4)][1])'),
+            ('{"a" + "b": 2 * 3, x: -1}["ab"];', '({ab: 6, x: -1}[ab])'),
+            ('while (i < 2 * 5) { i = i + (1 + 1); }', 'while (i < 10) i = (i + 2);'),
+            ('for (x in range(2 * 2)) { y = x * (3 - 1) }', 'for x in range(4) y = (x * 2);'),
+        ]
+
+        for source, expected in tests:
+            program = optimize(self._parse(source))
+
+            self.assertEqual(str(program), expected)
+
+    def test_errors_are_not_folded(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('5 + true;', '(5 + true)'),
+            ('-true;', '(-true)'),
+            ('"a" - "b";', '(a - b)'),
+            ('1 / 0;', '(1 / 0)'),
+            ('true + false;', '(true + false)'),
+        ]
+
+        for source, expected in tests:
+            program = optimize(self._parse(source))
+
+            self.assertEqual(str(program), expected)
+
+        self.assertIsInstance(evaluate(optimize(self._parse('5 + true;')), Environment()), Error)
+
+        with self.assertRaises(ZeroDivisionError):
+            evaluate(optimize(self._parse('1 / 0;')), Environment())
+
+    def test_dead_branch_elimination(self) -> None:
+        tests: List[Tuple[str, str, int]] = [
+            ('if (true) { 1 } else { 2 };', 'if true 1', 1),
+            ('if (1 > 2) { 1 } else { 2 };', 'if true 2', 2),
+            ('if (10) { 1 } else { 2 };', 'if 10 1', 1),
+        ]
+
+        for source, expected, value in tests:
+            program = optimize(self._parse(source))
+            if_expression = cast(If, cast(ExpressionStatement, program.statements[0]).expression)
+
+            self.assertEqual(str(program), expected)
+            self.assertIsNone(if_expression.alternative)
+
+            evaluated = evaluate(program, Environment())
+
+            assert evaluated is not None
+            self.assertEqual(evaluated.inspect(), str(value))
+
+        program = optimize(self._parse('if (false) { 1 };'))
+        if_expression = cast(If, cast(ExpressionStatement, program.statements[0]).expression)
+
+        assert if_expression.consequence is not None
+        self.assertEqual(if_expression.consequence.statements, [])
+
+        evaluated = evaluate(program, Environment())
+
+        assert evaluated is not None
+        self.assertEqual(evaluated.inspect(), 'null')
+
+    def test_unknown_conditions_are_kept(self) -> None:
+        program = optimize(self._parse('if (x) { 1 + 1 } else { 2 * 2 };'))
+
+        self.assertEqual(str(program), 'if x 2else 4')
+
+    def test_folded_nodes(self) -> None:
+        program = optimize(self._parse('x * (2 + 3);'))
+        infix = cast(Infix, cast(ExpressionStatement, program.statements[0]).expression)
+
+        self.assertIsInstance(infix.right, Integer)
+        self.assertEqual(cast(Integer, infix.right).value, 5)
+
+    @staticmethod
+    def _parse(source: str) -> Program:
+        return Parser(Lexer(source)).parse_program()
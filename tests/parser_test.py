@@ -1,12 +1,13 @@
 from unittest import TestCase
 from typing import List, cast, Any, Tuple
 
-from cantte.lexer import Lexer
+from cantte.lexer import Lexer, TokenBuffer
 from cantte.parser import Parser
 from cantte.ast import (Program, LetStatement, ReturnStatement,
                         ExpressionStatement, Expression, Identifier,
                         Integer, Prefix, Infix, Boolean, If, Block, Function,
-                        Call, StringLiteral)
+                        Call, StringLiteral, ArrayLiteral, Index, HashLiteral,
+                        AssignStatement, WhileStatement, ForStatement)
 
 
 class ParserTest(TestCase):
@@ -63,6 +64,26 @@ class ParserTest(TestCase):
         program: Program = parser.parse_program()
 
         self.assertEqual(len(parser.errors), 1)
+        self.assertTrue(parser.errors[0].endswith('(line 1, column 7)'))
+
+        parser = Parser(Lexer('let a = 1;\n  let b = );'))
+        parser.parse_program()
+
+        self.assertEqual(parser.errors, ['There is no function that can parse \')\' (line 2, column 11)'])
+
+    def test_node_offsets(self) -> None:
+        program: Program = Parser(Lexer('let a = 1;\nreturn a + 2;')).parse_program()
+
+        let_statement = cast(LetStatement, program.statements[0])
+        return_statement = cast(ReturnStatement, program.statements[1])
+
+        self.assertEqual(let_statement.offset, 0)
+        assert let_statement.name is not None and let_statement.value is not None
+        self.assertEqual(let_statement.name.offset, 4)
+        self.assertEqual(let_statement.value.offset, 8)
+        self.assertEqual(return_statement.offset, 11)
+        assert return_statement.return_value is not None
+        self.assertEqual(return_statement.return_value.offset, 20)
 
     def test_return_statement(self) -> None:
         source: str = '''
@@ -225,6 +246,8 @@ class ParserTest(TestCase):
             ('a + sum(b * c) + d;', '((a + sum((b * c))) + d)', 1),
             ('sum(a, b, 1, 2* 3, 4 + 5, sum(6, 7 * 8));', 'sum(a, b, 1, (2 * 3), (4 + 5), sum(6, (7 * 8)))', 1),
             ('sum(a + b + c * d / f + g);', 'sum((((a + b) + ((c * d) / f)) + g))', 1),
+            ('a * [1, 2, 3, 4][b * c] * d;', '((a * ([1, 2, 3, 4][(b * c)])) * d)', 1),
+            ('add(a * b[2], b[1], 2 * [1, 2][1]);', 'add((a * (b[2])), (b[1]), (2 * ([1, 2][1])))', 1),
         ]
 
         for source, expected_result, expected_statement_count in test_sources:
@@ -355,6 +378,149 @@ class ParserTest(TestCase):
         self.assertIsInstance(string_literal, StringLiteral)
         self.assertEqual(string_literal.value, "Hello!")
 
+    def test_array_literal(self) -> None:
+        parser: Parser = Parser(Lexer('[1, 2 * 2, 3 + 3]; [];'))
+
+        program: Program = parser.parse_program()
+
+        self._test_program_statements(parser, program, expected_statements=2)
+
+        array = cast(ArrayLiteral, cast(ExpressionStatement, program.statements[0]).expression)
+
+        self.assertIsInstance(array, ArrayLiteral)
+        assert array.elements is not None
+        self.assertEqual(len(array.elements), 3)
+        self._test_literal_expression(array.elements[0], 1)
+        self._test_infix_expression(array.elements[1], 2, '*', 2)
+        self._test_infix_expression(array.elements[2], 3, '+', 3)
+
+        empty = cast(ArrayLiteral, cast(ExpressionStatement, program.statements[1]).expression)
+
+        self.assertEqual(empty.elements, [])
+
+    def test_index_expression(self) -> None:
+        parser: Parser = Parser(Lexer('my_array[1 + 1];'))
+
+        program: Program = parser.parse_program()
+
+        self._test_program_statements(parser, program)
+
+        index = cast(Index, cast(ExpressionStatement, program.statements[0]).expression)
+
+        self.assertIsInstance(index, Index)
+        self._test_identifier(index.left, 'my_array')
+        assert index.index is not None
+        self._test_infix_expression(index.index, 1, '+', 1)
+
+    def test_hash_literal(self) -> None:
+        parser: Parser = Parser(Lexer('{"one": 1, two: 2 * 2, 3: true}; {};'))
+
+        program: Program = parser.parse_program()
+
+        self._test_program_statements(parser, program, expected_statements=2)
+
+        hash_literal = cast(HashLiteral, cast(ExpressionStatement, program.statements[0]).expression)
+
+        self.assertIsInstance(hash_literal, HashLiteral)
+        assert hash_literal.pairs is not None
+        self.assertEqual(len(hash_literal.pairs), 3)
+        self.assertEqual(cast(StringLiteral, hash_literal.pairs[0][0]).value, 'one')
+        self._test_literal_expression(hash_literal.pairs[0][1], 1)
+        self._test_identifier(hash_literal.pairs[1][0], 'two')
+        self._test_infix_expression(hash_literal.pairs[1][1], 2, '*', 2)
+        self._test_literal_expression(hash_literal.pairs[2][0], 3)
+        self._test_literal_expression(hash_literal.pairs[2][1], True)
+
+        empty = cast(HashLiteral, cast(ExpressionStatement, program.statements[1]).expression)
+
+        self.assertEqual(empty.pairs, [])
+        self.assertEqual(str(program), '{one: 1, two: (2 * 2), 3: true}{}')
+
+    def test_hash_literal_errors(self) -> None:
+        parser: Parser = Parser(Lexer('{"a" 1}'))
+
+        parser.parse_program()
+
+        self.assertIn("The following token 'TokenType.INT' was not expected. "
+                      "Was expected 'TokenType.COLON'. (line 1, column 6)", parser.errors)
+
+    def test_assign_statement(self) -> None:
+        parser: Parser = Parser(Lexer('x = x + 1; y == 2;'))
+
+        program: Program = parser.parse_program()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(len(program.statements), 2)
+
+        assign_statement = cast(AssignStatement, program.statements[0])
+
+        self.assertIsInstance(assign_statement, AssignStatement)
+        assert assign_statement.name is not None and assign_statement.value is not None
+        self._test_identifier(assign_statement.name, 'x')
+        self._test_infix_expression(assign_statement.value, 'x', '+', 1)
+        self.assertIsInstance(program.statements[1], ExpressionStatement)
+        self.assertEqual(str(program), 'x = (x + 1);(y == 2)')
+
+    def test_while_statement(self) -> None:
+        parser: Parser = Parser(Lexer('while (i < 10) { i = i + 1; } i;'))
+
+        program: Program = parser.parse_program()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(len(program.statements), 2)
+
+        while_statement = cast(WhileStatement, program.statements[0])
+
+        self.assertIsInstance(while_statement, WhileStatement)
+        assert while_statement.condition is not None and while_statement.body is not None
+        self._test_infix_expression(while_statement.condition, 'i', '<', 10)
+        self.assertEqual(len(while_statement.body.statements), 1)
+        self.assertIsInstance(while_statement.body.statements[0], AssignStatement)
+        self.assertEqual(str(while_statement), 'while (i < 10) i = (i + 1);')
+
+    def test_for_statement(self) -> None:
+        parser: Parser = Parser(Lexer('for (n in range(1, 5)) { total = total + n }; total'))
+
+        program: Program = parser.parse_program()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(len(program.statements), 2)
+
+        for_statement = cast(ForStatement, program.statements[0])
+
+        self.assertIsInstance(for_statement, ForStatement)
+        assert for_statement.name is not None and for_statement.iterable is not None
+        self._test_identifier(for_statement.name, 'n')
+        self.assertEqual(str(for_statement.iterable), 'range(1, 5)')
+        self.assertEqual(str(for_statement), 'for n in range(1, 5) total = (total + n);')
+
+    def test_loop_errors(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('while i < 10 { }', "The following token 'TokenType.IDENTIFIER' was not expected. "
+                                 "Was expected 'TokenType.LPAREN'. (line 1, column 7)"),
+            ('for (1 in xs) { }', "The following token 'TokenType.INT' was not expected. "
+                                  "Was expected 'TokenType.IDENTIFIER'. (line 1, column 6)"),
+            ('for (x xs) { }', "The following token 'TokenType.IDENTIFIER' was not expected. "
+                               "Was expected 'TokenType.IN'. (line 1, column 8)"),
+        ]
+
+        for source, expected in tests:
+            parser: Parser = Parser(Lexer(source))
+
+            parser.parse_program()
+
+            self.assertIn(expected, parser.errors)
+
+    def test_token_buffer(self) -> None:
+        source: str = 'let sum = func(x, y) { x + y; }; sum(1, "two");'
+        tokens: TokenBuffer = Lexer(source).tokenize()
+        parser: Parser = Parser(tokens)
+
+        program: Program = parser.parse_program()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(str(program), 'let sum = func(x, y) (x + y);sum(1, two)')
+
     def _test_block(self, block: Block, statement_count: int, expected_identifiers: List[str]) -> None:
         self.assertIsInstance(block, Block)
         self.assertEqual(len(block.statements), statement_count)
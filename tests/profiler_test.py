@@ -0,0 +1,140 @@
+import os
+import tempfile
+import threading
+from typing import cast
+from unittest import TestCase
+
+import cantte.evaluator as evaluator
+from cantte.lexer import Lexer
+from cantte.object import Environment, Integer
+from cantte.parser import Parser
+from cantte.profiler import PROGRAM_FRAME, Profiler
+
+
+class ProfilerTest(TestCase):
+
+    def test_node_counts(self) -> None:
+        profiler = Profiler()
+        evaluated = profiler.run(Parser(Lexer('let a = 1 + 2; a * 3;')).parse_program(), Environment())
+
+        self.assertEqual(cast(Integer, evaluated).value, 9)
+        self.assertEqual(profiler.nodes['Program'].count, 1)
+        self.assertEqual(profiler.nodes['Infix'].count, 2)
+        self.assertEqual(profiler.nodes['Integer'].count, 3)
+        self.assertEqual(profiler.nodes['Identifier'].count, 1)
+        self.assertEqual(profiler.functions, {})
+
+    def test_function_calls(self) -> None:
+        profiler = Profiler()
+        evaluated = profiler.run(Parser(Lexer('''
+            let fibonacci = func(n) {
+                if (n < 2) {
+                    return n;
+                }
+                return fibonacci(n - 1) + fibonacci(n - 2);
+            };
+            let twice = func(f, x) { f(f(x)) };
+            twice(func(x) { x + 1 }, fibonacci(10));
+        ''')).parse_program(), Environment())
+
+        self.assertEqual(cast(Integer, evaluated).value, 57)
+        self.assertEqual(profiler.functions['fibonacci(n)'].calls, 177)
+        self.assertEqual(profiler.functions['twice(f, x)'].calls, 1)
+        self.assertEqual(profiler.functions['<anonymous>(x)'].calls, 2)
+
+        fibonacci = profiler.functions['fibonacci(n)']
+        self.assertLessEqual(fibonacci.self_time, fibonacci.total_time)
+
+    def test_labels_with_source(self) -> None:
+        source: str = 'let double = func(x) { x * 2 };\ndouble(func(y) {\n  y\n}(4));'
+        profiler = Profiler(source=source)
+        profiler.run(Parser(Lexer(source)).parse_program(), Environment())
+
+        self.assertEqual(sorted(profiler.functions), ['<anonymous>(y):2:16', 'double(x):1:22'])
+
+    def test_tail_calls_are_counted(self) -> None:
+        profiler = Profiler()
+        evaluated = profiler.run(Parser(Lexer('''
+            let countdown = func(n) { if (n == 0) { return 0; } return countdown(n - 1); };
+            countdown(5000);
+        ''')).parse_program(), Environment())
+
+        self.assertEqual(cast(Integer, evaluated).value, 0)
+        self.assertEqual(profiler.functions['countdown(n)'].calls, 5001)
+        self.assertEqual(set(profiler.stacks), {PROGRAM_FRAME, f'{PROGRAM_FRAME};countdown(n)'})
+
+    def test_other_threads_are_not_profiled(self) -> None:
+        profiler = Profiler()
+        results = []
+
+        def run() -> None:
+            program = Parser(Lexer('let double = func(x) { x * 2 }; double(21);')).parse_program()
+            results.append(evaluator.evaluate(program, Environment()))
+
+        with profiler:
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(cast(Integer, results[0]).value, 42)
+        self.assertEqual(profiler.nodes, {})
+        self.assertEqual(profiler.functions, {})
+
+    def test_time_accounting(self) -> None:
+        ticks = iter(range(1_000_000))
+        profiler = Profiler(clock=lambda: float(next(ticks)))
+        profiler.run(Parser(Lexer('''
+            let inner = func() { 1 };
+            let outer = func() { inner() + inner() };
+            outer();
+        ''')).parse_program(), Environment())
+
+        outer = profiler.functions['outer()']
+        inner = profiler.functions['inner()']
+
+        self.assertEqual(outer.total_time, outer.self_time + inner.total_time)
+        self.assertEqual(sum(profiler.stacks.values()), profiler.nodes['Program'].total_time + 2)
+        self.assertEqual(sum(node.self_time for node in profiler.nodes.values()),
+                         profiler.nodes['Program'].total_time)
+
+    def test_collapsed_stacks(self) -> None:
+        profiler = Profiler()
+        profiler.run(Parser(Lexer('''
+            let inner = func() { 1 };
+            let outer = func() { inner() + 1 };
+            outer(); outer();
+        ''')).parse_program(), Environment())
+
+        stacks = [line.rsplit(' ', 1) for line in profiler.collapsed_stacks()]
+
+        self.assertEqual([stack for stack, _ in stacks],
+                         [PROGRAM_FRAME, f'{PROGRAM_FRAME};outer()', f'{PROGRAM_FRAME};outer();inner()'])
+        self.assertTrue(all(micros.isdigit() for _, micros in stacks))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.folded')
+            profiler.write_collapsed_stacks(path)
+
+            with open(path, encoding='utf-8') as output:
+                self.assertEqual(output.read().splitlines(), profiler.collapsed_stacks())
+
+    def test_report(self) -> None:
+        profiler = Profiler()
+        profiler.run(Parser(Lexer('let f = func(x) { x }; f(1);')).parse_program(), Environment())
+
+        report = profiler.report().splitlines()
+
+        self.assertTrue(report[0].startswith('node type'))
+        self.assertIn('function', report[report.index('') + 1])
+        self.assertTrue(report[-1].startswith('f(x)'))
+        self.assertEqual(len(profiler.report(limit=1).splitlines()), 5)
+
+    def test_disable_restores_evaluator(self) -> None:
+        evaluate = evaluator.evaluate
+        function_body = evaluator._evaluate_function_body
+
+        with Profiler():
+            self.assertIsNot(evaluator.evaluate, evaluate)
+
+        self.assertIs(evaluator.evaluate, evaluate)
+        self.assertIs(evaluator._evaluate_function_body, function_body)
@@ -0,0 +1,66 @@
+from typing import cast, List, Optional
+from unittest import TestCase
+
+from cantte.object import Integer, Object
+from cantte.repl import ENGINES, Session
+
+
+class SessionTest(TestCase):
+
+    def test_state_persists_between_lines(self) -> None:
+        for engine in ENGINES:
+            session = Session(engine)
+
+            self._run(session, 'let a = 5;')
+            self._run(session, 'let add = func(x) { a + x };')
+            evaluated = self._run(session, 'add(10)')
+
+            self._test_integer_object(evaluated, 15)
+
+    def test_parse_errors_keep_previous_state(self) -> None:
+        for engine in ENGINES:
+            session = Session(engine)
+
+            self._run(session, 'let a = 5;')
+
+            evaluated, errors = session.run('let a = ;')
+
+            self.assertIsNone(evaluated)
+            self.assertGreater(len(errors), 0)
+            self._test_integer_object(self._run(session, 'a'), 5)
+
+    def test_optimized_session(self) -> None:
+        for engine in ENGINES:
+            session = Session(engine, optimized=True)
+
+            self._run(session, 'let day = func(n) { n * 60 * 60 * 24 };')
+            evaluated = self._run(session, 'if (1 < 2) { day(2) } else { 0 }')
+
+            self._test_integer_object(evaluated, 172800)
+
+    def test_lines_are_evaluated_once(self) -> None:
+        session = Session()
+        evaluations: List[Object] = []
+
+        self._run(session, 'let counter = 0;')
+
+        for _ in range(3):
+            evaluated = self._run(session, 'let counter = counter + 1; counter')
+            assert evaluated is not None
+            evaluations.append(evaluated)
+
+        self.assertEqual([cast(Integer, evaluated).value for evaluated in evaluations], [1, 2, 3])
+
+    def _run(self, session: Session, source: str) -> Optional[Object]:
+        evaluated, errors = session.run(source)
+
+        self.assertEqual(errors, [])
+
+        return evaluated
+
+    def _test_integer_object(self, evaluated: Optional[Object], expected: int) -> None:
+        self.assertIsInstance(evaluated, Integer)
+
+        evaluated = cast(Integer, evaluated)
+
+        self.assertEqual(evaluated.value, expected)
@@ -0,0 +1,222 @@
+from typing import cast, Dict
+from unittest import TestCase
+
+from cantte.ast import (ASTNode, AssignStatement, Call, CELL, ExpressionStatement, ForStatement, FREE, Function,
+                        GLOBAL, Identifier, If, Infix, LetStatement, Program, UNRESOLVED)
+from cantte.lexer import Lexer
+from cantte.parser import Parser
+from cantte.resolver import resolve
+
+
+class ResolverTest(TestCase):
+
+    def test_globals(self) -> None:
+        program = self._parse('let a = 1; a;')
+
+        let_statement = cast(LetStatement, program.statements[0])
+        identifier = cast(Identifier, cast(ExpressionStatement, program.statements[1]).expression)
+
+        assert let_statement.name is not None
+        self.assertEqual(let_statement.name.depth, UNRESOLVED)
+
+        resolve(program)
+
+        self.assertTrue(program.resolved)
+        self.assertEqual(let_statement.name.depth, GLOBAL)
+        self.assertEqual(identifier.depth, GLOBAL)
+
+    def test_function_scopes(self) -> None:
+        program = resolve(self._parse('''
+            let f = func(a, b) {
+                if (a) {
+                    let c = b;
+                }
+                func(d) { a + d + size };
+            };
+        '''))
+
+        function = cast(Function, cast(LetStatement, program.statements[0]).value)
+
+        assert function.scope is not None
+        self.assertEqual(function.scope.names, ('a', 'b', 'c'))
+        self.assertEqual(function.scope.slots, {'a': 0, 'b': 1, 'c': 2})
+
+        assert function.body is not None
+        inner = cast(Function, cast(ExpressionStatement, function.body.statements[1]).expression)
+
+        assert inner.scope is not None and inner.body is not None
+        self.assertEqual(inner.scope.names, ('d',))
+        self.assertEqual((function.scope.parameters, function.scope.locals), (2, 1))
+        self.assertEqual((function.scope.captures, inner.scope.captures), (True, False))
+
+        body = cast(Infix, cast(ExpressionStatement, inner.body.statements[0]).expression)
+        left = cast(Infix, body.left)
+        a = cast(Identifier, left.left)
+        d = cast(Identifier, left.right)
+        size = cast(Identifier, body.right)
+
+        self.assertEqual((a.depth, a.slot), (FREE, 0))
+        self.assertEqual((d.depth, d.slot), (0, 0))
+        self.assertEqual(size.depth, GLOBAL)
+        self.assertEqual(function.scope.cells, (0,))
+        self.assertEqual((inner.scope.closure, inner.scope.closure_slots), (((True, 0),), {'a': 0}))
+
+        if_expression = cast(If, cast(ExpressionStatement, function.body.statements[0]).expression)
+        condition = cast(Identifier, if_expression.condition)
+
+        assert if_expression.consequence is not None
+        b = cast(Identifier, cast(LetStatement, if_expression.consequence.statements[0]).value)
+
+        self.assertEqual((condition.depth, condition.slot), (CELL, 0))
+        self.assertEqual((b.depth, b.slot), (0, 1))
+
+    def test_recursive_reference(self) -> None:
+        program = resolve(self._parse('''
+            let f = func() {
+                let g = func(n) { g(n) };
+            };
+        '''))
+
+        function = cast(Function, cast(LetStatement, program.statements[0]).value)
+
+        assert function.body is not None
+        g = cast(Function, cast(LetStatement, function.body.statements[0]).value)
+
+        assert g.body is not None
+        call = cast(Call, cast(ExpressionStatement, g.body.statements[0]).expression)
+        callee = cast(Identifier, call.function)
+
+        self.assertEqual((callee.depth, callee.slot), (FREE, 0))
+        name = cast(LetStatement, function.body.statements[0]).name
+
+        assert name is not None
+        self.assertEqual(name.depth, CELL)
+
+    def test_transitive_captures(self) -> None:
+        program = resolve(self._parse('''
+            let f = func(a, b) {
+                func() {
+                    let c = 1;
+                    func() { b + c }
+                }
+            };
+        '''))
+
+        outer = cast(Function, cast(LetStatement, program.statements[0]).value)
+
+        assert outer.body is not None and outer.scope is not None
+        middle = cast(Function, cast(ExpressionStatement, outer.body.statements[0]).expression)
+
+        assert middle.body is not None and middle.scope is not None
+        inner = cast(Function, cast(ExpressionStatement, middle.body.statements[1]).expression)
+
+        assert inner.scope is not None
+        self.assertEqual(outer.scope.cells, (1,))
+        self.assertEqual((middle.scope.cells, middle.scope.closure), ((0,), ((True, 1),)))
+        self.assertEqual(inner.scope.closure, ((False, 0), (True, 0)))
+        self.assertEqual(inner.scope.closure_slots, {'b': 0, 'c': 1})
+
+    def test_shadowed_captures_fall_back(self) -> None:
+        program = resolve(self._parse('''
+            let a = func() {
+                let x = 1;
+                let b = func() {
+                    let c = func() { x };
+                    let x = 2;
+                };
+            };
+        '''))
+
+        a = cast(Function, cast(LetStatement, program.statements[0]).value)
+
+        assert a.body is not None
+        b = cast(Function, cast(LetStatement, a.body.statements[1]).value)
+
+        assert b.body is not None and b.scope is not None
+        c = cast(Function, cast(LetStatement, b.body.statements[0]).value)
+
+        assert c.scope is not None
+        self.assertEqual((b.scope.closure, b.scope.closure_slots), (((True, 0),), {'x': 0}))
+        self.assertEqual(c.scope.closure, ((True, 1), (False, 0)))
+        self.assertEqual((c.scope.closure_slots, c.scope.fallbacks), ({'x': 0}, {0: 1}))
+
+    def test_non_capturing_functions(self) -> None:
+        program = resolve(self._parse('''
+            let f = func(a) {
+                let data = [a];
+                func(x) { x * 2 }
+            };
+            let g = func(a) { func(x) { let a = a + x; a } };
+        '''))
+
+        f = cast(Function, cast(LetStatement, program.statements[0]).value)
+        g = cast(Function, cast(LetStatement, program.statements[1]).value)
+
+        assert f.body is not None and f.scope is not None and g.body is not None and g.scope is not None
+        f_inner = cast(Function, cast(ExpressionStatement, f.body.statements[1]).expression)
+        g_inner = cast(Function, cast(ExpressionStatement, g.body.statements[0]).expression)
+
+        assert f_inner.scope is not None and g_inner.scope is not None
+        self.assertEqual((f.scope.cells, f_inner.scope.closure), ((), ()))
+        self.assertEqual((g.scope.cells, g_inner.scope.closure_slots), ((0,), {'a': 0}))
+
+    def test_loop_scopes(self) -> None:
+        program = resolve(self._parse('''
+            let total = 0;
+            let f = func(n) {
+                for (i in range(n)) {
+                    total = total + i;
+                }
+            };
+        '''))
+
+        function = cast(Function, cast(LetStatement, program.statements[1]).value)
+
+        assert function.scope is not None and function.body is not None
+        self.assertEqual(function.scope.names, ('n', 'i'))
+
+        for_statement = cast(ForStatement, function.body.statements[0])
+
+        assert for_statement.name is not None and for_statement.body is not None
+        self.assertEqual((for_statement.name.depth, for_statement.name.slot), (0, 1))
+
+        assign_statement = cast(AssignStatement, for_statement.body.statements[0])
+
+        assert assign_statement.name is not None
+        self.assertEqual(assign_statement.name.depth, GLOBAL)
+
+    def test_tail_calls(self) -> None:
+        program = resolve(self._parse('''
+            let f = func(n) {
+                let a = g(n);
+                if (h(n)) {
+                    return i(n);
+                }
+                j(k(n)) + 1;
+                while (q(n)) { r(n); return s(n); }
+                if (n) { l(n) } else { m(n) };
+            };
+            let o = func() { return func() { p() }; };
+            top(1);
+        '''))
+
+        calls: Dict[str, bool] = {}
+
+        def collect(node: ASTNode) -> None:
+            if type(node) == Call:
+                call = cast(Call, node)
+                calls[str(call.function)] = call.tail
+
+            for child in node.children():
+                collect(child)
+
+        collect(program)
+
+        self.assertEqual(calls, {
+            'g': False, 'h': False, 'i': True, 'j': False, 'k': False,
+            'l': True, 'm': True, 'p': True, 'q': False, 'r': False, 's': True, 'top': False,
+        })
+
+    @staticmethod
+    def _parse(source: str) -> Program:
+        return Parser(Lexer(source)).parse_program()
@@ -0,0 +1,109 @@
+import sys
+import threading
+from typing import cast, List, Optional
+from unittest import TestCase
+
+from cantte.evaluator import NULL, TRUE
+from cantte.object import Array, Error, FrozenEnvironment, Hash, Integer, Object, String
+from cantte.script import CompiledScript, ScriptError, to_object
+
+
+class CompiledScriptTest(TestCase):
+
+    def test_runs_with_bindings(self) -> None:
+        for engine in ['evaluator', 'closures', 'vm', 'trampoline']:
+            script = CompiledScript('let total = price * quantity; total + shipping;',
+                                    globals={'shipping': 5},
+                                    engine=engine)
+
+            self.assertEqual(cast(Integer, script.run({'price': 3, 'quantity': 4})).value, 17)
+            self.assertEqual(cast(Integer, script.run({'price': 10, 'quantity': 2})).value, 25)
+
+    def test_memo_under_every_engine(self) -> None:
+        for engine in ['evaluator', 'closures', 'vm', 'trampoline']:
+            script = CompiledScript('memo(func(n) { n * 2 })(x)', engine=engine)
+
+            self.assertEqual(cast(Integer, script.run({'x': 21})).value, 42, engine)
+
+    def test_concurrent_runs(self) -> None:
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        try:
+            for engine in ['evaluator', 'trampoline']:
+                script = CompiledScript('''
+                    let fibonacci = func(n) {
+                        let previous = n - 1;
+                        if (n < 2) {
+                            return n;
+                        }
+                        fibonacci(previous) + fibonacci(n - 2);
+                    };
+                    fibonacci(x);
+                ''', engine=engine)
+                results: List[Optional[Object]] = []
+                failures: List[BaseException] = []
+
+                def run() -> None:
+                    try:
+                        for _ in range(5):
+                            results.append(script.run({'x': 12}))
+                    except BaseException as error:
+                        failures.append(error)
+
+                threads = [threading.Thread(target=run) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual(failures, [], engine)
+                self.assertEqual([cast(Object, result).inspect() for result in results], ['144'] * 40, engine)
+        finally:
+            sys.setswitchinterval(interval)
+
+    def test_optimized_scripts(self) -> None:
+        script = CompiledScript('let f = func(x) { x * (2 + 3) }; f(n)', optimized=True)
+
+        self.assertEqual([cast(Integer, script.run({'n': n})).value for n in range(4)], [0, 5, 10, 15])
+
+    def test_runs_are_isolated(self) -> None:
+        script = CompiledScript('let seen = has(state, "seen"); let state = {"seen": true}; seen')
+
+        self.assertEqual(cast(Object, script.run({'state': {}})).inspect(), 'false')
+        self.assertEqual(cast(Object, script.run({'state': {}})).inspect(), 'false')
+
+    def test_shared_globals_are_immutable(self) -> None:
+        script = CompiledScript('limit = limit + 1; limit', globals={'limit': 10})
+
+        self.assertEqual(cast(Error, script.run()).message, 'Unknown identifier: limit')
+        self.assertEqual(cast(Integer, script.globals['limit']).value, 10)
+        self.assertIsInstance(script.globals, FrozenEnvironment)
+
+        with self.assertRaises(TypeError):
+            script.globals['limit'] = Integer(0)
+
+        script = CompiledScript('let limit = limit + 1; limit', globals={'limit': 10})
+
+        self.assertEqual(cast(Integer, script.run()).value, 11)
+        self.assertEqual(cast(Integer, script.run()).value, 11)
+
+    def test_parse_errors(self) -> None:
+        with self.assertRaises(ScriptError) as context:
+            CompiledScript('let = 5;')
+
+        self.assertGreater(len(context.exception.errors), 0)
+
+        with self.assertRaises(ValueError):
+            CompiledScript('1', engine='jit')
+
+    def test_to_object(self) -> None:
+        self.assertIs(to_object(None), NULL)
+        self.assertIs(to_object(True), TRUE)
+        self.assertEqual(cast(Integer, to_object(3)).value, 3)
+        self.assertEqual(cast(String, to_object('a')).value, 'a')
+        self.assertEqual(cast(Array, to_object([1, 'b', (2,)])).inspect(), '[1, b, [2]]')
+        self.assertEqual(cast(Hash, to_object({'a': [1]})).inspect(), '{"a": [1]}')
+
+        with self.assertRaises(TypeError):
+            to_object(1.5)
@@ -0,0 +1,136 @@
+import asyncio
+from typing import cast, List
+from unittest import IsolatedAsyncioTestCase
+
+import tests.evaluator_test as evaluator_test
+from cantte.ast import Program
+from cantte.evaluator import FALSE
+from cantte.lexer import Lexer
+from cantte.object import Builtin, BuiltinFunction, Environment, Error, Integer, Object, String
+from cantte.parser import Parser
+from cantte.trampoline import evaluate_async, evaluate_trampolined
+
+
+class TrampolineTest(evaluator_test.EvaluatorTest):
+
+    def test_deep_recursion(self) -> None:
+        source: str = '''
+            let count = func(n) {
+                if (n == 0) {
+                    return 0;
+                }
+                return 1 + count(n - 1);
+            };
+            count(100000);
+        '''
+
+        evaluated = self._evaluate_tests(source)
+
+        self._test_integer_object(evaluated, 100000)
+
+    def test_tail_recursion(self) -> None:
+        source: str = '''
+            let count = func(n, acc) {
+                if (n == 0) {
+                    return acc;
+                }
+                return count(n - 1, acc + 1);
+            };
+            count(1000000, 0);
+        '''
+
+        evaluated = self._evaluate_tests(source)
+
+        self._test_integer_object(evaluated, 1000000)
+
+    def test_mutual_tail_recursion(self) -> None:
+        source: str = '''
+            let is_even = func(n) { if (n == 0) { true } else { is_odd(n - 1) } };
+            let is_odd = func(n) { if (n == 0) { false } else { is_even(n - 1) } };
+            is_even(10001);
+        '''
+
+        self.assertIs(self._evaluate_tests(source), FALSE)
+
+    @staticmethod
+    def _evaluate_tests(source: str) -> Object:
+        program: Program = Parser(Lexer(source)).parse_program()
+        env: Environment = Environment()
+
+        evaluated = evaluate_trampolined(program, env)
+
+        assert evaluated is not None
+
+        return evaluated
+
+
+class AsyncTrampolineTest(evaluator_test.EvaluatorTest):
+
+    @staticmethod
+    def _evaluate_tests(source: str) -> Object:
+        program: Program = Parser(Lexer(source)).parse_program()
+        env: Environment = Environment()
+
+        evaluated = asyncio.run(evaluate_async(program, env, yield_every=7))
+
+        assert evaluated is not None
+
+        return evaluated
+
+
+class EvaluateAsyncTest(IsolatedAsyncioTestCase):
+
+    async def test_async_builtins(self) -> None:
+        async def fetch(key: Object) -> Object:
+            await asyncio.sleep(0.01)
+
+            return String(f'value of {cast(String, key).value}')
+
+        env = Environment()
+        env['fetch'] = Builtin(cast(BuiltinFunction, fetch))
+
+        evaluated = await evaluate_async(Parser(Lexer('''
+            let describe = func(key) { fetch(key) + "!" };
+            [describe("a"), fetch("b"), size(fetch("cc"))];
+        ''')).parse_program(), env)
+
+        self.assertEqual(cast(Object, evaluated).inspect(), '[value of a!, value of b, 11]')
+
+    async def test_async_builtins_in_tail_position(self) -> None:
+        async def double(value: Object) -> Object:
+            await asyncio.sleep(0)
+
+            return Integer(cast(Integer, value).value * 2)
+
+        env = Environment()
+        env['double'] = Builtin(cast(BuiltinFunction, double))
+
+        evaluated = await evaluate_async(Parser(Lexer('''
+            let twice = func(n) { return double(double(n)); };
+            twice(5);
+        ''')).parse_program(), env)
+
+        self.assertEqual(cast(Integer, evaluated).value, 20)
+
+    async def test_yields_to_the_event_loop(self) -> None:
+        ticks: List[int] = []
+
+        async def ticker() -> None:
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        program = Parser(Lexer('let i = 0; while (i < 2000) { i = i + 1; } i')).parse_program()
+
+        evaluated = await evaluate_async(program, Environment(), yield_every=100)
+        task.cancel()
+
+        self.assertEqual(cast(Integer, evaluated).value, 2000)
+        self.assertGreater(len(ticks), 50)
+
+    async def test_errors(self) -> None:
+        evaluated = await evaluate_async(Parser(Lexer('let f = func() { 1 + true }; f();')).parse_program(),
+                                         Environment())
+
+        self.assertEqual(cast(Error, evaluated).message, 'Type mismatch: INTEGER + BOOLEAN')
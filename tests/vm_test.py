@@ -0,0 +1,88 @@
+from typing import cast
+
+import tests.evaluator_test as evaluator_test
+from cantte.ast import Program
+from cantte.compiler import Compiler
+from cantte.evaluator import evaluate
+from cantte.lexer import Lexer
+from cantte.object import Environment, Error, Object
+from cantte.parser import Parser
+from cantte.vm import Closure, VirtualMachine
+
+
+class VirtualMachineTest(evaluator_test.EvaluatorTest):
+
+    def test_deep_recursion(self) -> None:
+        source: str = '''
+            let count = func(n) {
+                if (n == 0) {
+                    return 0;
+                }
+                return 1 + count(n - 1);
+            };
+            count(20000);
+        '''
+
+        evaluated = self._evaluate_tests(source)
+
+        self._test_integer_object(evaluated, 20000)
+
+    def test_error_stops_block(self) -> None:
+        source: str = '''
+            let f = func() {
+                5 + true;
+                10;
+            };
+            let result = f();
+            result;
+        '''
+
+        evaluated = self._evaluate_tests(source)
+
+        self._test_error_object(evaluated, 'Type mismatch: INTEGER + BOOLEAN')
+
+    def test_evaluator_interop(self) -> None:
+        env: Environment = Environment()
+
+        self._run('let add = func(x, y) { x + y };', env)
+        evaluate(Parser(Lexer('let double = func(x) { add(x, x) };')).parse_program(), env)
+
+        self.assertIsInstance(env['add'], Closure)
+
+        evaluated = self._run('double(add(1, 2))', env)
+        self._test_integer_object(cast(Object, evaluated), 6)
+
+    def test_error_locations_of_every_error_site(self) -> None:
+        tests = [
+            ('let a = 1;\nfirst(a);', 'first'),
+            ('let a = 1;\nfor (x in a) { x; }', 'for'),
+            ('let f = func(x) { x };\nlet g = func() { f(1, 2) };\ng();', 'f(1'),
+            ('let i = 0;\nwhile (i < 2) {\n  i = i + 1;\n  j = i;\n}', 'j ='),
+            ('let h = {};\nh[[1]];', 'h['),
+        ]
+
+        for source, statement in tests:
+            evaluated = self._evaluate_tests(source)
+
+            self.assertIsInstance(evaluated, Error, source)
+            self.assertEqual(cast(Error, evaluated).offset, source.index(statement), source)
+
+    @staticmethod
+    def _run(source: str, env: Environment) -> Object:
+        program: Program = Parser(Lexer(source)).parse_program()
+        bytecode = Compiler().compile_program(program)
+
+        return cast(Object, VirtualMachine(bytecode).run(env))
+
+    @staticmethod
+    def _evaluate_tests(source: str) -> Object:
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+        program: Program = parser.parse_program()
+        env: Environment = Environment()
+
+        evaluated = VirtualMachine(Compiler().compile_program(program)).run(env)
+
+        assert evaluated is not None
+
+        return evaluated